@@ -0,0 +1,9 @@
+"""Per-frame benchmarks for the games, run headless.
+
+    python -m benchmarks                     # compare against baseline.json
+    python -m benchmarks --update-baseline   # store new numbers
+"""
+import os
+
+# The scenarios build real game objects; keep Tk out of it.
+os.environ.setdefault("GAME_BACKEND", "headless")
@@ -0,0 +1,48 @@
+import argparse
+import json
+import pathlib
+import sys
+from benchmarks.harness import DEFAULT_TOLERANCE, compare, format_table, measure
+from benchmarks.scenarios import SCENARIOS
+
+BASELINE = pathlib.Path(__file__).parent / "baseline.json"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("scenarios", nargs="*",
+                        help="scenarios to run, out of %s (default: all)" % ", ".join(sorted(SCENARIOS)))
+    parser.add_argument("--frames", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="how many times slower than the baseline is allowed")
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    names = args.scenarios or sorted(SCENARIOS)
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        parser.error("unknown scenarios: " + ", ".join(sorted(unknown)))
+    results = {name: measure(SCENARIOS[name](args.seed), args.frames) for name in names}
+    print(format_table(results))
+
+    if args.update_baseline:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        for name, result in results.items():
+            baseline[name] = {metric: round(value, 2) for metric, value in result.items()}
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print("no baseline yet; run with --update-baseline")
+        return 0
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+    for regression in regressions:
+        print("REGRESSION", regression)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
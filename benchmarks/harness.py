@@ -0,0 +1,119 @@
+"""Time a frame function and compare the numbers against a baseline."""
+import gc
+import time
+import tracemalloc
+from engine.stats import mean, percentile
+
+TIMED_METRICS = ("mean_us", "p50_us")
+DEFAULT_TOLERANCE = 1.5
+# Frames are short and noisy; differences under this many us don't count.
+SLACK_US = 5.0
+# Allowed growth in live objects per frame before it counts as a leak.
+OBJECT_SLACK = 0.05
+
+
+def measure(frame, frames, warmup=100):
+    '''Run frame() repeatedly and summarise its cost.
+
+    Timing, allocation and object counts are taken in separate passes,
+    since tracemalloc slows everything it traces. Allocation is the most
+    memory each frame had allocated at once, freed or not by the end of
+    the frame, so short-lived garbage counts as much as what is kept.
+    '''
+    for i in range(warmup):
+        frame()
+
+    calibrated_before = calibrate()
+    times = []
+    clock = time.perf_counter
+    for i in range(frames):
+        start = clock()
+        frame()
+        times.append(clock() - start)
+    calibration = (calibrated_before + calibrate()) / 2
+
+    gc.collect()
+    objects_before = len(gc.get_objects())
+    allocated = []
+    tracemalloc.start()
+    for i in range(frames):
+        # Also resets the traced and peak memory to 0.
+        tracemalloc.clear_traces()
+        frame()
+        allocated.append(tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+    gc.collect()
+    objects_after = len(gc.get_objects())
+
+    return {
+        "frames": frames,
+        "mean_us": mean(times) * 1e6,
+        "p50_us": percentile(times, 50) * 1e6,
+        "p99_us": percentile(times, 99) * 1e6,
+        "alloc_bytes_per_frame": mean(allocated),
+        "peak_alloc_bytes": max(allocated),
+        "objects_per_frame": (objects_after - objects_before) / frames,
+        "calibration_us": calibration,
+    }
+
+
+def calibrate(rounds=50):
+    '''Microseconds a fixed pure-Python workload takes on this machine.
+
+    measure() runs it around the timing pass, so timings taken on a
+    faster or slower (or busier) machine than the baseline's can be
+    compared after scaling by the ratio.
+    '''
+    times = []
+    clock = time.perf_counter
+    for i in range(rounds):
+        start = clock()
+        cells = {}
+        for n in range(2000):
+            cells[n % 97] = cells.get(n % 97, 0) + n * 0.5
+        sorted(cells.values())
+        times.append(clock() - start)
+    # The fastest round is the one least disturbed by the rest of the machine.
+    return min(times) * 1e6
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    '''Describe every way results got worse than baseline.
+
+    Times may grow by the tolerance factor, plus SLACK_US, before they
+    count as a regression. When both were calibrated, baseline times are
+    first scaled by how much slower the calibration ran this time. Objects
+    kept alive per frame may not grow at all, beyond a little slack for
+    noise, since that is a leak.
+    '''
+    regressions = []
+    for name, result in sorted(results.items()):
+        old = baseline.get(name)
+        if old is None:
+            continue
+        scale = 1.0
+        if "calibration_us" in result and "calibration_us" in old:
+            scale = result["calibration_us"] / old["calibration_us"]
+        for metric in TIMED_METRICS:
+            allowed = old[metric] * scale * tolerance + SLACK_US
+            if result[metric] > allowed:
+                regressions.append(
+                    f"{name}: {metric} {result[metric]:.1f} > "
+                    f"{allowed:.1f} allowed (baseline {old[metric]:.1f})")
+        if result["objects_per_frame"] > old["objects_per_frame"] + OBJECT_SLACK:
+            regressions.append(
+                f"{name}: objects_per_frame {result['objects_per_frame']:.2f} > "
+                f"baseline {old['objects_per_frame']:.2f}")
+    return regressions
+
+
+def format_table(results):
+    header = (f"{'scenario':<20}{'mean us':>10}{'p50 us':>10}{'p99 us':>10}"
+              f"{'alloc B/frame':>15}{'objs/f':>9}")
+    lines = [header, "-" * len(header)]
+    for name, result in sorted(results.items()):
+        lines.append(
+            f"{name:<20}{result['mean_us']:>10.1f}{result['p50_us']:>10.1f}"
+            f"{result['p99_us']:>10.1f}{result['alloc_bytes_per_frame']:>15.1f}"
+            f"{result['objects_per_frame']:>9.2f}")
+    return "\n".join(lines)
@@ -0,0 +1,118 @@
+"""How long the game modules take to import, from python -X importtime.
+
+    python -m benchmarks.importtime                     # compare against importtime.json
+    python -m benchmarks.importtime --update-baseline   # store new numbers
+
+Each module is imported in a fresh interpreter with the Tk backend
+selected, as a game would be. None of them may load turtle or tkinter
+(a game only needs Tk once it makes a window or a Turtle), and none may
+take much longer to import than its baseline.
+"""
+import argparse
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+BASELINE = pathlib.Path(__file__).parent / "importtime.json"
+MODULES = (
+    "engine.entity",
+    "engine.loop",
+    "engine.render",
+    "engine.text",
+    "pong.ball",
+    "pong.net.server",
+    "pong.physics",
+    "snake_game_template.rules",
+    "snake_game_template.snake",
+    "turtle_crossing.game_objects.car_manager",
+    "turtle_crossing.game_objects.rules",
+)
+TK_MODULES = ("turtle", "tkinter")
+DEFAULT_TOLERANCE = 1.5
+# Imports are short and noisy; differences under this many ms don't count.
+SLACK_MS = 5.0
+
+
+def parse_importtime(stderr):
+    '''{module: cumulative microseconds} from -X importtime output.'''
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+def import_times(module):
+    '''Import module in a fresh interpreter and return what parse_importtime sees.'''
+    env = dict(os.environ, GAME_BACKEND="tk")
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(ROOT), env=env, stderr=subprocess.PIPE, check=True,
+        universal_newlines=True)
+    return parse_importtime(process.stderr)
+
+
+def measure(module, repeat=5):
+    '''Best import time of module in ms, and whether it loaded Tk.'''
+    best = None
+    loads_tk = False
+    for run in range(repeat):
+        times = import_times(module)
+        ms = times[module] / 1000
+        best = ms if best is None else min(best, ms)
+        loads_tk = loads_tk or any(name in times for name in TK_MODULES)
+    return {"ms": best, "loads_tk": loads_tk}
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    problems = []
+    for module, result in sorted(results.items()):
+        if result["loads_tk"]:
+            problems.append(f"{module} imports Tk")
+        old = baseline.get(module)
+        if old is not None and result["ms"] > old * tolerance + SLACK_MS:
+            problems.append(f"{module}: {result['ms']:.1f} ms > {tolerance} x baseline {old:.1f} ms")
+    return problems
+
+
+def format_table(results):
+    header = f"{'module':<42}{'ms':>8}  loads Tk"
+    lines = [header, "-" * len(header)]
+    for module, result in results.items():
+        lines.append(f"{module:<42}{result['ms']:>8.1f}  {'yes' if result['loads_tk'] else 'no'}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.importtime")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = {module: measure(module, args.repeat) for module in MODULES}
+    print(format_table(results))
+
+    if args.update_baseline:
+        baseline = {module: round(result["ms"], 1) for module, result in results.items()}
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    problems = compare(results, baseline, args.tolerance)
+    for problem in problems:
+        print("REGRESSION", problem)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
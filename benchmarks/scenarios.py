@@ -0,0 +1,195 @@
+"""Scripted, seeded game sessions for the benchmarks.
+
+Each scenario builds its game objects and returns a function that plays
+one frame with the same rules as the game's main.py. Input comes from a
+simple bot driven by a seeded random.Random, so every run plays exactly
+the same game.
+"""
+import random
+import tempfile
+import pathlib
+
+
+def crossing(seed, views=False):
+    from turtle_crossing.game_objects.car_manager import CarManager
+    from turtle_crossing.game_objects.player import Player
+    from turtle_crossing.game_objects.scoreboard import Scoreboard
+    rng = random.Random(seed)
+    player = Player()
+    if views:
+        player.attach_view()
+    car_manager = CarManager(rng=random.Random(seed))
+    score_board = Scoreboard()
+
+    def frame():
+        if rng.random() < 0.4:
+            player.go_up()
+        car_manager.create_car()
+        car_manager.move_cars()
+        if car_manager.collides_with(player):
+            player.goto_start()
+        if player.is_at_finishline():
+            player.goto_start()
+            car_manager.level_up()
+            score_board.increase_level()
+        car_manager.draw()
+
+    return frame
+
+
+def rendered_crossing(seed):
+    '''The crossing scenario, drawn through engine.render every frame.'''
+    import engine.entity as entity
+    import engine.render as render
+    import engine.text as text
+    from engine.backend import Screen
+    screen = Screen()
+    play = crossing(seed, views=True)
+
+    def frame():
+        play()
+        entity.flush()
+        text.flush()
+        render.flush(screen)
+
+    return frame
+
+
+def snake(seed):
+    from engine.persistence import HighScoreStore
+    from snake_game_template.food import Food
+    from snake_game_template.scoreboard import Scoreboard
+    from snake_game_template.snake import Snake
+    rng = random.Random(seed)
+    snake = Snake()
+    food = Food(snake.free_cells, random.Random(seed))
+    scores_path = pathlib.Path(tempfile.mkdtemp()) / "data.txt"
+    scoreboard = Scoreboard(store=HighScoreStore(scores_path))
+
+    def steer():
+        '''Head for the food, with the odd random turn.'''
+        col, row = snake.head_cell
+        if rng.random() < 0.1:
+            rng.choice([snake.up, snake.down, snake.left, snake.right])()
+        elif food.cell[0] > col:
+            snake.right()
+        elif food.cell[0] < col:
+            snake.left()
+        elif food.cell[1] > row:
+            snake.up()
+        else:
+            snake.down()
+
+    def frame():
+        steer()
+        snake.move()
+        if snake.head_cell == food.cell:
+            food.refresh()
+            snake.extend()
+            scoreboard.increase_score()
+        if snake.hits_wall() or snake.hits_self():
+            scoreboard.reset()
+            snake.reset()
+            food.refresh()
+
+    return frame
+
+
+def snake_vec(seed):
+    '''1024 snake games per frame in a SnakeVecEnv, steered at random.'''
+    import numpy as np
+    from snake_game_template.vec_env import SnakeVecEnv
+    env = SnakeVecEnv(1024, seed=seed)
+    rng = np.random.default_rng(seed)
+    actions = [rng.integers(-1, 4, env.n) for i in range(64)]
+
+    def frame():
+        env.step(actions[env.steps // env.n % len(actions)])
+
+    return frame
+
+
+def pong(seed):
+    from pong.ball import Ball
+    from pong.padel import Padel
+    from pong.scoreboard import Scoreboard
+    rng = random.Random(seed)
+    padel_r = Padel((350, 0))
+    padel_l = Padel((-350, 0))
+    ball = Ball()
+    scoreboard = Scoreboard()
+
+    def track(padel):
+        if rng.random() < 0.2:
+            return
+        if ball.ycor() > padel.ycor() + 10:
+            padel.go_up()
+        elif ball.ycor() < padel.ycor() - 10:
+            padel.go_dn()
+
+    def frame():
+        track(padel_r)
+        track(padel_l)
+        ball.move((padel_l, padel_r))
+        if ball.xcor() > 400:
+            ball.reset()
+            scoreboard.point_l()
+        if ball.xcor() < -400:
+            ball.reset()
+            scoreboard.point_r()
+
+    return frame
+
+
+def pong_cpu(seed):
+    '''CPU against CPU, the way AI rallies are run for tuning.'''
+    from pong.ball import Ball
+    from pong.cpu import CpuPlayer
+    from pong.padel import Padel
+    padel_r = Padel((350, 0))
+    padel_l = Padel((-350, 0))
+    ball = Ball()
+    players = (CpuPlayer(padel_l), CpuPlayer(padel_r))
+
+    def frame():
+        for player in players:
+            player.play(ball)
+        ball.move((padel_l, padel_r))
+        if abs(ball.xcor()) > 400:
+            ball.reset()
+
+    return frame
+
+
+def scoreboards(seed):
+    '''Worst case for text: every scoreboard redraws every frame.'''
+    import engine.text as text
+    from engine.persistence import HighScoreStore
+    from pong.scoreboard import Scoreboard as PongScoreboard
+    from snake_game_template.scoreboard import Scoreboard as SnakeScoreboard
+    from turtle_crossing.game_objects.scoreboard import Scoreboard as CrossingScoreboard
+    scores_path = pathlib.Path(tempfile.mkdtemp()) / "data.txt"
+    pong_board = PongScoreboard()
+    snake_board = SnakeScoreboard(store=HighScoreStore(scores_path))
+    crossing_board = CrossingScoreboard()
+    for board in (pong_board, snake_board, crossing_board):
+        board.attach_view()
+
+    def frame():
+        pong_board.point_l()
+        snake_board.increase_score()
+        crossing_board.increase_level()
+        text.flush()
+
+    return frame
+
+
+SCENARIOS = {
+    "crossing": crossing,
+    "rendered_crossing": rendered_crossing,
+    "snake": snake,
+    "snake_vec": snake_vec,
+    "pong": pong,
+    "pong_cpu": pong_cpu,
+    "scoreboards": scoreboards,
+}
@@ -0,0 +1,87 @@
+"""
+TESTS FOR benchmarks/harness.py
+
+The benchmark numbers themselves depend on the machine, so these tests
+only check that the harness measures and compares correctly, and that
+every scenario can play a few frames.
+"""
+
+import pytest
+from benchmarks.harness import SLACK_US, calibrate, compare, format_table, measure
+from benchmarks.scenarios import SCENARIOS
+
+
+def result(mean_us=10.0, p50_us=10.0, objects_per_frame=0.0):
+    return {"mean_us": mean_us, "p50_us": p50_us, "p99_us": 20.0,
+            "alloc_bytes_per_frame": 0.0, "objects_per_frame": objects_per_frame}
+
+
+def test_measure_counts_kept_objects():
+    kept = []
+
+    stats = measure(lambda: kept.append([]), frames=200, warmup=0)
+
+    assert stats["frames"] == 200
+    assert stats["objects_per_frame"] == pytest.approx(1.0, abs=0.1)
+    assert stats["alloc_bytes_per_frame"] > 0
+    assert stats["p50_us"] <= stats["p99_us"]
+
+
+def test_measure_counts_garbage_allocated_in_a_frame():
+    stats = measure(lambda: bytes(100000), frames=100, warmup=0)
+
+    assert stats["alloc_bytes_per_frame"] == pytest.approx(100000, rel=0.01)
+    assert stats["peak_alloc_bytes"] >= 100000
+
+
+def test_calibrate():
+    assert calibrate(rounds=3) > 0
+
+
+def test_compare_passes_within_tolerance():
+    baseline = {"pong": result(mean_us=10.0)}
+
+    assert compare({"pong": result(mean_us=14.0)}, baseline, tolerance=1.5) == []
+
+
+def test_compare_flags_slower_frames():
+    baseline = {"pong": result(mean_us=10.0, p50_us=10.0)}
+
+    regressions = compare({"pong": result(mean_us=15.0 + SLACK_US + 1, p50_us=10.0)}, baseline, 1.5)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("pong: mean_us")
+
+
+def test_compare_ignores_differences_under_the_slack():
+    baseline = {"pong": result(mean_us=2.0, p50_us=2.0)}
+
+    assert compare({"pong": result(mean_us=6.0, p50_us=6.0)}, baseline, 1.5) == []
+
+
+def test_compare_scales_by_calibration():
+    baseline = {"pong": dict(result(mean_us=100.0, p50_us=100.0), calibration_us=500.0)}
+    slower = result(mean_us=250.0, p50_us=250.0)
+
+    assert compare({"pong": slower}, baseline, 1.5) != []
+    assert compare({"pong": dict(slower, calibration_us=1000.0)}, baseline, 1.5) == []
+
+
+def test_compare_flags_leaks():
+    baseline = {"snake": result(objects_per_frame=0.0)}
+
+    regressions = compare({"snake": result(objects_per_frame=1.0)}, baseline)
+
+    assert regressions == ["snake: objects_per_frame 1.00 > baseline 0.00"]
+
+
+def test_compare_ignores_new_scenarios():
+    assert compare({"new": result()}, {}) == []
+
+
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+def test_scenarios_run(name):
+    stats = measure(SCENARIOS[name](seed=0), frames=50, warmup=10)
+
+    assert stats["mean_us"] > 0
+    assert name in format_table({name: stats})
@@ -0,0 +1,40 @@
+"""
+TESTS FOR benchmarks/importtime.py
+
+Import times depend on the machine, but whether a module loads Tk does
+not, so the logic modules are checked for that here on every run.
+"""
+
+import pytest
+from benchmarks.importtime import MODULES, compare, import_times, parse_importtime
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _tkinter
+import time:      2000 |       2120 | tkinter
+import time:       865 |       5909 | pong.physics
+"""
+
+
+def test_parse_importtime():
+    assert parse_importtime(SAMPLE) == {"_tkinter": 120, "tkinter": 2120, "pong.physics": 5909}
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_modules_never_load_tk(module):
+    times = import_times(module)
+
+    assert module in times
+    assert "turtle" not in times
+    assert "tkinter" not in times
+
+
+def test_compare_flags_tk_and_slow_imports():
+    results = {"pong.physics": {"ms": 30.0, "loads_tk": True},
+               "pong.ball": {"ms": 40.0, "loads_tk": True}}
+
+    problems = compare(results, {"pong.physics": 10.0, "pong.ball": 40.0}, tolerance=1.5)
+
+    assert problems == ["pong.ball imports Tk",
+                        "pong.physics imports Tk",
+                        "pong.physics: 30.0 ms > 1.5 x baseline 10.0 ms"]
@@ -0,0 +1,4 @@
+import os
+
+# Build game objects on engine.headless so tests never need a display.
+os.environ.setdefault("GAME_BACKEND", "headless")
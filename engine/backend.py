@@ -0,0 +1,60 @@
+"""Pick the Turtle and Screen implementation the games are built on.
+
+The Tk turtle module is used by default. Pass --headless (or --replay,
+see engine.replay) on the command line or set GAME_BACKEND=headless to
+use engine.headless instead, which needs no display.
+
+`clock` is the time source for engine.loop: time.perf_counter with Tk,
+and the headless screen's own timer clock otherwise, so headless games
+run as fast as the CPU allows.
+
+With Tk, Screen and Turtle are only looked up in the turtle module the
+first time they're imported from here, so modules that just need `clock`
+never load Tk.
+
+`set_text(turtle, item, text)` changes the text of something turtle has
+already written, in place, and returns the item's new handle.
+
+`draw_sprites(screen, sprites)` redraws just those turtles and shows the
+frame, like screen.update() does for every turtle (see engine.render).
+"""
+import os
+import sys
+
+BACKENDS = ("tk", "headless")
+
+if "--headless" in sys.argv or "--replay" in sys.argv:
+    BACKEND = "headless"
+else:
+    BACKEND = os.environ.get("GAME_BACKEND", "tk")
+
+if BACKEND == "headless":
+    from engine.headless import Screen, Turtle, clock, draw_sprites, set_text
+elif BACKEND == "tk":
+    from time import perf_counter as clock
+
+    def set_text(turtle, item, text):
+        turtle.getscreen().cv.itemconfigure(item, text=text)
+        return item
+
+    def draw_sprites(screen, sprites):
+        # TurtleScreen.update() for only these turtles: turtles draw nothing
+        # while tracing is off, so it's switched on around the redraw.
+        tracing = screen._tracing
+        screen._tracing = True
+        try:
+            for sprite in sprites:
+                sprite._drawturtle()
+        finally:
+            screen._tracing = tracing
+        screen._update()
+
+    def __getattr__(name):
+        # turtle pulls in tkinter, so only import it once a game object or
+        # window actually needs Screen or Turtle.
+        if name in ("Screen", "Turtle"):
+            import turtle
+            return getattr(turtle, name)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+else:
+    raise ValueError(f"GAME_BACKEND must be one of {BACKENDS}, not {BACKEND!r}")
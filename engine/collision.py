@@ -0,0 +1,47 @@
+"""Swept (continuous) collision tests.
+
+Instead of asking "do these overlap now?" after a move, these ask "when
+during this move do they first touch?", so fast objects can't skip
+through thin ones between two frames.
+"""
+import collections
+
+Hit = collections.namedtuple("Hit", "time axis")
+
+
+def sweep_point_rect(x, y, dx, dy, left, bottom, right, top):
+    '''First moment the point (x, y) moving by (dx, dy) enters a rectangle.
+
+    Returns Hit(time, axis) with time as a fraction of the move in [0, 1]
+    and axis "x" if it came in through the left or right side, "y" for
+    the top or bottom. Returns None if the point misses, or if it starts
+    inside the rectangle. To sweep a circle, grow the rectangle by its
+    radius first.
+    '''
+    enter = -float("inf")
+    leave = float("inf")
+    axis = None
+    for start, delta, low, high, name in ((x, dx, left, right, "x"),
+                                          (y, dy, bottom, top, "y")):
+        if delta == 0:
+            if not low <= start <= high:
+                return None
+            continue
+        t_low = (low - start) / delta
+        t_high = (high - start) / delta
+        t_in, t_out = min(t_low, t_high), max(t_low, t_high)
+        if t_in > enter:
+            enter, axis = t_in, name
+        leave = min(leave, t_out)
+    if axis is None or enter > leave or enter < 0 or enter > 1:
+        return None
+    return Hit(enter, axis)
+
+
+def sweep_wall(position, delta, low, high):
+    '''Moment a coordinate moving by delta crosses low or high, or None.'''
+    if delta > 0 and position + delta > high:
+        return max(0.0, (high - position) / delta)
+    if delta < 0 and position + delta < low:
+        return max(0.0, (low - position) / delta)
+    return None
@@ -0,0 +1,192 @@
+"""Game objects as plain state, with Turtle sprites as optional views.
+
+A Turtle carries a pen, an undo buffer and its canvas items, and every
+position read goes through a couple of method calls. An Entity keeps just
+what the rules need in __slots__ (x, y, heading, visibility and its look)
+and answers the Turtle calls the games make (xcor(), goto(), sety(),
+color(), ...) from those, so game code reads the same as before, while
+rules code can read entity.x and entity.y directly.
+
+attach_view() gives an entity a Turtle to be drawn with. Moves are queued
+and copied onto the views by flush(), once per frame before
+engine.render draws them. Entities without a view (in tests, tournaments
+and benchmarks) never make a Turtle at all.
+"""
+import math
+import engine.backend as backend
+from engine.render import track
+
+pending = []
+
+
+class Entity:
+    '''Position, heading and look of one game object.
+
+    Subclasses list their own fields in __slots__ too, so game objects
+    don't carry a __dict__ (engine.profiler copes without one).
+    '''
+
+    __slots__ = ("x", "y", "angle", "shown", "shape_name", "pen", "fill",
+                 "stretch", "view", "queued")
+
+    def __init__(self):
+        self.x = 0.0
+        self.y = 0.0
+        self.angle = 0.0
+        self.shown = True
+        self.shape_name = "classic"
+        self.pen = "black"
+        self.fill = "black"
+        self.stretch = (1, 1, 1)
+        self.view = None
+        self.queued = False
+
+    # Motion
+
+    def position(self):
+        return (self.x, self.y)
+
+    pos = position
+
+    def xcor(self):
+        return self.x
+
+    def ycor(self):
+        return self.y
+
+    def heading(self):
+        return self.angle
+
+    def goto(self, x, y=None):
+        if y is None:
+            x, y = x
+        self.x = x
+        self.y = y
+        self.moved()
+
+    setpos = setposition = goto
+
+    def setx(self, x):
+        self.x = x
+        self.moved()
+
+    def sety(self, y):
+        self.y = y
+        self.moved()
+
+    def setheading(self, to_angle):
+        self.angle = float(to_angle) % 360
+        self.moved()
+
+    seth = setheading
+
+    def forward(self, distance):
+        radians = math.radians(self.angle)
+        self.goto(self.x + distance * math.cos(radians), self.y + distance * math.sin(radians))
+
+    fd = forward
+
+    def distance(self, x, y=None):
+        if y is None:
+            x, y = x.position() if hasattr(x, "position") else x
+        return math.hypot(x - self.x, y - self.y)
+
+    # Look
+
+    def shape(self, name=None):
+        if name is None:
+            return self.shape_name
+        self.shape_name = name
+        if self.view is not None:
+            self.view.shape(name)
+
+    def color(self, *args):
+        if not args:
+            return self.pen, self.fill
+        self.pen, self.fill = (args[0], args[0]) if len(args) == 1 else args[:2]
+        if self.view is not None:
+            self.view.color(self.pen, self.fill)
+
+    def shapesize(self, stretch_wid=None, stretch_len=None, outline=None):
+        if stretch_wid is None and stretch_len is None and outline is None:
+            return self.stretch
+        wid, length, line = self.stretch
+        self.stretch = (
+            wid if stretch_wid is None else stretch_wid,
+            length if stretch_len is None else stretch_len,
+            line if outline is None else outline,
+        )
+        if self.view is not None:
+            self.view.shapesize(*self.stretch)
+
+    turtlesize = shapesize
+
+    def showturtle(self):
+        self.shown = True
+        self.moved()
+
+    st = showturtle
+
+    def hideturtle(self):
+        self.shown = False
+        self.moved()
+
+    ht = hideturtle
+
+    def isvisible(self):
+        return self.shown
+
+    # An entity never draws lines or animates, so its pen is always up.
+
+    def penup(self):
+        pass
+
+    pu = up = penup
+
+    def speed(self, speed=None):
+        return 0
+
+    # View
+
+    def attach_view(self, view=None):
+        '''Draw this entity with view, a new Turtle by default, from now on.'''
+        if view is None:
+            view = backend.Turtle()
+        view.penup()
+        view.shape(self.shape_name)
+        view.color(self.pen, self.fill)
+        view.shapesize(*self.stretch)
+        self.view = track(view)
+        self.sync()
+        self.view_attached(view)
+        return view
+
+    def view_attached(self, view):
+        '''Called by attach_view(), for subclasses that draw more with
+        the view than the entity itself.'''
+
+    def moved(self):
+        if self.view is not None and not self.queued:
+            self.queued = True
+            pending.append(self)
+
+    def sync(self):
+        '''Copy the entity's position, heading and visibility onto its view.'''
+        self.queued = False
+        view = self.view
+        view.goto(self.x, self.y)
+        if view.heading() != self.angle:
+            view.setheading(self.angle)
+        if view.isvisible() != self.shown:
+            if self.shown:
+                view.showturtle()
+            else:
+                view.hideturtle()
+
+
+def flush():
+    '''Sync the view of every entity that changed since the last flush.'''
+    entities = pending[:]
+    del pending[:]
+    for entity in entities:
+        entity.sync()
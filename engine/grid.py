@@ -0,0 +1,56 @@
+"""Bookkeeping for games played on a square grid of cells."""
+
+
+def square_board(limit):
+    '''Every (col, row) cell with both coordinates in [-limit, limit].'''
+    return [(col, row) for col in range(-limit, limit + 1)
+            for row in range(-limit, limit + 1)]
+
+
+class FreeCells:
+    '''The cells of a board that nothing is standing on.
+
+    Cells are kept in a list with a dict from cell to list index, so
+    adding, removing and picking a random free cell are all O(1) however
+    full the board is. Removing swaps the last cell into the gap.
+    '''
+
+    def __init__(self, board):
+        self.board = frozenset(board)
+        # The order of a fresh board, copied by every reset().
+        self.all_cells = sorted(self.board)
+        self.all_index = {cell: i for i, cell in enumerate(self.all_cells)}
+        self.cells = []
+        self.index = {}
+        self.reset()
+
+    def reset(self):
+        '''Mark every cell of the board free again.'''
+        self.cells = self.all_cells[:]
+        self.index = self.all_index.copy()
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __contains__(self, cell):
+        return cell in self.index
+
+    def add(self, cell):
+        if cell in self.board and cell not in self.index:
+            self.index[cell] = len(self.cells)
+            self.cells.append(cell)
+
+    def discard(self, cell):
+        i = self.index.pop(cell, None)
+        if i is None:
+            return
+        last = self.cells.pop()
+        if last != cell:
+            self.cells[i] = last
+            self.index[last] = i
+
+    def sample(self, rng):
+        '''A random free cell, or None when the board is full.'''
+        if not self.cells:
+            return None
+        return self.cells[rng.randrange(len(self.cells))]
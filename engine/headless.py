@@ -0,0 +1,315 @@
+"""Pure-Python stand-ins for turtle.Turtle and turtle.Screen.
+
+HeadlessTurtle keeps the same position/heading/goto/distance API as
+turtle.Turtle but never touches Tk, so game objects built on it can run
+on machines without a display and at full CPU speed.
+"""
+import heapq
+import itertools
+import math
+
+# Exact unit vectors for the headings the games use, so that moving on a
+# grid never picks up floating point drift from cos/sin.
+UNIT_VECTORS = {0.0: (1.0, 0.0), 90.0: (0.0, 1.0), 180.0: (-1.0, 0.0), 270.0: (0.0, -1.0)}
+
+_screen = None
+
+
+class HeadlessScreen:
+    def __init__(self):
+        self._turtles = []
+        self.keys = {}
+        self.key_presses = {}
+        self.width = 400
+        self.height = 300
+        self.background = "white"
+        self.window_title = ""
+        self.tracing = 1
+        self.updates = 0
+        self.sprite_draws = 0
+        self.now_ms = 0
+        self.timers = []
+        self.timer_order = itertools.count()
+
+    def setup(self, width=400, height=300, startx=None, starty=None):
+        self.width = width
+        self.height = height
+
+    def bgcolor(self, *args):
+        if args:
+            self.background = args[0]
+        return self.background
+
+    def title(self, titlestring):
+        self.window_title = titlestring
+
+    def tracer(self, n=None, delay=None):
+        if n is None:
+            return self.tracing
+        self.tracing = n
+
+    def update(self):
+        self.updates += 1
+
+    def turtles(self):
+        return self._turtles
+
+    def window_width(self):
+        return self.width
+
+    def window_height(self):
+        return self.height
+
+    def listen(self, xdummy=None, ydummy=None):
+        pass
+
+    def onkey(self, fun, key):
+        self.keys[key] = fun
+
+    onkeyrelease = onkey
+
+    def onkeypress(self, fun, key=None):
+        self.key_presses[key] = fun
+
+    def press(self, key):
+        '''Simulate tapping a key: whatever was bound with onkeypress, then
+        whatever was bound with onkey.'''
+        self.key_down(key)
+        self.key_up(key)
+
+    def key_down(self, key):
+        fun = self.key_presses.get(key)
+        if fun is not None:
+            fun()
+
+    def key_up(self, key):
+        fun = self.keys.get(key)
+        if fun is not None:
+            fun()
+
+    def ontimer(self, fun, t=0):
+        heapq.heappush(self.timers, (self.now_ms + t, next(self.timer_order), fun))
+
+    def clock(self):
+        '''Game time in seconds. It only moves forward as timers fire.'''
+        return self.now_ms / 1000
+
+    def mainloop(self):
+        '''Fire timers in order without waiting for them.'''
+        while self.timers:
+            self.now_ms, order, fun = heapq.heappop(self.timers)
+            fun()
+
+    def exitonclick(self):
+        self.mainloop()
+
+    def clear(self):
+        '''Forget every turtle, key binding and timer, like TurtleScreen.clear().'''
+        self._turtles = []
+        self.keys = {}
+        self.key_presses = {}
+        self.timers = []
+        self.background = "white"
+
+    clearscreen = clear
+
+    def bye(self):
+        pass
+
+
+def Screen():
+    global _screen
+    if _screen is None:
+        _screen = HeadlessScreen()
+    return _screen
+
+
+def clock():
+    return Screen().clock()
+
+
+class HeadlessTurtle:
+    def __init__(self, shape="classic", undobuffersize=1000, visible=True):
+        self.screen = Screen()
+        self.screen._turtles.append(self)
+        self._x = 0.0
+        self._y = 0.0
+        self._heading = 0.0
+        self._shape = shape
+        self._visible = visible
+        self._drawing = True
+        self._pencolor = "black"
+        self._fillcolor = "black"
+        self._stretch = (1, 1, 1)
+        self._speed = 3
+        self.items = []
+
+    # Motion
+
+    def position(self):
+        return (self._x, self._y)
+
+    pos = position
+
+    def xcor(self):
+        return self._x
+
+    def ycor(self):
+        return self._y
+
+    def goto(self, x, y=None):
+        if y is None:
+            x, y = x
+        self._x = float(x)
+        self._y = float(y)
+
+    setpos = setposition = goto
+
+    def setx(self, x):
+        self._x = float(x)
+
+    def sety(self, y):
+        self._y = float(y)
+
+    def home(self):
+        self.goto(0, 0)
+        self.setheading(0)
+
+    def heading(self):
+        return self._heading
+
+    def setheading(self, to_angle):
+        self._heading = float(to_angle) % 360
+
+    seth = setheading
+
+    def left(self, angle):
+        self.setheading(self._heading + angle)
+
+    lt = left
+
+    def right(self, angle):
+        self.setheading(self._heading - angle)
+
+    rt = right
+
+    def forward(self, distance):
+        unit = UNIT_VECTORS.get(self._heading)
+        if unit is None:
+            radians = math.radians(self._heading)
+            unit = (math.cos(radians), math.sin(radians))
+        self._x += unit[0] * distance
+        self._y += unit[1] * distance
+
+    fd = forward
+
+    def backward(self, distance):
+        self.forward(-distance)
+
+    bk = back = backward
+
+    def distance(self, x, y=None):
+        if y is not None:
+            other = (x, y)
+        elif isinstance(x, HeadlessTurtle):
+            other = x.position()
+        else:
+            other = x
+        dx = other[0] - self._x
+        dy = other[1] - self._y
+        return (dx * dx + dy * dy) ** 0.5
+
+    def speed(self, speed=None):
+        if speed is None:
+            return self._speed
+        self._speed = speed
+
+    # Appearance
+
+    def shape(self, name=None):
+        if name is None:
+            return self._shape
+        self._shape = name
+
+    def shapesize(self, stretch_wid=None, stretch_len=None, outline=None):
+        if stretch_wid is None and stretch_len is None and outline is None:
+            return self._stretch
+        wid, length, line = self._stretch
+        self._stretch = (
+            wid if stretch_wid is None else stretch_wid,
+            length if stretch_len is None else stretch_len,
+            line if outline is None else outline,
+        )
+
+    turtlesize = shapesize
+
+    def color(self, *args):
+        if not args:
+            return self._pencolor, self._fillcolor
+        if len(args) == 1:
+            self._pencolor = self._fillcolor = args[0]
+        else:
+            self._pencolor, self._fillcolor = args[0], args[1]
+
+    def pencolor(self, *args):
+        if not args:
+            return self._pencolor
+        self._pencolor = args[0]
+
+    def fillcolor(self, *args):
+        if not args:
+            return self._fillcolor
+        self._fillcolor = args[0]
+
+    def hideturtle(self):
+        self._visible = False
+
+    ht = hideturtle
+
+    def showturtle(self):
+        self._visible = True
+
+    st = showturtle
+
+    def isvisible(self):
+        return self._visible
+
+    # Pen
+
+    def penup(self):
+        self._drawing = False
+
+    pu = up = penup
+
+    def pendown(self):
+        self._drawing = True
+
+    pd = down = pendown
+
+    def isdown(self):
+        return self._drawing
+
+    def write(self, arg, move=False, align="left", font=("Arial", 8, "normal")):
+        self.items.append((str(arg), self.position(), align, font))
+
+    def clear(self):
+        self.items = []
+
+    def getscreen(self):
+        return self.screen
+
+
+def set_text(turtle, item, text):
+    '''Replace the text of one of turtle's written items.'''
+    index = turtle.items.index(item)
+    turtle.items[index] = (str(text),) + item[1:]
+    return turtle.items[index]
+
+
+def draw_sprites(screen, sprites):
+    '''Count a frame that redraws just these turtles.'''
+    screen.sprite_draws += len(sprites)
+    screen.updates += 1
+
+
+Turtle = HeadlessTurtle
@@ -0,0 +1,103 @@
+"""Key presses held until the next game step.
+
+Bound straight to the screen, a key handler runs inside the Tk callback
+whenever the key comes in: two snake turns inside one step can each pass
+the "not back into the body" check and reverse the snake, and a held
+padel key moves the padel on every auto-repeat. An InputQueue binds the
+keys itself, stamps each press with the time, and applies them at the
+start of the next update:
+
+    turn(handler, key)   queued presses, at most one applied per step.
+                         A handler that returns False (a turn that
+                         changed nothing) doesn't use the step up.
+    hold(handler, key)   called once per step while the key is down, and
+                         once for a tap that came and went between steps.
+
+The time from a press to the step that applied it is kept as the input
+latency; report() summarizes it.
+"""
+import collections
+import time
+from engine.stats import mean, percentile
+
+# Further presses are dropped, so a mashed key can't queue up turns that
+# play out long after the player let go.
+MAX_QUEUED_TURNS = 3
+LATENCY_HISTORY = 600
+
+
+class InputQueue:
+    '''Keys bound through session (see engine.replay) on screen.'''
+
+    def __init__(self, session, screen, clock=time.perf_counter, max_turns=MAX_QUEUED_TURNS):
+        self.session = session
+        self.screen = screen
+        self.clock = clock
+        self.max_turns = max_turns
+        self.turns = collections.deque()
+        self.held = {}
+        self.down = {}
+        self.tapped = {}
+        self.presses = 0
+        self.dropped = 0
+        self.latencies = collections.deque(maxlen=LATENCY_HISTORY)
+
+    def turn(self, handler, key):
+        def pressed():
+            self.presses += 1
+            if len(self.turns) == self.max_turns:
+                self.dropped += 1
+                return
+            self.turns.append((self.clock(), handler))
+        self.session.onkeypress(self.screen, pressed, key)
+
+    def hold(self, handler, key):
+        def pressed():
+            self.presses += 1
+            # Auto-repeat sends more presses while the key stays down.
+            if key not in self.down:
+                self.down[key] = self.tapped[key] = self.clock()
+
+        def released():
+            self.down.pop(key, None)
+        self.held[key] = handler
+        self.session.onkeypress(self.screen, pressed, key)
+        self.session.onkey(self.screen, released, key)
+
+    def apply(self):
+        '''Run what came in since the last step.'''
+        now = self.clock()
+        while self.turns:
+            stamp, handler = self.turns.popleft()
+            if handler() is not False:
+                self.latencies.append(now - stamp)
+                break
+        for key, handler in self.held.items():
+            stamp = self.tapped.pop(key, None)
+            if stamp is not None:
+                self.latencies.append(now - stamp)
+            if stamp is not None or key in self.down:
+                handler()
+
+    def wrap(self, update):
+        def update_with_input():
+            self.apply()
+            update()
+        return update_with_input
+
+    def summary(self):
+        recent = list(self.latencies)
+        return {
+            "presses": self.presses,
+            "dropped": self.dropped,
+            "latency_mean_ms": mean(recent) * 1000,
+            "latency_p50_ms": percentile(recent, 50) * 1000,
+            "latency_p95_ms": percentile(recent, 95) * 1000,
+            "latency_max_ms": max(recent, default=0.0) * 1000,
+        }
+
+    def report(self):
+        return ("{presses} key presses, {dropped} dropped, input latency "
+                "mean {latency_mean_ms:.1f} ms / p50 {latency_p50_ms:.1f} ms / "
+                "p95 {latency_p95_ms:.1f} ms / max {latency_max_ms:.1f} ms"
+                .format(**self.summary()))
@@ -0,0 +1,124 @@
+"""Fixed-timestep game loop driven by Screen.ontimer.
+
+The game state is advanced in steps of exactly `step` seconds of game
+time, however late the timer fires. Time is measured with
+time.perf_counter and piled up in an accumulator; each tick runs as many
+updates as the accumulator holds (up to max_updates, dropping the rest
+when the machine can't keep up) and then renders once. Nothing sleeps,
+so the Tk event loop stays responsive to key presses between ticks.
+
+stats() counts the updates that were never drawn (skipped_renders),
+either because a late tick ran several of them before its one render or
+because render_rate held the render back. Its frame times are the work
+of each tick that updated, from its first update to the end of its
+render, not the time between two frames; fps covers that.
+
+Given an engine.profiler.Profiler, every tick is timed as a "frame" with
+its "update" and "render" calls inside it.
+"""
+import collections
+import math
+import time
+from engine.stats import mean, percentile
+
+FRAME_HISTORY = 600
+# Timer delays are whole milliseconds, so allow for rounding when deciding
+# whether a full step has built up.
+EPSILON = 1e-9
+
+
+class GameLoop:
+    def __init__(self, screen, update, render, step=0.1, render_rate=None,
+                 max_updates=5, clock=time.perf_counter, profiler=None):
+        self.screen = screen
+        self.update = update
+        self.render = render
+        if profiler is not None:
+            self.update = profiler.wrap("update", update)
+            self.render = profiler.wrap("render", render)
+            self.tick = profiler.wrap("frame", self.tick)
+        self.step = step
+        self.render_rate = render_rate
+        self.max_updates = max_updates
+        self.clock = clock
+        self.running = False
+        self.accumulator = 0.0
+        self.last_tick = None
+        self.last_render = None
+        self.started = None
+        self.updates = 0
+        self.renders = 0
+        self.skipped_renders = 0
+        self.dropped_steps = 0
+        self.frame_times = collections.deque(maxlen=FRAME_HISTORY)
+
+    def start(self):
+        self.running = True
+        self.started = self.last_tick = self.last_render = self.clock()
+        self.screen.ontimer(self.tick, self.delay_ms())
+
+    def stop(self):
+        self.running = False
+
+    def tick(self):
+        if not self.running:
+            return
+        now = self.clock()
+        self.accumulator += now - self.last_tick
+        self.last_tick = now
+
+        steps = 0
+        while self.accumulator >= self.step - EPSILON and self.running:
+            if steps == self.max_updates:
+                owed = int((self.accumulator + EPSILON) // self.step)
+                self.dropped_steps += owed
+                self.accumulator -= owed * self.step
+                break
+            self.update()
+            self.accumulator -= self.step
+            steps += 1
+        self.updates += steps
+
+        if steps:
+            if not self.running or self.render_due(now):
+                self.render()
+                self.last_render = now
+                self.renders += 1
+                self.skipped_renders += steps - 1
+            else:
+                self.skipped_renders += steps
+            self.frame_times.append(self.clock() - now)
+
+        if self.running:
+            self.screen.ontimer(self.tick, self.delay_ms())
+
+    def render_due(self, now):
+        if self.render_rate is None:
+            return True
+        return now - self.last_render >= 1 / self.render_rate - EPSILON
+
+    def delay_ms(self):
+        '''Milliseconds until the next update is owed.'''
+        return max(1, math.ceil((self.step - self.accumulator) * 1000 - EPSILON))
+
+    def stats(self):
+        frame_times = list(self.frame_times)
+        elapsed = self.last_tick - self.started if self.started is not None else 0.0
+        return {
+            "fps": self.renders / elapsed if elapsed > 0 else 0.0,
+            "updates": self.updates,
+            "renders": self.renders,
+            "skipped_renders": self.skipped_renders,
+            "dropped_steps": self.dropped_steps,
+            "frame_ms_mean": mean(frame_times) * 1000,
+            "frame_ms_p50": percentile(frame_times, 50) * 1000,
+            "frame_ms_p95": percentile(frame_times, 95) * 1000,
+            "frame_ms_p99": percentile(frame_times, 99) * 1000,
+        }
+
+    def report(self):
+        stats = self.stats()
+        return ("{fps:.1f} fps, {updates} updates, {renders} frames "
+                "({skipped_renders} skipped, {dropped_steps} steps dropped), "
+                "frame work p50 {frame_ms_p50:.1f} ms / p95 {frame_ms_p95:.1f} ms"
+                " / p99 {frame_ms_p99:.1f} ms".format(**stats))
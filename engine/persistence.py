@@ -0,0 +1,142 @@
+"""Per-player high scores saved to a small JSON file.
+
+The file is only rewritten when a player's best score actually goes up,
+and always atomically: the new contents go to a temporary file in the
+same directory which is then renamed over the old one, so a crash never
+leaves a half-written file behind. flush_async() hands the write to a
+background thread so the game loop never waits on the disk.
+"""
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+
+DEFAULT_PLAYER = "player"
+
+log = logging.getLogger(__name__)
+
+
+def load_scores(path):
+    '''Read a leaderboard, falling back to an empty one if it's unusable.
+
+    Besides the JSON format written by HighScoreStore this understands the
+    old single-integer files, which are read as DEFAULT_PLAYER's score.
+    '''
+    try:
+        with open(path) as data:
+            contents = data.read()
+    except (OSError, ValueError):
+        # ValueError covers a file that isn't text (UnicodeDecodeError).
+        return {}
+    try:
+        scores = json.loads(contents)
+    except ValueError:
+        return {}
+    if isinstance(scores, int) and not isinstance(scores, bool):
+        return {DEFAULT_PLAYER: scores}
+    if not isinstance(scores, dict):
+        return {}
+    return {str(player): score for player, score in scores.items()
+            if isinstance(score, int) and not isinstance(score, bool)}
+
+
+def write_atomically(path, text):
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        try:
+            temp_file = os.fdopen(handle, "w")
+        except BaseException:
+            os.close(handle)
+            raise
+        with temp_file:
+            temp_file.write(text)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+class HighScoreStore:
+    '''A leaderboard saved to path, or only kept in memory if path is None
+    (for replays, which mustn't change the real high scores).'''
+
+    def __init__(self, path):
+        self.path = path
+        self.scores = load_scores(path) if path is not None else {}
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()
+        self.dirty = False
+        self.writes = 0
+        self.wake = threading.Event()
+        self.writer = None
+        self.closed = False
+
+    def get(self, player=DEFAULT_PLAYER):
+        return self.scores.get(player, 0)
+
+    def best(self):
+        return max(self.scores.values(), default=0)
+
+    def leaderboard(self):
+        '''(player, score) pairs, best first.'''
+        return sorted(self.scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def record(self, player, score):
+        '''Remember score if it beats player's best. Returns True if it did.'''
+        with self.lock:
+            if score <= self.scores.get(player, 0):
+                return False
+            self.scores[player] = score
+            self.dirty = True
+        return True
+
+    def flush(self):
+        '''Write the leaderboard now, if anything changed since the last write.'''
+        with self.write_lock:
+            with self.lock:
+                if not self.dirty:
+                    return
+                text = json.dumps(self.scores, sort_keys=True)
+                self.dirty = False
+            if self.path is None:
+                return
+            try:
+                write_atomically(self.path, text)
+            except BaseException:
+                # Try again on the next flush.
+                with self.lock:
+                    self.dirty = True
+                raise
+            self.writes += 1
+
+    def flush_async(self):
+        '''Ask the background writer thread to flush.'''
+        if self.writer is None:
+            self.writer = threading.Thread(target=self.write_loop, daemon=True)
+            self.writer.start()
+            atexit.register(self.close)
+        self.wake.set()
+
+    def write_loop(self):
+        while not self.closed:
+            self.wake.wait()
+            self.wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                # Keep the thread alive for the next score.
+                log.exception("could not save high scores to %s", self.path)
+
+    def close(self):
+        '''Stop the writer thread and make sure everything is on disk.'''
+        self.closed = True
+        if self.writer is not None:
+            self.wake.set()
+            self.writer.join()
+            self.writer = None
+        self.flush()
@@ -0,0 +1,133 @@
+"""Opt-in timing of named phases of each frame.
+
+Profiler.instrument() swaps chosen methods of a game object for timed
+wrappers, named after the object and method ("car_manager.move_cars",
+"render.flush"), and GameLoop(profiler=...) times every frame with its
+update and render inside it. Nothing is wrapped unless a Profiler is
+made, so a game run without --profile pays nothing at all.
+
+Each phase keeps its last PHASE_HISTORY durations for the report and
+histograms, and the last TRACE_HISTORY calls are kept for dump(), which
+writes Chrome trace JSON that chrome://tracing and ui.perfetto.dev open.
+"""
+import argparse
+import atexit
+import collections
+import json
+import time
+from engine.stats import mean, percentile
+
+PHASE_HISTORY = 600
+TRACE_HISTORY = 100000
+# Histogram buckets are powers of two of microseconds, up to about a second.
+BUCKETS = 21
+
+
+class Profiler:
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.origin = clock()
+        self.durations = {}
+        self.calls = collections.Counter()
+        self.events = collections.deque(maxlen=TRACE_HISTORY)
+
+    def wrap(self, name, fun):
+        '''fun, timed as the phase name on every call.'''
+        clock = self.clock
+        record = self.record
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return fun(*args, **kwargs)
+            finally:
+                record(name, start, clock())
+        timed.__wrapped__ = fun
+        return timed
+
+    def instrument(self, label, target, *methods):
+        '''Time each of target's methods as "label.method".
+
+        target can be an object or a module. Bound methods that were
+        handed out before this call (to onkey, say) stay untimed.
+        '''
+        for method in methods:
+            timed = self.wrap(f"{label}.{method}", getattr(target, method))
+            try:
+                setattr(target, method, timed)
+            except AttributeError:
+                # No __dict__ (a slotted Entity, say): give the object a
+                # class of its own holding the wrapper.
+                cls = type(target)
+                target.__class__ = type(cls.__name__, (cls,), {
+                    "__slots__": (), method: staticmethod(timed)})
+
+    def record(self, name, start, end):
+        durations = self.durations.get(name)
+        if durations is None:
+            durations = self.durations[name] = collections.deque(maxlen=PHASE_HISTORY)
+        durations.append(end - start)
+        self.calls[name] += 1
+        self.events.append((name, start, end))
+
+    def histogram(self, name):
+        '''Counts of recent durations of name per bucket, as (upper bound in
+        microseconds, count) pairs.'''
+        counts = [0] * BUCKETS
+        for duration in self.durations.get(name, ()):
+            micros = int(duration * 1e6)
+            counts[min(micros.bit_length(), BUCKETS - 1)] += 1
+        return [(1 << bucket, count) for bucket, count in enumerate(counts)]
+
+    def summary(self):
+        '''Per phase: calls, and mean/p50/p95/p99/max ms of recent calls.'''
+        rows = {}
+        for name, durations in self.durations.items():
+            recent = list(durations)
+            rows[name] = {
+                "calls": self.calls[name],
+                "mean_ms": mean(recent) * 1000,
+                "p50_ms": percentile(recent, 50) * 1000,
+                "p95_ms": percentile(recent, 95) * 1000,
+                "p99_ms": percentile(recent, 99) * 1000,
+                "max_ms": max(recent) * 1000,
+            }
+        return rows
+
+    def report(self):
+        rows = self.summary()
+        header = (f"{'phase':<32}{'calls':>8}{'mean ms':>9}{'p50 ms':>9}"
+                  f"{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+        lines = [header, "-" * len(header)]
+        for name, row in sorted(rows.items(), key=lambda item: -item[1]["mean_ms"] * item[1]["calls"]):
+            lines.append(
+                f"{name:<32}{row['calls']:>8}{row['mean_ms']:>9.3f}{row['p50_ms']:>9.3f}"
+                f"{row['p95_ms']:>9.3f}{row['p99_ms']:>9.3f}{row['max_ms']:>9.3f}")
+        return "\n".join(lines)
+
+    def trace(self):
+        '''The recorded calls as a Chrome trace, times in microseconds.'''
+        events = [{"name": "thread_name", "ph": "M", "pid": 1, "tid": 1,
+                   "args": {"name": "game loop"}}]
+        for name, start, end in self.events:
+            events.append({"name": name, "ph": "X", "pid": 1, "tid": 1,
+                           "ts": (start - self.origin) * 1e6,
+                           "dur": (end - start) * 1e6})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, path):
+        with open(path, "w") as trace_file:
+            json.dump(self.trace(), trace_file)
+
+
+def from_argv(argv):
+    '''A Profiler that dumps its trace to PATH at exit for --profile PATH,
+    otherwise None.'''
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--profile")
+    args, unknown = parser.parse_known_args(argv[1:])
+    if args.profile is None:
+        return None
+    profiler = Profiler()
+    atexit.register(profiler.dump, args.profile)
+    return profiler
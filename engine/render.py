@@ -0,0 +1,222 @@
+"""Draw only the sprites that visibly changed since the last frame.
+
+screen.update() redraws every turtle on the screen, so with screen.tracer(0)
+a frame still costs one round of canvas calls per car, snake segment and
+padel, moved or not. Sprites (see Sprite and track()) note in a dirty
+set when they move or change look, and flush() draws just those in one
+pass per frame: a sprite that lands on the pixel it was last drawn on,
+or that stays hidden or off the screen, is skipped. A frame then costs
+O(changed sprites).
+
+Every turtle that shows on the screen has to be a Sprite, because flush()
+replaces screen.update() and draws nothing else. Hidden turtles that
+only write text (see engine.text) needn't be.
+"""
+import weakref
+from engine.backend import draw_sprites
+
+# How far past the edge of the window a sprite can be and still show;
+# more than half the longest sprite (a padel is 100 px tall).
+MARGIN = 60
+UNSEEN = "unseen"
+
+# sprite -> True if its look changed, False if it only moved.
+dirty = {}
+# sprite -> what it looked like when it was last drawn.
+drawn = weakref.WeakKeyDictionary()
+counts = {"frames": 0, "drawn": 0, "skipped": 0}
+
+_tracked_classes = {}
+
+
+def moved(sprite):
+    if sprite not in dirty:
+        dirty[sprite] = False
+
+
+def restyled(sprite):
+    dirty[sprite] = True
+
+
+class Sprite:
+    '''A turtle that flush() draws whenever it moves or changes look.
+
+    Mix it in ahead of Turtle: class Car(Sprite, Turtle). Each Turtle
+    method that moves the turtle or changes how it looks is overridden
+    to also mark it dirty.
+    '''
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        dirty[self] = True
+
+    def goto(self, x, y=None):
+        super().goto(x, y)
+        moved(self)
+
+    setpos = setposition = goto
+
+    def setx(self, x):
+        super().setx(x)
+        moved(self)
+
+    def sety(self, y):
+        super().sety(y)
+        moved(self)
+
+    def home(self):
+        super().home()
+        moved(self)
+
+    def forward(self, distance):
+        super().forward(distance)
+        moved(self)
+
+    fd = forward
+
+    def backward(self, distance):
+        super().backward(distance)
+        moved(self)
+
+    back = bk = backward
+
+    def left(self, angle):
+        super().left(angle)
+        moved(self)
+
+    lt = left
+
+    def right(self, angle):
+        super().right(angle)
+        moved(self)
+
+    rt = right
+
+    def setheading(self, to_angle):
+        super().setheading(to_angle)
+        moved(self)
+
+    seth = setheading
+
+    def showturtle(self):
+        super().showturtle()
+        restyled(self)
+
+    st = showturtle
+
+    def hideturtle(self):
+        super().hideturtle()
+        restyled(self)
+
+    ht = hideturtle
+
+    # Called with no arguments, these only read the turtle's look.
+
+    def shape(self, name=None):
+        result = super().shape(name)
+        if name is not None:
+            restyled(self)
+        return result
+
+    def shapesize(self, stretch_wid=None, stretch_len=None, outline=None):
+        result = super().shapesize(stretch_wid, stretch_len, outline)
+        if (stretch_wid, stretch_len, outline) != (None, None, None):
+            restyled(self)
+        return result
+
+    turtlesize = shapesize
+
+    def color(self, *args):
+        result = super().color(*args)
+        if args:
+            restyled(self)
+        return result
+
+    def pencolor(self, *args):
+        result = super().pencolor(*args)
+        if args:
+            restyled(self)
+        return result
+
+    def fillcolor(self, *args):
+        result = super().fillcolor(*args)
+        if args:
+            restyled(self)
+        return result
+
+
+def track(sprite):
+    '''Make a turtle made elsewhere a Sprite, by swapping its class for
+    a subclass with Sprite mixed in (made once per class).'''
+    if not isinstance(sprite, Sprite):
+        cls = type(sprite)
+        if cls not in _tracked_classes:
+            _tracked_classes[cls] = type(cls.__name__, (Sprite, cls), {"__module__": cls.__module__})
+        sprite.__class__ = _tracked_classes[cls]
+    dirty[sprite] = True
+    return sprite
+
+
+class SpritePool:
+    '''Hidden sprites kept for reuse.
+
+    A game that drops sprites and makes new ones (a snake that dies and
+    starts again) would otherwise leave every dropped turtle alive on the
+    canvas. release() hides a sprite, after which flush() draws it once
+    more and then leaves it alone, and acquire() shows it again before
+    make() is asked for a new one.
+    '''
+
+    def __init__(self, make):
+        self.make = make
+        self.free = []
+        self.made = 0
+
+    def acquire(self):
+        if self.free:
+            sprite = self.free.pop()
+            sprite.showturtle()
+            return sprite
+        self.made += 1
+        return track(self.make())
+
+    def release(self, sprite):
+        sprite.hideturtle()
+        self.free.append(sprite)
+
+
+def appearance(sprite, half_width, half_height):
+    '''What a sprite looks like on screen, at pixel resolution, or UNSEEN
+    if it is hidden or off the screen.'''
+    x, y = sprite.position()
+    if abs(x) > half_width or abs(y) > half_height:
+        return UNSEEN
+    if not sprite.isvisible():
+        return UNSEEN
+    return (round(x), round(y), round(sprite.heading()))
+
+
+def flush(screen):
+    '''Draw every tracked sprite that changed since the last flush, in one
+    pass, and show the frame.'''
+    half_width = screen.window_width() / 2 + MARGIN
+    half_height = screen.window_height() / 2 + MARGIN
+    changed = []
+    for sprite, looks in dirty.items():
+        now = appearance(sprite, half_width, half_height)
+        before = drawn.get(sprite)
+        if now == before and (not looks or now == UNSEEN):
+            continue
+        drawn[sprite] = now
+        changed.append(sprite)
+    counts["frames"] += 1
+    counts["drawn"] += len(changed)
+    counts["skipped"] += len(dirty) - len(changed)
+    dirty.clear()
+    draw_sprites(screen, changed)
+
+
+def reset():
+    '''Forget every sprite, for when the screen is cleared.'''
+    dirty.clear()
+    drawn.clear()
@@ -0,0 +1,254 @@
+"""Record a game session and play it back exactly.
+
+A Recording is the seed for the game's random.Random plus every key
+press, tagged with the number of game steps that had run when it came
+in. Replaying the presses before the same steps with the same seed takes
+the game through exactly the same states, so a recorded bug report can
+be replayed headlessly at full speed, and benchmarks can run the same
+workload every time.
+
+Recording files are small. After a header every event is two varints,
+the frames since the previous event and an index into the key table:
+
+    b"GREC", version byte
+    seed, frames played, number of keys        (varints)
+    each key: length, UTF-8 name               (varint + bytes)
+    each event: frame delta, key index         (varints)
+
+The games take --record PATH, --replay PATH and --seed N on the command
+line through from_argv(). --replay also selects the headless backend.
+"""
+import argparse
+import random
+
+# Recorded name of a key's onkeypress event; onkey events use the bare name.
+PRESS_PREFIX = "press:"
+MAGIC = b"GREC"
+VERSION = 1
+SEED_LIMIT = 2 ** 32
+
+
+def encode_varint(value):
+    '''value as LEB128: 7 bits per byte, high bit set on all but the last.'''
+    if value < 0:
+        raise ValueError(f"varints can't be negative, got {value}")
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def decode_varint(data, pos):
+    '''The varint starting at data[pos], and the position after it.'''
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("recording ends in the middle of a number")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+class Recording:
+    def __init__(self, seed, frames=0, events=None):
+        self.seed = seed
+        self.frames = frames
+        self.events = events if events is not None else []
+
+    def to_bytes(self):
+        keys = {}
+        for frame, key in self.events:
+            keys.setdefault(key, len(keys))
+        out = bytearray(MAGIC)
+        out.append(VERSION)
+        out += encode_varint(self.seed)
+        out += encode_varint(self.frames)
+        out += encode_varint(len(keys))
+        for key in keys:
+            name = key.encode("utf-8")
+            out += encode_varint(len(name))
+            out += name
+        last_frame = 0
+        for frame, key in self.events:
+            out += encode_varint(frame - last_frame)
+            out += encode_varint(keys[key])
+            last_frame = frame
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("not a game recording")
+        pos = len(MAGIC)
+        if pos >= len(data) or data[pos] != VERSION:
+            raise ValueError("unsupported recording version")
+        pos += 1
+        seed, pos = decode_varint(data, pos)
+        frames, pos = decode_varint(data, pos)
+        key_count, pos = decode_varint(data, pos)
+        keys = []
+        for i in range(key_count):
+            length, pos = decode_varint(data, pos)
+            keys.append(data[pos:pos + length].decode("utf-8"))
+            pos += length
+        events = []
+        frame = 0
+        while pos < len(data):
+            delta, pos = decode_varint(data, pos)
+            index, pos = decode_varint(data, pos)
+            frame += delta
+            events.append((frame, keys[index]))
+        return cls(seed, frames, events)
+
+    def save(self, path):
+        with open(path, "wb") as recording_file:
+            recording_file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as recording_file:
+            return cls.from_bytes(recording_file.read())
+
+
+class Recorder:
+    '''Records key presses while the game is played normally.
+
+    Register keys with onkey() and onkeypress() instead of the screen's,
+    give the game loop wrap(update) as its update, and call finish() when
+    the game ends to save the recording to path (if there is one).
+    '''
+
+    replaying = False
+
+    def __init__(self, seed=None, path=None):
+        if seed is None:
+            seed = random.randrange(SEED_LIMIT)
+        self.recording = Recording(seed)
+        self.path = path
+
+    @property
+    def seed(self):
+        return self.recording.seed
+
+    def rng(self):
+        return random.Random(self.seed)
+
+    def onkey(self, screen, handler, key):
+        screen.onkey(self.recorded(handler, key), key)
+
+    def onkeypress(self, screen, handler, key):
+        screen.onkeypress(self.recorded(handler, PRESS_PREFIX + key), key)
+
+    def recorded(self, handler, name):
+        def pressed():
+            self.recording.events.append((self.recording.frames, name))
+            handler()
+        return pressed
+
+    def wrap(self, update):
+        def recorded_update():
+            update()
+            self.recording.frames += 1
+        return recorded_update
+
+    def attach(self, game_loop):
+        pass
+
+    def finish(self):
+        if self.path is not None:
+            self.recording.save(self.path)
+
+
+class Replayer:
+    '''Plays a Recording back into the key handlers a game registers.
+
+    Used in place of a Recorder. Before each step the presses recorded
+    at that step are handed to their handlers, and the attached game loop
+    is stopped once every recorded step has been played.
+    '''
+
+    replaying = True
+
+    def __init__(self, recording):
+        self.recording = recording
+        self.handlers = {}
+        self.frame = 0
+        self.next_event = 0
+        self.game_loop = None
+
+    @property
+    def seed(self):
+        return self.recording.seed
+
+    def rng(self):
+        return random.Random(self.seed)
+
+    @property
+    def done(self):
+        return self.frame >= self.recording.frames
+
+    def onkey(self, screen, handler, key):
+        self.handlers[key] = handler
+
+    def onkeypress(self, screen, handler, key):
+        self.handlers[PRESS_PREFIX + key] = handler
+
+    def press_due_keys(self):
+        events = self.recording.events
+        while self.next_event < len(events) and events[self.next_event][0] <= self.frame:
+            frame, key = events[self.next_event]
+            self.handlers[key]()
+            self.next_event += 1
+
+    def wrap(self, update):
+        def replayed_update():
+            if self.done:
+                self.stop()
+                return
+            self.press_due_keys()
+            update()
+            self.frame += 1
+            if self.done:
+                self.stop()
+        return replayed_update
+
+    def attach(self, game_loop):
+        self.game_loop = game_loop
+
+    def stop(self):
+        if self.game_loop is not None:
+            self.game_loop.stop()
+
+    def run(self, update):
+        '''Play the whole recording through update, without a game loop.'''
+        step = self.wrap(update)
+        while not self.done:
+            step()
+
+    def finish(self):
+        pass
+
+
+def from_argv(argv):
+    '''A Replayer for --replay PATH, otherwise a Recorder.
+
+    The Recorder saves to --record PATH if given, and uses --seed N if
+    given instead of a random seed.
+    '''
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--record")
+    parser.add_argument("--replay")
+    parser.add_argument("--seed", type=int)
+    args, unknown = parser.parse_known_args(argv[1:])
+    if args.replay is not None:
+        return Replayer(Recording.load(args.replay))
+    return Recorder(seed=args.seed, path=args.record)
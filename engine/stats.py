@@ -0,0 +1,17 @@
+"""Small summary statistics shared by the loop scheduler and tools."""
+import math
+
+
+def percentile(values, pct):
+    '''Nearest-rank percentile of values, with pct between 0 and 100.'''
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def mean(values):
+    if not values:
+        return 0.0
+    return sum(values) / len(values)
@@ -0,0 +1,60 @@
+"""
+TESTS FOR engine/collision.py
+
+sweep_point_rect() finds when a moving point first enters a rectangle,
+as a fraction of the move, and which side it came through.
+"""
+
+import pytest
+from engine.collision import sweep_point_rect, sweep_wall
+
+BOX = (0, 0, 10, 10)    # left, bottom, right, top
+
+
+def test_hits_left_side_half_way():
+    hit = sweep_point_rect(-10, 5, 20, 0, *BOX)
+
+    assert hit.time == 0.5
+    assert hit.axis == "x"
+
+
+def test_hits_top_side():
+    hit = sweep_point_rect(5, 20, 0, -20, *BOX)
+
+    assert hit.time == 0.5
+    assert hit.axis == "y"
+
+
+def test_fast_point_cannot_tunnel_through():
+    """Starts on one side, ends far past the other: still a hit."""
+    hit = sweep_point_rect(-100, 5, 1000, 0, *BOX)
+
+    assert hit.time == pytest.approx(0.1)
+
+
+def test_diagonal_hit_reports_the_side_it_crossed_last():
+    hit = sweep_point_rect(-2, 14, 8, -8, *BOX)    # left side at 0.25, top at 0.5
+
+    assert hit.axis == "y"
+    assert hit.time == pytest.approx(0.5)
+
+
+def test_misses():
+    assert sweep_point_rect(-10, 20, 20, 0, *BOX) is None       # passes above
+    assert sweep_point_rect(-10, 5, 5, 0, *BOX) is None         # stops short
+    assert sweep_point_rect(20, 5, 10, 0, *BOX) is None         # moving away
+    assert sweep_point_rect(5, 5, 1, 1, *BOX) is None           # already inside
+
+
+def test_touching_at_the_start_counts():
+    hit = sweep_point_rect(0, 5, 10, 0, *BOX)
+
+    assert hit.time == 0
+    assert hit.axis == "x"
+
+
+def test_sweep_wall():
+    assert sweep_wall(270, 20, -280, 280) == 0.5
+    assert sweep_wall(-270, -20, -280, 280) == 0.5
+    assert sweep_wall(270, 10, -280, 280) is None
+    assert sweep_wall(290, 10, -280, 280) == 0.0
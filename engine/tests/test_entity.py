@@ -0,0 +1,149 @@
+"""
+TESTS FOR engine/entity.py
+
+An Entity answers the Turtle calls the games make from its own slots.
+Its view, when it has one, only catches up in flush().
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+import random
+import tracemalloc
+import pytest
+from engine import entity, render
+from engine.entity import Entity
+from engine.headless import HeadlessTurtle
+
+
+@pytest.fixture(autouse=True)
+def empty_queue():
+    entity.flush()
+    yield
+    entity.flush()
+
+
+# ============================================================================
+# STATE
+# ============================================================================
+
+def test_moves_like_a_turtle():
+    thing = Entity()
+
+    thing.goto((30, 40))
+    assert thing.position() == (30, 40)
+    assert thing.distance(0, 0) == 50
+    thing.sety(-10)
+    thing.setheading(450)
+    thing.forward(10)
+
+    assert thing.heading() == 90
+    assert thing.xcor() == pytest.approx(30)
+    assert thing.ycor() == pytest.approx(0)
+    assert (thing.x, thing.y) == (thing.xcor(), thing.ycor())
+
+
+def test_distance_to_another_entity():
+    here, there = Entity(), Entity()
+    there.goto(3, 4)
+
+    assert here.distance(there) == 5
+    assert here.distance((6, 8)) == 10
+
+
+def size_of(make, count=1000):
+    '''Bytes each of count objects from make() takes.'''
+    tracemalloc.start()
+    objects = [make() for index in range(count)]
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(objects)
+
+
+def test_is_small():
+    assert not hasattr(Entity(), "__dict__")
+    assert size_of(Entity) < 200
+
+
+def test_game_objects_are_small():
+    from engine.grid import FreeCells, square_board
+    from pong.ball import Ball
+    from pong.padel import Padel
+    from snake_game_template.food import Food
+    from turtle_crossing.game_objects.player import Player
+    for game_object in (Ball(), Padel((0, 0)), Food()):
+        assert not hasattr(game_object, "__dict__")
+    cells = FreeCells(square_board(5))
+    rng = random.Random(0)
+
+    assert size_of(Ball) < 250
+    assert size_of(lambda: Padel((0, 0))) < 250
+    assert size_of(Player) < 250
+    assert size_of(lambda: Food(cells, rng)) < 250
+
+
+def test_scoreboards_are_entities():
+    from pong.scoreboard import Scoreboard as PongScoreboard
+    from turtle_crossing.game_objects.scoreboard import Scoreboard as CrossingScoreboard
+    for scoreboard in (PongScoreboard(), CrossingScoreboard()):
+        assert isinstance(scoreboard, Entity)
+        assert scoreboard.view is None
+        assert not hasattr(scoreboard, "__dict__")
+
+
+# ============================================================================
+# VIEWS
+# ============================================================================
+
+def test_nothing_queues_without_a_view():
+    thing = Entity()
+
+    thing.goto(10, 10)
+    thing.hideturtle()
+
+    assert entity.pending == []
+
+
+def test_view_takes_the_look_set_before_it():
+    thing = Entity()
+    thing.shape("square")
+    thing.color("white")
+    thing.shapesize(stretch_wid=5, stretch_len=1)
+    thing.goto(350, 0)
+
+    view = thing.attach_view(HeadlessTurtle())
+
+    assert view.shape() == "square"
+    assert view.color() == ("white", "white")
+    assert view.shapesize() == (5, 1, 1)
+    assert view.position() == (350, 0)
+    assert isinstance(view, render.Sprite)
+
+
+def test_view_catches_up_on_flush():
+    thing = Entity()
+    view = thing.attach_view(HeadlessTurtle())
+
+    for step in range(5):
+        thing.goto(thing.x + 10, 0)
+    thing.setheading(90)
+    thing.hideturtle()
+    assert view.position() == (0, 0)
+
+    entity.flush()
+
+    assert view.position() == (50, 0)
+    assert view.heading() == 90
+    assert not view.isvisible()
+    assert entity.pending == []
+
+
+def test_look_changes_reach_the_view_straight_away():
+    thing = Entity()
+    view = thing.attach_view(HeadlessTurtle())
+
+    thing.color("red", "blue")
+
+    assert view.color() == ("red", "blue")
+    assert thing.color() == ("red", "blue")
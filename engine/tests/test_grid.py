@@ -0,0 +1,81 @@
+"""
+TESTS FOR engine/grid.py
+
+FreeCells is a set of board cells that can also hand out a random
+member in O(1).
+"""
+
+import random
+from engine.grid import FreeCells, square_board
+
+
+def test_square_board_size():
+    board = square_board(14)
+
+    assert len(board) == 29 * 29
+    assert (-14, 14) in board
+    assert (15, 0) not in board
+
+
+def test_discard_and_add():
+    free = FreeCells(square_board(1))
+
+    free.discard((0, 0))
+    free.discard((0, 0))
+    assert len(free) == 8
+    assert (0, 0) not in free
+
+    free.add((0, 0))
+    free.add((0, 0))
+    assert len(free) == 9
+    assert (0, 0) in free
+
+
+def test_cells_off_the_board_are_ignored():
+    free = FreeCells(square_board(1))
+
+    free.add((5, 5))
+    free.discard((5, 5))
+
+    assert len(free) == 9
+    assert (5, 5) not in free
+
+
+def test_sample_only_returns_free_cells():
+    rng = random.Random(0)
+    free = FreeCells(square_board(2))
+    taken = set(square_board(2)[:20])
+    for cell in taken:
+        free.discard(cell)
+
+    samples = {free.sample(rng) for i in range(200)}
+
+    assert samples == set(square_board(2)) - taken
+
+
+def test_sample_on_a_full_board():
+    free = FreeCells(square_board(0))
+    free.discard((0, 0))
+
+    assert free.sample(random.Random()) is None
+
+
+def test_index_stays_consistent_under_random_use():
+    rng = random.Random(9)
+    board = square_board(3)
+    free = FreeCells(board)
+    expected = set(board)
+
+    for step in range(2000):
+        cell = rng.choice(board)
+        if rng.random() < 0.5:
+            free.discard(cell)
+            expected.discard(cell)
+        else:
+            free.add(cell)
+            expected.add(cell)
+        assert set(free.cells) == expected
+        assert all(free.cells[i] == cell for cell, i in free.index.items())
+
+    free.reset()
+    assert set(free.cells) == set(board)
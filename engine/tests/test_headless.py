@@ -0,0 +1,146 @@
+"""
+TESTS FOR engine/headless.py
+
+HeadlessTurtle must move exactly like turtle.Turtle so the games behave
+the same with or without a display. turtle.TNavigator does the position
+and heading maths of a real Turtle without opening a window, so we use
+it as the reference.
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+import random
+from turtle import TNavigator
+import pytest
+from engine import headless
+from engine.headless import HeadlessTurtle
+
+
+# ============================================================================
+# MOVEMENT MATCHES turtle
+# ============================================================================
+
+def test_forward_matches_turtle_at_right_angles():
+    fake = HeadlessTurtle()
+    real = TNavigator()
+
+    for heading in (90, 180, 270, 0, 90):
+        fake.setheading(heading)
+        real.setheading(heading)
+        fake.forward(20)
+        real.forward(20)
+
+        assert fake.heading() == real.heading()
+        assert fake.position() == pytest.approx(tuple(real.position()), abs=1e-9)
+
+
+def test_random_walk_matches_turtle():
+    rng = random.Random(7)
+    fake = HeadlessTurtle()
+    real = TNavigator()
+
+    for step in range(200):
+        angle = rng.uniform(-180, 180)
+        distance = rng.uniform(-30, 30)
+        fake.left(angle)
+        real.left(angle)
+        fake.forward(distance)
+        real.forward(distance)
+
+    assert fake.heading() == pytest.approx(real.heading())
+    assert fake.xcor() == pytest.approx(real.xcor())
+    assert fake.ycor() == pytest.approx(real.ycor())
+
+
+def test_goto_and_distance():
+    first = HeadlessTurtle()
+    second = HeadlessTurtle()
+    first.goto(3, 0)
+    second.goto((0, 4))
+
+    assert first.distance(second) == 5.0
+    assert first.distance(0, 0) == 3.0
+    assert first.distance((3, 4)) == 4.0
+
+
+def test_setx_sety_backward():
+    turtle = HeadlessTurtle()
+    turtle.sety(100)
+    turtle.setx(-50)
+    turtle.backward(10)
+
+    assert turtle.position() == (-60, 100)
+
+
+# ============================================================================
+# SCREEN
+# ============================================================================
+
+def test_screen_is_shared_and_tracks_turtles():
+    turtle = HeadlessTurtle()
+
+    assert headless.Screen() is headless.Screen()
+    assert turtle in headless.Screen().turtles()
+
+
+def test_onkey_handlers_can_be_pressed():
+    screen = headless.Screen()
+    pressed = []
+    screen.onkey(lambda: pressed.append("Up"), "Up")
+
+    screen.press("Up")
+    screen.press("Down")
+
+    assert pressed == ["Up"]
+
+
+# ============================================================================
+# THE GAMES RUN WITHOUT Tk
+# ============================================================================
+"""
+conftest.py selects the headless backend, so every game object below is
+drawn with a HeadlessTurtle.
+"""
+
+def test_game_objects_use_the_headless_backend():
+    from turtle_crossing.game_objects.player import Player
+    from pong.ball import Ball
+    from pong.padel import Padel
+    from snake_game_template.food import Food
+
+    for game_object in (Player(), Ball(), Padel((350, 0)), Food()):
+        assert isinstance(game_object.attach_view(), HeadlessTurtle)
+
+
+def test_snake_moves_headless():
+    from snake_game_template.snake import Snake
+    snake = Snake()
+
+    snake.up()
+    snake.move()
+
+    assert snake.head.position() == (0, 20)
+    assert [segment.position() for segment in list(snake.segments)[1:]] == [(0, 0), (-20, 0)]
+
+
+def test_pong_rally_headless():
+    from pong.ball import Ball
+    from pong.padel import Padel
+    from pong.scoreboard import Scoreboard
+    from engine import text
+    ball = Ball()
+    padel = Padel((350, 0))
+    scoreboard = Scoreboard()
+    view = scoreboard.attach_view()
+
+    for step in range(34):
+        ball.move()
+    padel.go_up()
+    scoreboard.point_l()
+    text.flush()
+
+    assert ball.position() == (340, 220)    # bounced off the top wall at y=280
+    assert padel.position() == (350, 20)
+    assert [item[0] for item in view.items] == ["1", "0"]
@@ -0,0 +1,145 @@
+"""
+TESTS FOR engine/input.py
+
+Presses wait in the InputQueue until the next step: at most one snake
+turn per step, held keys once per step, and a latency for each.
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+from engine.headless import HeadlessScreen
+from engine.input import InputQueue
+from engine.replay import Recorder, Recording, Replayer
+from snake_game_template.snake import Snake, UP, LEFT
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def snake_game(session, screen, clock=None):
+    snake = Snake()
+    inputs = InputQueue(session, screen, clock or screen.clock)
+    inputs.turn(snake.up, "Up")
+    inputs.turn(snake.down, "Down")
+    inputs.turn(snake.left, "Left")
+    inputs.turn(snake.right, "Right")
+    return snake, inputs, inputs.wrap(snake.move)
+
+
+# ============================================================================
+# TURNS
+# ============================================================================
+
+def test_two_turns_in_one_step_cannot_reverse_the_snake():
+    screen = HeadlessScreen()
+    snake, inputs, step = snake_game(Recorder(seed=0), screen)
+
+    screen.press("Up")
+    screen.press("Left")
+    step()
+    assert snake.direction == UP
+    step()
+    assert snake.direction == LEFT
+
+    assert not snake.hits_self()
+    assert list(snake.body)[:3] == [(-1, 1), (0, 1), (0, 0)]
+
+
+def test_turns_that_change_nothing_do_not_use_the_step():
+    screen = HeadlessScreen()
+    snake, inputs, step = snake_game(Recorder(seed=0), screen)
+
+    screen.press("Right")
+    screen.press("Left")
+    screen.press("Up")
+    step()
+
+    assert snake.direction == UP
+
+
+def test_mashed_keys_are_dropped():
+    screen = HeadlessScreen()
+    snake, inputs, step = snake_game(Recorder(seed=0), screen)
+
+    for press in range(5):
+        screen.press("Up")
+
+    assert len(inputs.turns) == 3
+    assert inputs.summary()["dropped"] == 2
+
+
+def test_turn_latency():
+    screen = HeadlessScreen()
+    clock = FakeClock()
+    snake, inputs, step = snake_game(Recorder(seed=0), screen, clock)
+
+    screen.press("Up")
+    clock.now = 0.06
+    step()
+
+    assert inputs.summary()["latency_max_ms"] == 60
+
+
+# ============================================================================
+# HELD KEYS
+# ============================================================================
+
+def held_keys(screen, clock):
+    moves = []
+    inputs = InputQueue(Recorder(seed=0), screen, clock)
+    inputs.hold(lambda: moves.append("up"), "Up")
+    return moves, inputs
+
+
+def test_held_key_acts_once_per_step():
+    screen = HeadlessScreen()
+    moves, inputs = held_keys(screen, FakeClock())
+
+    screen.key_down("Up")
+    for step in range(3):
+        for repeat in range(4):
+            screen.key_down("Up")     # auto-repeat
+        inputs.apply()
+    screen.key_up("Up")
+    inputs.apply()
+
+    assert moves == ["up"] * 3
+
+
+def test_tap_between_steps_acts_once():
+    screen = HeadlessScreen()
+    clock = FakeClock()
+    moves, inputs = held_keys(screen, clock)
+
+    screen.press("Up")
+    clock.now = 0.03
+    inputs.apply()
+    inputs.apply()
+
+    assert moves == ["up"]
+    assert inputs.summary()["latency_p50_ms"] == 30
+
+
+def test_queued_input_replays_exactly():
+    screen = HeadlessScreen()
+    recorder = Recorder(seed=0)
+    snake, inputs, step = snake_game(recorder, screen)
+    recorded_step = recorder.wrap(step)
+    for keys in (["Up", "Left"], [], ["Down"], ["Down", "Right", "Up"], [], []):
+        for key in keys:
+            screen.press(key)
+        recorded_step()
+    played = list(snake.body)
+
+    replayer = Replayer(Recording.from_bytes(recorder.recording.to_bytes()))
+    replayed, inputs, step = snake_game(replayer, HeadlessScreen())
+    replayer.run(step)
+
+    assert list(replayed.body) == played
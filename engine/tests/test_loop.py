@@ -0,0 +1,195 @@
+"""
+TESTS FOR engine/loop.py
+
+GameLoop advances the game in fixed steps however late its timer fires.
+A FakeClock lets each test decide exactly how much time passes between
+ticks, so nothing here actually waits.
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+from engine.headless import HeadlessScreen
+from engine.loop import GameLoop
+from engine.stats import percentile
+
+
+# ============================================================================
+# FAKES
+# ============================================================================
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeScreen:
+    """Remembers the timers GameLoop asks for instead of running them."""
+    def __init__(self):
+        self.timers = []
+
+    def ontimer(self, fun, t=0):
+        self.timers.append(t)
+
+
+def make_loop(**kwargs):
+    clock = FakeClock()
+    frames = []
+    loop = GameLoop(FakeScreen(), lambda: frames.append("update"),
+                    lambda: frames.append("render"), clock=clock, **kwargs)
+    return loop, clock, frames
+
+
+# ============================================================================
+# FIXED STEPS
+# ============================================================================
+
+def test_one_update_per_step_on_time():
+    loop, clock, frames = make_loop(step=0.1)
+    loop.start()
+
+    for tick in range(3):
+        clock.now += 0.1
+        loop.tick()
+
+    assert frames == ["update", "render"] * 3
+    assert loop.screen.timers == [100, 100, 100, 100]
+
+
+def test_early_tick_does_nothing():
+    loop, clock, frames = make_loop(step=0.1)
+    loop.start()
+
+    clock.now += 0.04
+    loop.tick()
+
+    assert frames == []
+    assert loop.screen.timers[-1] == 60    # 60 ms until the step is owed
+
+
+def test_late_tick_catches_up_and_renders_once():
+    loop, clock, frames = make_loop(step=0.1)
+    loop.start()
+
+    clock.now += 0.35
+    loop.tick()
+
+    assert frames == ["update", "update", "update", "render"]
+    assert loop.skipped_renders == 2
+    assert loop.screen.timers[-1] == 50
+
+
+def test_steps_beyond_max_updates_are_dropped():
+    loop, clock, frames = make_loop(step=0.1, max_updates=2)
+    loop.start()
+
+    clock.now += 1.0
+    loop.tick()
+
+    assert frames.count("update") == 2
+    assert loop.dropped_steps == 8
+    assert abs(loop.accumulator) < 1e-9
+
+
+def test_render_rate_caps_renders():
+    loop, clock, frames = make_loop(step=0.1, render_rate=5)
+    loop.start()
+
+    for tick in range(10):
+        clock.now += 0.1
+        loop.tick()
+
+    assert frames.count("update") == 10
+    assert frames.count("render") == 5
+    assert loop.skipped_renders == 5
+
+
+def test_stop_ends_the_loop_but_draws_the_last_frame():
+    loop, clock, frames = make_loop(step=0.1)
+    loop.update = lambda: (frames.append("update"), loop.stop())
+    loop.start()
+
+    clock.now += 0.3
+    loop.tick()
+    clock.now += 0.1
+    loop.tick()
+
+    assert frames == ["update", "render"]
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def test_stats_report_fps_and_percentiles():
+    loop, clock, frames = make_loop(step=0.1)
+    loop.start()
+
+    for tick in range(20):
+        clock.now += 0.1 if tick % 10 else 0.2
+        loop.tick()
+
+    stats = loop.stats()
+    assert 8 < stats["fps"] < 10
+    assert "fps" in loop.report()
+
+
+def test_frame_times_are_the_work_of_a_tick():
+    loop, clock, frames = make_loop(step=0.1)
+
+    def update():
+        clock.now += 0.002
+
+    def render():
+        clock.now += 0.010 if len(loop.frame_times) % 10 else 0.030
+
+    loop.update = update
+    loop.render = render
+    loop.start()
+    for tick in range(20):
+        clock.now += 0.1
+        loop.tick()
+
+    stats = loop.stats()
+    assert round(stats["frame_ms_p50"]) == 12
+    assert round(stats["frame_ms_p99"]) == 32
+    assert 8 < stats["fps"] < 10
+
+
+def test_percentile_nearest_rank():
+    values = [5, 1, 4, 2, 3]
+
+    assert percentile(values, 50) == 3
+    assert percentile(values, 100) == 5
+    assert percentile(values, 1) == 1
+    assert percentile([], 50) == 0.0
+
+
+# ============================================================================
+# HEADLESS SCREEN
+# ============================================================================
+"""
+The headless screen fires timers straight away and moves its clock
+forward, so a loop on it runs at full CPU speed in game time.
+"""
+
+def test_loop_on_headless_screen_runs_in_game_time():
+    screen = HeadlessScreen()
+    updates = []
+
+    def update():
+        updates.append(screen.clock())
+        if len(updates) == 50:
+            loop.stop()
+
+    loop = GameLoop(screen, update, lambda: None, step=0.1, clock=screen.clock)
+    loop.start()
+    screen.mainloop()
+
+    assert len(updates) == 50
+    assert updates[-1] == 5.0
+    assert loop.dropped_steps == 0
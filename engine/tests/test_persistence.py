@@ -0,0 +1,158 @@
+"""
+TESTS FOR engine/persistence.py
+
+HighScoreStore keeps a per-player leaderboard, only writes when a best
+score goes up, and writes atomically. Every test uses pytest's tmp_path
+so the real snake data.txt is never touched.
+"""
+
+import json
+import os
+import threading
+from unittest.mock import patch
+import pytest
+from engine import persistence
+from engine.persistence import DEFAULT_PLAYER, HighScoreStore, load_scores, write_atomically
+
+
+# ============================================================================
+# LOADING
+# ============================================================================
+
+def test_missing_file_is_an_empty_leaderboard(tmp_path):
+    assert load_scores(tmp_path / "nope.txt") == {}
+
+
+def test_old_single_number_file(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("10")
+
+    assert load_scores(path) == {DEFAULT_PLAYER: 10}
+
+
+def test_corrupt_file_falls_back_cleanly(tmp_path):
+    path = tmp_path / "data.txt"
+    for contents in ["", "ten", "[1, 2]", '{"ann": "lots"}', "true", "{"]:
+        path.write_text(contents)
+        assert load_scores(path) == {}
+    path.write_bytes(b"\xff\xfe garbage")
+    assert load_scores(path) == {}
+
+
+def test_bad_entries_are_dropped(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text('{"ann": 5, "bob": "x", "cy": 2.5}')
+
+    assert load_scores(path) == {"ann": 5}
+
+
+# ============================================================================
+# RECORDING
+# ============================================================================
+
+def test_record_only_raises_scores(tmp_path):
+    store = HighScoreStore(tmp_path / "data.txt")
+
+    assert store.record("ann", 5) is True
+    assert store.record("ann", 3) is False
+    assert store.record("ann", 5) is False
+    assert store.record("bob", 7) is True
+
+    assert store.get("ann") == 5
+    assert store.best() == 7
+    assert store.leaderboard() == [("bob", 7), ("ann", 5)]
+
+
+def test_flush_writes_only_when_something_changed(tmp_path):
+    path = tmp_path / "data.txt"
+    store = HighScoreStore(path)
+
+    store.flush()
+    assert not path.exists()
+
+    store.record("ann", 5)
+    store.flush()
+    store.flush()
+    store.record("ann", 2)
+    store.flush()
+
+    assert store.writes == 1
+    assert json.loads(path.read_text()) == {"ann": 5}
+
+
+def test_flush_leaves_no_temp_files(tmp_path):
+    store = HighScoreStore(tmp_path / "data.txt")
+    for score in range(1, 20):
+        store.record("ann", score)
+        store.flush()
+
+    assert os.listdir(tmp_path) == ["data.txt"]
+    assert HighScoreStore(tmp_path / "data.txt").get("ann") == 19
+
+
+def test_flush_async_writes_in_the_background(tmp_path):
+    path = tmp_path / "data.txt"
+    store = HighScoreStore(path)
+
+    store.record("ann", 4)
+    store.flush_async()
+    store.record("bob", 9)
+    store.flush_async()
+    store.close()
+
+    assert json.loads(path.read_text()) == {"ann": 4, "bob": 9}
+    assert store.writer is None
+
+
+def test_writer_thread_survives_a_failed_write(tmp_path, caplog):
+    path = tmp_path / "data.txt"
+    store = HighScoreStore(path)
+    real_write = persistence.write_atomically
+    failed = threading.Event()
+
+    def fail_once(path, text):
+        if not failed.is_set():
+            failed.set()
+            raise OSError("disk full")
+        real_write(path, text)
+
+    with patch.object(persistence, "write_atomically", fail_once):
+        store.record("ann", 4)
+        store.flush_async()
+        assert failed.wait(5)
+        store.writer.join(0.1)
+        assert store.writer.is_alive()
+
+        store.record("bob", 9)
+        store.flush_async()
+        store.close()
+
+    assert json.loads(path.read_text()) == {"ann": 4, "bob": 9}
+    assert "could not save high scores" in caplog.text
+
+
+def test_write_closes_the_file_if_it_cannot_be_opened(tmp_path):
+    closed = []
+    real_close = os.close
+
+    def close(handle):
+        closed.append(handle)
+        real_close(handle)
+
+    with patch.object(os, "fdopen", side_effect=OSError("no")), patch.object(os, "close", close):
+        with pytest.raises(OSError):
+            write_atomically(tmp_path / "data.txt", "{}")
+
+    assert len(closed) == 1
+    assert os.listdir(tmp_path) == []
+
+
+def test_store_without_a_path_stays_in_memory(tmp_path):
+    store = HighScoreStore(None)
+
+    assert store.record("ann", 4)
+    store.flush_async()
+    store.close()
+
+    assert store.best() == 4
+    assert store.writes == 0
@@ -0,0 +1,140 @@
+"""
+TESTS FOR engine/profiler.py
+
+A FakeClock that moves forward a set amount on every reading makes
+every timed call take a known time.
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+import json
+import types
+from engine.headless import HeadlessScreen
+from engine.loop import GameLoop
+from engine.profiler import PHASE_HISTORY, Profiler, from_argv
+
+
+# ============================================================================
+# FAKES
+# ============================================================================
+
+class FakeClock:
+    """Every reading is one millisecond after the last."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 0.001
+        return self.now
+
+
+class Car:
+    def __init__(self):
+        self.moves = 0
+
+    def move_cars(self):
+        self.moves += 1
+        return self.moves
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+def test_instrument_times_calls_and_keeps_results():
+    profiler = Profiler(clock=FakeClock())
+    car = Car()
+
+    profiler.instrument("car_manager", car, "move_cars")
+
+    assert car.move_cars() == 1
+    assert car.move_cars() == 2
+    summary = profiler.summary()["car_manager.move_cars"]
+    assert summary["calls"] == 2
+    assert round(summary["mean_ms"], 6) == 1.0
+
+
+def test_instrument_slotted_objects():
+    from pong.padel import Padel
+    profiler = Profiler(clock=FakeClock())
+    padel = Padel((350, 0))
+    other = Padel((-350, 0))
+
+    profiler.instrument("padel", padel, "go_up")
+    padel.go_up()
+    other.go_up()
+
+    assert isinstance(padel, Padel)
+    assert padel.ycor() == 20
+    assert profiler.calls["padel.go_up"] == 1
+
+
+def test_instrument_module_functions():
+    profiler = Profiler(clock=FakeClock())
+    module = types.ModuleType("text")
+    module.flush = lambda: "flushed"
+
+    profiler.instrument("text", module, "flush")
+
+    assert module.flush() == "flushed"
+    assert profiler.calls["text.flush"] == 1
+
+
+def test_history_is_bounded():
+    profiler = Profiler(clock=FakeClock())
+    tick = profiler.wrap("tick", lambda: None)
+
+    for call in range(PHASE_HISTORY + 50):
+        tick()
+
+    assert profiler.calls["tick"] == PHASE_HISTORY + 50
+    assert len(profiler.durations["tick"]) == PHASE_HISTORY
+
+
+def test_histogram_buckets_by_powers_of_two():
+    profiler = Profiler()
+    for micros in (1, 3, 3, 100, 2000):
+        profiler.record("phase", 0.0, micros / 1e6)
+
+    counts = dict(profiler.histogram("phase"))
+
+    assert counts[2] == 1
+    assert counts[4] == 2
+    assert counts[128] == 1
+    assert counts[2048] == 1
+
+
+def test_game_loop_frames_contain_update_and_render(tmp_path):
+    screen = HeadlessScreen()
+    profiler = Profiler(clock=FakeClock())
+    updates = []
+
+    def update():
+        updates.append(1)
+        if len(updates) == 3:
+            loop.stop()
+
+    loop = GameLoop(screen, update, lambda: None, step=0.1, clock=screen.clock,
+                    profiler=profiler)
+    loop.start()
+    screen.mainloop()
+    profiler.dump(tmp_path / "trace.json")
+
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert [span["name"] for span in spans[:3]] == ["update", "render", "frame"]
+    frame, update_span = spans[2], spans[0]
+    assert frame["ts"] <= update_span["ts"]
+    assert update_span["ts"] + update_span["dur"] <= frame["ts"] + frame["dur"]
+    assert profiler.calls["frame"] == 3
+
+
+def test_disabled_by_default():
+    assert from_argv(["main.py"]) is None
+
+    update = lambda: None
+    loop = GameLoop(HeadlessScreen(), update, update)
+    assert loop.update is update
+    assert "tick" not in vars(loop)
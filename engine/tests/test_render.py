@@ -0,0 +1,149 @@
+"""
+TESTS FOR engine/render.py
+
+flush() should draw a sprite once when it appears, then only when it
+lands on a different pixel, changes look, or crosses the screen edge.
+The headless screen counts how many sprites each flush() drew.
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+import pytest
+from engine import render
+from engine.headless import HeadlessScreen, HeadlessTurtle
+from engine.render import Sprite, SpritePool, track
+from snake_game_template.snake import Snake
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture(autouse=True)
+def fresh_layer():
+    render.reset()
+    yield
+    render.reset()
+
+
+@pytest.fixture
+def screen():
+    screen = HeadlessScreen()
+    screen.setup(width=600, height=600)
+    return screen
+
+
+def draws(screen):
+    '''Sprites drawn by one flush().'''
+    before = screen.sprite_draws
+    render.flush(screen)
+    return screen.sprite_draws - before
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+def test_new_sprites_are_drawn_once(screen):
+    for count in range(3):
+        track(HeadlessTurtle("square"))
+
+    assert draws(screen) == 3
+    assert draws(screen) == 0
+    assert screen.updates == 2
+
+
+def test_only_moved_sprites_are_drawn(screen):
+    still, moving = track(HeadlessTurtle()), track(HeadlessTurtle())
+    render.flush(screen)
+
+    moving.forward(20)
+    still.goto(0, 0)
+
+    assert draws(screen) == 1
+
+
+def test_moves_within_a_pixel_are_skipped(screen):
+    sprite = track(HeadlessTurtle())
+    render.flush(screen)
+
+    sprite.goto(0.3, -0.2)
+    assert draws(screen) == 0
+    sprite.goto(1, 0)
+    assert draws(screen) == 1
+
+
+def test_sprites_off_screen_are_drawn_once_on_the_way_out(screen):
+    sprite = track(HeadlessTurtle())
+    render.flush(screen)
+
+    sprite.goto(1000, 1000)
+    assert draws(screen) == 1
+    sprite.goto(1020, 1000)
+    sprite.color("red")
+    assert draws(screen) == 0
+    sprite.goto(0, 0)
+    assert draws(screen) == 1
+
+
+def test_look_changes_are_drawn_but_reads_are_not(screen):
+    sprite = track(HeadlessTurtle())
+    render.flush(screen)
+
+    sprite.color()
+    sprite.shapesize()
+    assert draws(screen) == 0
+    sprite.color("red")
+    assert draws(screen) == 1
+    sprite.hideturtle()
+    assert draws(screen) == 1
+
+
+def test_hidden_sprites_are_drawn_once_then_left_alone(screen):
+    sprite = track(HeadlessTurtle())
+    render.flush(screen)
+
+    sprite.hideturtle()
+    assert draws(screen) == 1
+    sprite.goto(50, 50)
+    assert draws(screen) == 0
+    sprite.showturtle()
+    assert draws(screen) == 1
+
+
+def test_pool_reuses_released_sprites(screen):
+    pool = SpritePool(HeadlessTurtle)
+    first = pool.acquire()
+    pool.release(first)
+
+    assert not first.isvisible()
+    assert pool.acquire() is first
+    assert first.isvisible()
+    assert pool.acquire() is not first
+    assert pool.made == 2
+
+
+def test_tracked_turtles_keep_their_class():
+    class Car(HeadlessTurtle):
+        def honk(self):
+            return "honk"
+
+    first, second = track(Car()), track(Car())
+
+    assert isinstance(first, Sprite) and isinstance(first, Car)
+    assert type(first) is type(second)
+    assert first.honk() == "honk"
+    assert track(first) is first
+
+
+def test_a_snake_move_draws_one_segment(screen):
+    snake = Snake()
+    for i in range(50):
+        snake.extend()
+    snake.move()
+    assert draws(screen) == 53
+
+    snake.move()
+    assert draws(screen) == 1
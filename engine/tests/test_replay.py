@@ -0,0 +1,184 @@
+"""
+TESTS FOR engine/replay.py
+
+A session recorded with a Recorder and played back with a Replayer must
+go through exactly the same states. The tests record games by pressing
+keys on a HeadlessScreen between steps, then replay them into fresh game
+objects and compare.
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+import random
+import pytest
+from engine.headless import HeadlessScreen
+from engine.loop import GameLoop
+from engine.replay import (
+    Recorder, Recording, Replayer, decode_varint, encode_varint, from_argv,
+)
+
+
+# ============================================================================
+# FORMAT
+# ============================================================================
+
+def test_varints_round_trip():
+    for value in (0, 1, 127, 128, 300, 16384, 2 ** 40):
+        data = encode_varint(value)
+        assert decode_varint(data, 0) == (value, len(data))
+    assert encode_varint(300) == b"\xac\x02"
+
+
+def test_recording_round_trips_through_a_file(tmp_path):
+    recording = Recording(1234, 90, [(0, "Up"), (0, "Up"), (7, "Left"), (89, "Up")])
+    path = tmp_path / "game.rec"
+
+    recording.save(path)
+    loaded = Recording.load(path)
+
+    assert loaded.seed == 1234
+    assert loaded.frames == 90
+    assert loaded.events == recording.events
+
+
+def test_events_take_two_bytes_each():
+    """Frame deltas under 128 and a small key table fit in one byte each."""
+    rng = random.Random(5)
+    events = []
+    frame = 0
+    for press in range(1000):
+        frame += rng.randrange(20)
+        events.append((frame, rng.choice(["Up", "Down", "Left", "Right"])))
+
+    data = Recording(7, frame + 1, events).to_bytes()
+
+    assert len(data) < 2 * 1000 + 40
+
+
+def test_rejects_other_files():
+    with pytest.raises(ValueError):
+        Recording.from_bytes(b"not a recording")
+    with pytest.raises(ValueError):
+        Recording.from_bytes(Recording(99999, 5).to_bytes()[:6])
+
+
+def test_from_argv():
+    recorder = from_argv(["main.py", "--seed", "42", "--record", "out.rec"])
+
+    assert recorder.seed == 42
+    assert recorder.path == "out.rec"
+    assert not recorder.replaying
+
+
+def test_from_argv_replays(tmp_path):
+    path = tmp_path / "game.rec"
+    Recording(3, 10, [(4, "Up")]).save(path)
+
+    replayer = from_argv(["main.py", "--headless", "--replay", str(path)])
+
+    assert replayer.replaying
+    assert replayer.seed == 3
+    assert replayer.recording.events == [(4, "Up")]
+
+
+# ============================================================================
+# RECORD THEN REPLAY
+# ============================================================================
+
+def record_session(make_game, frames, keys, seed):
+    """Play frames steps, pressing a random key before some of them."""
+    screen = HeadlessScreen()
+    recorder = Recorder(seed=seed)
+    game = make_game(recorder, screen)
+    states = []
+    rng = random.Random(seed)
+    for frame in range(frames):
+        if rng.random() < 0.3:
+            screen.press(rng.choice(keys))
+        game.update()
+        states.append(game.state())
+    recorder.finish()
+    return recorder.recording, states
+
+
+class SnakeGame:
+    def __init__(self, session, screen):
+        from snake_game_template.snake import Snake
+        from snake_game_template.food import Food
+        self.snake = Snake()
+        self.food = Food(self.snake.free_cells, session.rng())
+        for key, turn in (("Up", self.snake.up), ("Down", self.snake.down),
+                          ("Left", self.snake.left), ("Right", self.snake.right)):
+            session.onkey(screen, turn, key)
+        self.update = session.wrap(self.play_frame)
+
+    def play_frame(self):
+        self.snake.move()
+        if self.snake.head_cell == self.food.cell:
+            self.food.refresh()
+            self.snake.extend()
+        if self.snake.hits_wall() or self.snake.hits_self():
+            self.snake.reset()
+
+    def state(self):
+        return (tuple(self.snake.body), self.food.cell)
+
+
+class CrossingGame:
+    def __init__(self, session, screen):
+        from turtle_crossing.game_objects.car_manager import CarManager
+        from turtle_crossing.game_objects.player import Player
+        self.player = Player()
+        self.car_manager = CarManager(rng=session.rng())
+        session.onkey(screen, self.player.go_up, "Up")
+        session.onkey(screen, self.player.go_dn, "Down")
+        self.update = session.wrap(self.play_frame)
+
+    def play_frame(self):
+        self.car_manager.create_car()
+        self.car_manager.move_cars()
+        if self.player.is_at_finishline():
+            self.player.goto_start()
+            self.car_manager.level_up()
+
+    def state(self):
+        active = self.car_manager.active
+        return (self.player.ycor(), tuple(self.car_manager.car_x[active]),
+                tuple(self.car_manager.car_y[active]))
+
+
+@pytest.mark.parametrize("make_game, keys", [
+    (SnakeGame, ["Up", "Down", "Left", "Right"]),
+    (CrossingGame, ["Up", "Down"]),
+])
+def test_replay_matches_recording(make_game, keys):
+    recording, recorded_states = record_session(make_game, 500, keys, seed=11)
+    assert len(recording.events) > 100
+
+    replayer = Replayer(Recording.from_bytes(recording.to_bytes()))
+    game = make_game(replayer, HeadlessScreen())
+    replayed_states = []
+    while not replayer.done:
+        game.update()
+        replayed_states.append(game.state())
+
+    assert replayed_states == recorded_states
+
+
+def test_replay_stops_the_game_loop():
+    screen = HeadlessScreen()
+    replayer = Replayer(Recording(0, 40, [(10, "Up"), (25, "Up")]))
+    pressed = []
+    steps = []
+    replayer.onkey(screen, lambda: pressed.append(len(steps)), "Up")
+
+    loop = GameLoop(screen, replayer.wrap(lambda: steps.append(screen.clock())),
+                    lambda: None, step=0.1, clock=screen.clock)
+    replayer.attach(loop)
+    loop.start()
+    screen.mainloop()
+
+    assert len(steps) == 40
+    assert pressed == [10, 25]
@@ -0,0 +1,97 @@
+"""
+TESTS FOR engine/text.py
+
+A Label should write its text once, then only change that same item's
+text, and only when the string is different from what is shown.
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+from engine import text
+from engine.headless import HeadlessTurtle
+from engine.text import Label
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+def test_nothing_is_drawn_until_flush():
+    turtle = HeadlessTurtle()
+    label = Label(turtle, (0, 270))
+
+    label.set("Score: 0")
+    assert turtle.items == []
+
+    text.flush()
+    assert turtle.items == [("Score: 0", (0, 270), "center", text.FONT)]
+
+
+def test_same_text_is_not_redrawn():
+    turtle = HeadlessTurtle()
+    label = Label(turtle, (0, 0))
+    label.set(3)
+    text.flush()
+
+    for frame in range(100):
+        label.set(3)
+        text.flush()
+
+    assert label.redraws == 1
+    assert text.pending == []
+
+
+def test_changes_in_one_frame_draw_once():
+    turtle = HeadlessTurtle()
+    label = Label(turtle, (0, 0))
+
+    for score in range(10):
+        label.set(score)
+    text.flush()
+
+    assert label.redraws == 1
+    assert [item[0] for item in turtle.items] == ["9"]
+
+
+def test_changing_back_before_flush_draws_nothing():
+    turtle = HeadlessTurtle()
+    label = Label(turtle, (0, 0))
+    label.set("1")
+    text.flush()
+
+    label.set("2")
+    label.set("1")
+    text.flush()
+
+    assert label.redraws == 1
+
+
+def test_redraw_reuses_the_item():
+    """Two labels on one turtle each keep their own item."""
+    turtle = HeadlessTurtle()
+    left = Label(turtle, (-100, 200))
+    right = Label(turtle, (100, 200))
+    left.set(0)
+    right.set(0)
+    text.flush()
+
+    right.set(1)
+    text.flush()
+
+    assert turtle.items == [("0", (-100, 200), "center", text.FONT),
+                            ("1", (100, 200), "center", text.FONT)]
+
+
+def test_label_without_a_turtle_draws_once_attached():
+    label = Label(None, (0, 0))
+    label.set("Level: 1")
+    text.flush()
+
+    turtle = HeadlessTurtle()
+    label.attach(turtle)
+    assert turtle.items == []
+    text.flush()
+
+    assert turtle.items == [("Level: 1", (0, 0), "center", text.FONT)]
@@ -0,0 +1,75 @@
+"""Text that is only redrawn when it changes.
+
+turtle's write() makes a new canvas text item on every call and clear()
+deletes them all again, so a scoreboard doing clear() + write() on every
+update lays out its big font from scratch each time. A Label remembers
+the string it shows: set() only queues a redraw when the string changes,
+flush() redraws everything queued once per frame, and a redraw changes
+the text of the label's existing canvas item instead of making a new one.
+"""
+from engine.backend import set_text
+
+FONT = ("Courier", 24, "normal")
+
+pending = []
+
+
+class Label:
+    '''One line of text written by turtle at position.
+
+    Several labels can share a turtle. The turtle must not be cleared
+    while its labels are in use, since that deletes their canvas items.
+    A label made without a turtle keeps its text but draws nothing until
+    attach() gives it one.
+    '''
+
+    def __init__(self, turtle, position, align="center", font=FONT):
+        self.turtle = turtle
+        self.position = position
+        self.align = align
+        self.font = font
+        self.text = None
+        self.shown = None
+        self.item = None
+        self.queued = False
+        self.redraws = 0
+
+    def set(self, text):
+        '''Show text from the next flush(), if it isn't shown already.'''
+        text = str(text)
+        if text == self.text:
+            return
+        self.text = text
+        if not self.queued:
+            self.queued = True
+            pending.append(self)
+
+    def attach(self, turtle):
+        '''Write with turtle from the next flush() on.'''
+        self.turtle = turtle
+        self.item = None
+        self.shown = None
+        if self.text is not None and not self.queued:
+            self.queued = True
+            pending.append(self)
+
+    def draw(self):
+        self.queued = False
+        if self.turtle is None or self.text == self.shown:
+            return
+        if self.item is None:
+            self.turtle.goto(self.position)
+            self.turtle.write(self.text, align=self.align, font=self.font)
+            self.item = self.turtle.items[-1]
+        else:
+            self.item = set_text(self.turtle, self.item, self.text)
+        self.shown = self.text
+        self.redraws += 1
+
+
+def flush():
+    '''Redraw every label whose text changed since the last flush.'''
+    labels = pending[:]
+    del pending[:]
+    for label in labels:
+        label.draw()
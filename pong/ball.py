@@ -1,28 +1,15 @@
-from turtle import Turtle
+from engine.entity import Entity
+from pong.physics import (
+    BallMotion, BALL_RADIUS, WALL_Y, MAX_BOUNCES, BASE_SPEED, SPEED_UP, MAX_SPEED,
+)
+
+
+class Ball(BallMotion, Entity):
+    __slots__ = ("x_move", "y_move", "course")
 
-class Ball(Turtle):
     def __init__(self):
-        super().__init__()
+        Entity.__init__(self)
+        BallMotion.__init__(self)
         self.color('yellow')
         self.shape('circle')
         self.penup()
-        self.x_move = 10
-        self.y_move = 10
-        self.move_speed = 0.1
-
-    def move(self):
-        x_cor_new = self.xcor() + self.x_move
-        y_cor_new = self.ycor() + self.y_move
-        self.goto(x_cor_new,y_cor_new)
-
-    def bounce_y(self):
-        self.y_move *= -1
-
-    def bounce_x(self):
-        self.x_move *= -1
-        self.move_speed *= 0.9
-    
-    def reset(self):
-        self.goto(0,0)
-        self.bounce_x()
-        self.move_speed = 0.1   
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""A CPU player for one padel.
+
+Between bounces the ball flies in a straight line, so where it will
+reach a padel is plain arithmetic: follow the line to the padel's face
+as if there were no walls, then fold that y back between the walls, each
+wall acting as a mirror. Nothing is simulated, and the answer only
+changes when the ball changes course (a bounce or a serve, see
+BallMotion.course), so it is worked out once per course and each frame
+costs the CPU a comparison and a step of its padel.
+"""
+import argparse
+import math
+from pong.physics import BALL_RADIUS, PADEL_HALF_WIDTH, PADEL_STEP, WALL_Y
+
+# Don't chase the last few pixels, the padel moves PADEL_STEP at a time.
+DEAD_ZONE = PADEL_STEP / 2
+
+
+def fold(y, low=-WALL_Y, high=WALL_Y):
+    '''Where a ball that would be at y with no walls is, bouncing between
+    low and high.'''
+    span = high - low
+    y = (y - low) % (2 * span)
+    if y > span:
+        y = 2 * span - y
+    return low + y
+
+
+def intercept(x, y, x_move, y_move, target_x):
+    '''y at which a ball at (x, y), moving (x_move, y_move) a step, gets to
+    target_x bouncing off the walls on the way, or None if it never does.'''
+    if x_move == 0 or (target_x - x) * x_move < 0:
+        return None
+    return fold(y + y_move * (target_x - x) / x_move)
+
+
+class CpuPlayer:
+    '''Moves padel to where the ball will reach it, and back to the middle
+    while the ball is heading the other way.'''
+
+    def __init__(self, padel, dead_zone=DEAD_ZONE):
+        self.padel = padel
+        self.dead_zone = dead_zone
+        # x of the ball's centre when it touches the padel's face.
+        x = padel.xcor()
+        self.face_x = x - math.copysign(PADEL_HALF_WIDTH + BALL_RADIUS, x)
+        self.ball = None
+        self.course = None
+        self.target = 0.0
+        self.predictions = 0
+
+    def predict(self, ball):
+        '''y the padel should be at, worked out again only when the ball
+        has changed course since last time.'''
+        if ball is not self.ball or ball.course != self.course:
+            self.ball = ball
+            self.course = ball.course
+            target = intercept(ball.xcor(), ball.ycor(), ball.x_move, ball.y_move, self.face_x)
+            self.target = 0.0 if target is None else target
+            self.predictions += 1
+        return self.target
+
+    def move(self, ball):
+        '''1 to go up, -1 to go down or 0 to stay.'''
+        target = self.predict(ball)
+        y = self.padel.ycor()
+        if target > y + self.dead_zone:
+            return 1
+        if target < y - self.dead_zone:
+            return -1
+        return 0
+
+    def play(self, ball):
+        move = self.move(ball)
+        if move > 0:
+            self.padel.go_up()
+        elif move < 0:
+            self.padel.go_dn()
+
+
+def from_argv(argv, padel):
+    '''A CpuPlayer for padel for --cpu, otherwise None.'''
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--cpu", action="store_true")
+    args, unknown = parser.parse_known_args(argv[1:])
+    return CpuPlayer(padel) if args.cpu else None
@@ -1,8 +1,18 @@
-from turtle import Screen, Turtle
-import padel
-import ball
-import time
-import scoreboard
+import pathlib
+import sys
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+from engine.backend import Screen, clock
+from engine.input import InputQueue
+from engine.loop import GameLoop
+import engine.entity as entity
+import engine.profiler as profiling
+import engine.render as render
+import engine.replay as replay
+import engine.text as text
+import pong.padel as padel
+import pong.ball as ball
+import pong.cpu as cpu
+import pong.scoreboard as scoreboard
 
 screen = Screen()
 screen.bgcolor("blue")
@@ -12,43 +22,68 @@ screen.tracer(0)
 
 PADEL_POS_R = (350,0)
 PADEL_POS_L = (-350,0)
+STEP = 0.1
 
+session = replay.from_argv(sys.argv)
 padel_r = padel.Padel(PADEL_POS_R)
 padel_l = padel.Padel(PADEL_POS_L)
 ball    = ball.Ball()
+for game_object in (padel_r, padel_l, ball):
+    game_object.attach_view()
 scoreboard = scoreboard.Scoreboard()
+scoreboard.attach_view()
+# --cpu: the computer plays the left padel.
+cpu_player = cpu.from_argv(sys.argv, padel_l)
 
-screen.listen()
+profiler = profiling.from_argv(sys.argv)
+if profiler is not None:
+    profiler.instrument("padel_r", padel_r, "go_up", "go_dn")
+    profiler.instrument("padel_l", padel_l, "go_up", "go_dn")
+    profiler.instrument("ball", ball, "move", "reset")
+    profiler.instrument("scoreboard", scoreboard, "point_l", "point_r")
+    profiler.instrument("text", text, "flush")
+    profiler.instrument("render", render, "flush")
+    if cpu_player is not None:
+        profiler.instrument("cpu", cpu_player, "play")
 
-screen.onkey(padel_r.go_up, "Up")
-screen.onkey(padel_r.go_dn, "Down")
-screen.onkey(padel_l.go_up, 'w')
-screen.onkey(padel_l.go_dn, 's')
+screen.listen()
 
+inputs = InputQueue(session, screen, clock)
+inputs.hold(padel_r.go_up, "Up")
+inputs.hold(padel_r.go_dn, "Down")
+inputs.hold(padel_l.go_up, 'w')
+inputs.hold(padel_l.go_dn, 's')
 
 
-game_is_on = True
-while game_is_on:
-    time.sleep(ball.move_speed)
-    screen.update()
-    ball.move()
 
-    if ball.ycor() > 280 or ball.ycor() < -280:
-        ball.bounce_y()
-    
-    if ball.distance(padel_r) < 55 and ball.xcor() > 320\
-        or ball.distance(padel_l) < 55 and ball.xcor() < -320:
-        ball.bounce_x()
+def play_frame():
+    if cpu_player is not None:
+        cpu_player.play(ball)
+    ball.move((padel_l, padel_r))
 
     if ball.xcor() > 400:
         ball.reset()
         scoreboard.point_l()
-        scoreboard.update_scoreboard()
 
 
     if ball.xcor() < -400:
         ball.reset()
         scoreboard.point_r()
-        scoreboard.update_scoreboard()
 
-screen.exitonclick()
\ No newline at end of file
+
+def draw_frame():
+    entity.flush()
+    text.flush()
+    render.flush(screen)
+
+
+game_loop = GameLoop(screen, session.wrap(inputs.wrap(play_frame)), draw_frame, step=STEP, clock=clock,
+                     profiler=profiler)
+session.attach(game_loop)
+game_loop.start()
+screen.exitonclick()
+session.finish()
+print(game_loop.report())
+print(inputs.report())
+if profiler is not None:
+    print(profiler.report())
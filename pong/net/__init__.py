@@ -0,0 +1,17 @@
+"""Two-player pong over UDP.
+
+    python -m pong.net server --port 9999
+    python -m pong.net client --host 127.0.0.1 --port 9999
+
+The server is authoritative: it runs the one real Match, applies each
+player's inputs and sends every player a snapshot of the state each
+tick, as a delta against the last snapshot that player acknowledged
+(see protocol). Clients show their own padel moving as soon as a key is
+held and carry the ball on between snapshots; when a snapshot comes in
+they take its state and replay the inputs the server hadn't seen yet
+(see client).
+
+transport.Link counts the bytes each side sends and receives, and can
+delay and drop packets to try the game on localhost as if it were
+played over a bad connection.
+"""
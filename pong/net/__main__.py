@@ -0,0 +1,141 @@
+"""python -m pong.net server|client, see pong.net."""
+import argparse
+import asyncio
+import random
+import sys
+from pong.net.server import TICK, start_server
+
+DEFAULT_PORT = 9999
+
+
+def add_link_options(parser):
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="delay every packet sent by this many ms")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="and by up to this many ms more")
+    parser.add_argument("--loss", type=float, default=0.0,
+                        help="drop this fraction of the packets sent")
+
+
+def link_options(args):
+    return {"latency": args.latency / 1000, "jitter": args.jitter / 1000, "loss": args.loss}
+
+
+async def serve(args):
+    server = await start_server(args.host, args.port, tick=args.tick,
+                                link_options=link_options(args))
+    print(f"serving pong on {args.host}:{args.port}, waiting for two players")
+    try:
+        await server.run(args.ticks)
+    finally:
+        print(server.report())
+
+
+async def play(args):
+    from pong.net.client import connect
+    client = await connect(args.host, args.port, link_options=link_options(args))
+    side = await client.join(args.tick)
+    print(f"playing the {('left', 'right')[side]} padel")
+    if args.bot:
+        from tournament.agents import PONG_AGENTS
+        control = bot_control(PONG_AGENTS[args.bot](random.Random()))
+        await client.run(control, args.ticks or 10 ** 9, args.tick)
+    else:
+        await play_on_screen(client, args.tick)
+    print(client.report())
+
+
+class MoveRecorder:
+    '''Stands in for a padel for an agent, turning go_up/go_dn into a move.'''
+    def __init__(self, padel):
+        self.padel = padel
+        self.move = 0
+
+    def xcor(self):
+        return self.padel.xcor()
+
+    def ycor(self):
+        return self.padel.ycor()
+
+    def go_up(self):
+        self.move = 1
+
+    def go_dn(self):
+        self.move = -1
+
+
+def bot_control(agent):
+    recorders = {}
+
+    def control(client):
+        padel = client.match.padel(client.side)
+        recorder = recorders.get(padel)
+        if recorder is None:
+            recorder = recorders[padel] = MoveRecorder(padel)
+        recorder.move = 0
+        agent(recorder, client.match.ball)
+        return recorder.move
+    return control
+
+
+async def play_on_screen(client, tick):
+    from engine.backend import Screen, clock
+    from engine.input import InputQueue
+    from engine.replay import Recorder
+    import engine.entity as entity
+    import engine.render as render
+    import engine.text as text
+    from pong.scoreboard import Scoreboard
+
+    screen = Screen()
+    screen.bgcolor("blue")
+    screen.setup(width=800, height=600)
+    screen.title(f"Ping Pong ({('left', 'right')[client.side]})")
+    screen.tracer(0)
+    match = client.match
+    for game_object in (match.padel_r, match.padel_l, match.ball):
+        game_object.attach_view()
+    scoreboard = Scoreboard()
+    scoreboard.attach_view()
+    screen.listen()
+
+    moves = []
+    inputs = InputQueue(Recorder(), screen, clock)
+    inputs.hold(lambda: moves.append(1), "Up")
+    inputs.hold(lambda: moves.append(-1), "Down")
+
+    loop = asyncio.get_event_loop()
+    next_tick = loop.time()
+    while True:
+        del moves[:]
+        inputs.apply()
+        client.step(sum(moves))
+        scoreboard.score_l, scoreboard.score_r = match.score_l, match.score_r
+        scoreboard.update_scoreboard()
+        entity.flush()
+        text.flush()
+        # Also handles the Tk events, keys included.
+        render.flush(screen)
+        next_tick += tick
+        await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m pong.net")
+    parser.add_argument("role", choices=("server", "client"))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--tick", type=float, default=TICK, help="seconds per tick")
+    parser.add_argument("--ticks", type=int, default=None, help="stop after this many ticks")
+    parser.add_argument("--bot", help="let a pong agent from tournament.agents play")
+    add_link_options(parser)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.get_event_loop().run_until_complete(serve(args) if args.role == "server" else play(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""A pong client that predicts its own padel.
+
+Every tick the client moves its own padel straight away, carries the
+ball on with the same rules, and sends the server its input along with
+every earlier one the server hasn't acknowledged. A SNAPSHOT replaces
+the predicted state with the server's, then the inputs the server
+hadn't applied yet are played again on top (reconciliation), so the
+padel the player steers never waits for a round trip.
+"""
+import asyncio
+import collections
+import time
+from pong.net import protocol
+from pong.net.match import Match
+from pong.net.server import HISTORY, TICK
+from pong.net.transport import Link
+
+
+class PongClient(asyncio.DatagramProtocol):
+    def __init__(self, link_options=None, clock=time.perf_counter):
+        self.link_options = link_options or {}
+        self.clock = clock
+        self.match = Match()
+        self.side = None
+        self.joined = None
+        self.seq = 0
+        self.pending = collections.deque()
+        self.states = collections.OrderedDict()
+        self.server_tick = 0
+        self.acked_seq = 0
+        self.corrections = 0
+        self.link = None
+
+    def connection_made(self, transport):
+        self.link = Link(transport, clock=self.clock, **self.link_options)
+        self.joined = asyncio.get_event_loop().create_future()
+
+    def datagram_received(self, data, addr):
+        self.link.received(data)
+        packet_kind = protocol.kind(data)
+        if packet_kind == protocol.WELCOME and self.side is None:
+            self.side = protocol.decode_welcome(data)
+            self.joined.set_result(self.side)
+        elif packet_kind == protocol.SNAPSHOT and self.side is not None:
+            self.on_snapshot(*protocol.decode_snapshot(data))
+
+    def on_snapshot(self, tick, base_tick, ack_seq, changes):
+        if tick <= self.server_tick:
+            return      # arrived after a newer one
+        if base_tick and base_tick not in self.states:
+            return      # diffed against a state we no longer have
+        state = protocol.patch(self.states.get(base_tick), changes)
+        self.states[tick] = state
+        while len(self.states) > HISTORY:
+            self.states.popitem(last=False)
+        self.server_tick = tick
+        self.reconcile(state, ack_seq)
+
+    def reconcile(self, state, ack_seq):
+        '''Take the server's state, then replay the inputs it hasn't seen.'''
+        padel = self.match.padel(self.side)
+        predicted = padel.y
+        while self.pending and self.pending[0][0] <= ack_seq:
+            self.pending.popleft()
+        self.acked_seq = max(self.acked_seq, ack_seq)
+        self.match.load(state)
+        for seq, move in self.pending:
+            self.match.steer(self.side, move)
+        if padel.y != predicted:
+            self.corrections += 1
+
+    async def join(self, retry=TICK):
+        '''Say HELLO until the server answers with our side.'''
+        while not self.joined.done():
+            self.link.sendto(protocol.encode_hello())
+            try:
+                await asyncio.wait_for(asyncio.shield(self.joined), retry)
+            except asyncio.TimeoutError:
+                pass
+        return self.side
+
+    def step(self, move):
+        '''One client tick: move our padel by move (1 up, -1 down, 0),
+        carry the ball on and send the input.'''
+        self.seq += 1
+        self.pending.append((self.seq, move))
+        self.match.steer(self.side, move)
+        self.match.step(scoring=False)
+        self.link.sendto(protocol.encode_input(self.server_tick, list(self.pending)))
+
+    async def run(self, control, ticks, tick=TICK):
+        '''Join, then play ticks ticks with control(client) giving each move.'''
+        await self.join(tick)
+        loop = asyncio.get_event_loop()
+        next_tick = loop.time()
+        for count in range(ticks):
+            self.step(control(self))
+            next_tick += tick
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+    def summary(self):
+        return dict(self.link.summary(), server_tick=self.server_tick,
+                    unacked_inputs=len(self.pending), corrections=self.corrections)
+
+    def report(self):
+        return ("tick {server_tick}, sent {sent_bytes_per_s:.0f} B/s, received "
+                "{received_bytes_per_s:.0f} B/s, {packets_dropped} packets dropped, "
+                "{corrections} corrections".format(**self.summary()))
+
+
+async def connect(host, port, **options):
+    loop = asyncio.get_event_loop()
+    transport, client = await loop.create_datagram_endpoint(
+        lambda: PongClient(**options), remote_addr=(host, port))
+    return client
@@ -0,0 +1,58 @@
+"""The pong rules of main.py, as state the server and clients share."""
+from pong.ball import Ball
+from pong.padel import Padel
+from pong.net.protocol import State, quantize
+
+PADEL_POS_R = (350, 0)
+PADEL_POS_L = (-350, 0)
+LEFT = 0
+RIGHT = 1
+
+
+class Match:
+    '''Ball, padels and score of one game, without any drawing.'''
+
+    def __init__(self):
+        self.padel_l = Padel(PADEL_POS_L)
+        self.padel_r = Padel(PADEL_POS_R)
+        self.ball = Ball()
+        self.score_l = 0
+        self.score_r = 0
+
+    def padel(self, side):
+        return self.padel_r if side == RIGHT else self.padel_l
+
+    def steer(self, side, move):
+        if move > 0:
+            self.padel(side).go_up()
+        elif move < 0:
+            self.padel(side).go_dn()
+
+    def step(self, scoring=True):
+        '''One step of main.py's play_frame(). Without scoring the ball
+        just flies on past the edge, for a client waiting to hear from
+        the server who scored.'''
+        self.ball.move((self.padel_l, self.padel_r))
+        if not scoring:
+            return
+        if self.ball.x > 400:
+            self.ball.reset()
+            self.score_l += 1
+        if self.ball.x < -400:
+            self.ball.reset()
+            self.score_r += 1
+
+    def state(self):
+        ball = self.ball
+        return quantize(State(ball.x, ball.y, ball.x_move, ball.y_move,
+                              self.padel_l.y, self.padel_r.y, self.score_l, self.score_r))
+
+    def load(self, state):
+        self.ball.goto(state.ball_x, state.ball_y)
+        self.ball.x_move = state.x_move
+        self.ball.y_move = state.y_move
+        self.ball.course += 1
+        self.padel_l.sety(state.padel_l)
+        self.padel_r.sety(state.padel_r)
+        self.score_l = state.score_l
+        self.score_r = state.score_r
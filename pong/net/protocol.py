@@ -0,0 +1,108 @@
+"""Packets of networked pong.
+
+Every packet starts with its kind byte. Integers are little-endian.
+
+    HELLO     client -> server   kind
+    WELCOME   server -> client   kind, side (0 left, 1 right)
+    INPUT     client -> server   kind, last snapshot tick received (u32),
+                                 count (u8), count x (input seq (u32),
+                                 move (i8): 1 up, -1 down, 0 still)
+    SNAPSHOT  server -> client   kind, tick (u32), base tick (u32),
+                                 last input seq applied (u32),
+                                 field mask (u8), changed fields
+
+An INPUT repeats the inputs the server hasn't acknowledged yet, so one
+lost packet loses nothing. A SNAPSHOT only carries the fields that differ
+from the state at its base tick, one mask bit per field of State in
+order; base tick 0 means every field is sent. Positions and speeds are
+float32, so states are quantize()d before they are compared or sent.
+"""
+import collections
+import struct
+
+HELLO = 1
+WELCOME = 2
+INPUT = 3
+SNAPSHOT = 4
+
+State = collections.namedtuple(
+    "State", "ball_x ball_y x_move y_move padel_l padel_r score_l score_r")
+FIELD_FORMATS = tuple(struct.Struct(fmt) for fmt in ("<f",) * 6 + ("<H",) * 2)
+FLOAT32 = struct.Struct("<f")
+
+WELCOME_PACKET = struct.Struct("<BB")
+INPUT_HEADER = struct.Struct("<BIB")
+INPUT_ENTRY = struct.Struct("<Ib")
+SNAPSHOT_HEADER = struct.Struct("<BIIIB")
+# More unacknowledged inputs than this aren't resent.
+MAX_INPUTS_PER_PACKET = 16
+
+
+def kind(data):
+    return data[0] if data else None
+
+
+def quantize(state):
+    '''state as it comes out of a SNAPSHOT.'''
+    return State(*(FLOAT32.unpack(FLOAT32.pack(value))[0] for value in state[:6]),
+                 *state[6:])
+
+
+def encode_hello():
+    return bytes([HELLO])
+
+
+def encode_welcome(side):
+    return WELCOME_PACKET.pack(WELCOME, side)
+
+
+def decode_welcome(data):
+    return WELCOME_PACKET.unpack(data)[1]
+
+
+def encode_input(ack_tick, inputs):
+    '''inputs is a list of (seq, move), oldest first.'''
+    inputs = inputs[-MAX_INPUTS_PER_PACKET:]
+    return INPUT_HEADER.pack(INPUT, ack_tick, len(inputs)) + b"".join(
+        INPUT_ENTRY.pack(seq, move) for seq, move in inputs)
+
+
+def decode_input(data):
+    '''(ack tick, [(seq, move), ...]).'''
+    packet_kind, ack_tick, count = INPUT_HEADER.unpack_from(data)
+    inputs = [INPUT_ENTRY.unpack_from(data, INPUT_HEADER.size + i * INPUT_ENTRY.size)
+              for i in range(count)]
+    return ack_tick, inputs
+
+
+def encode_snapshot(tick, ack_seq, state, base_tick=0, base=None):
+    '''A SNAPSHOT of state, with only the fields that differ from base.'''
+    mask = 0
+    fields = []
+    for index, (value, field) in enumerate(zip(state, FIELD_FORMATS)):
+        if base is None or base[index] != value:
+            mask |= 1 << index
+            fields.append(field.pack(value))
+    if base is None:
+        base_tick = 0
+    return SNAPSHOT_HEADER.pack(SNAPSHOT, tick, base_tick, ack_seq, mask) + b"".join(fields)
+
+
+def decode_snapshot(data):
+    '''(tick, base tick, last input seq applied, {field index: value}).'''
+    packet_kind, tick, base_tick, ack_seq, mask = SNAPSHOT_HEADER.unpack_from(data)
+    pos = SNAPSHOT_HEADER.size
+    changes = {}
+    for index, field in enumerate(FIELD_FORMATS):
+        if mask & (1 << index):
+            changes[index] = field.unpack_from(data, pos)[0]
+            pos += field.size
+    return tick, base_tick, ack_seq, changes
+
+
+def patch(base, changes):
+    '''The state a snapshot describes, from its base state and changes.'''
+    values = list(base) if base is not None else [0] * len(FIELD_FORMATS)
+    for index, value in changes.items():
+        values[index] = value
+    return State(*values)
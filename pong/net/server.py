@@ -0,0 +1,133 @@
+"""The authoritative pong server.
+
+The first two addresses to say HELLO get the left and right padel. Once
+both have joined, every tick the server applies each player's next
+inputs, plays one step of the Match and sends each player a SNAPSHOT,
+as a delta against the last tick that player said it received.
+"""
+import asyncio
+import collections
+import time
+from engine.stats import mean, percentile
+from pong.net import protocol
+from pong.net.match import LEFT, RIGHT, Match
+from pong.net.transport import Link
+
+TICK = 0.1
+# Snapshots kept to diff against; older acks get a full snapshot.
+HISTORY = 64
+TICK_HISTORY = 600
+# A player whose packets were held up catches up by this many inputs a tick.
+MAX_INPUTS_PER_TICK = 2
+
+
+class Player:
+    def __init__(self, side):
+        self.side = side
+        self.inputs = {}
+        self.last_seq = 0
+        self.acked_tick = 0
+
+
+class PongServer(asyncio.DatagramProtocol):
+    def __init__(self, tick=TICK, players_needed=2, link_options=None,
+                 clock=time.perf_counter):
+        self.tick_length = tick
+        self.players_needed = players_needed
+        self.link_options = link_options or {}
+        self.clock = clock
+        self.match = Match()
+        self.players = {}
+        self.tick = 0
+        self.history = collections.OrderedDict()
+        self.tick_times = collections.deque(maxlen=TICK_HISTORY)
+        self.link = None
+        self.running = True
+
+    def connection_made(self, transport):
+        self.link = Link(transport, clock=self.clock, **self.link_options)
+
+    def datagram_received(self, data, addr):
+        self.link.received(data)
+        packet_kind = protocol.kind(data)
+        if packet_kind == protocol.HELLO:
+            self.join(addr)
+        elif packet_kind == protocol.INPUT and addr in self.players:
+            player = self.players[addr]
+            ack_tick, inputs = protocol.decode_input(data)
+            player.acked_tick = max(player.acked_tick, ack_tick)
+            for seq, move in inputs:
+                if seq > player.last_seq:
+                    player.inputs[seq] = move
+
+    def join(self, addr):
+        player = self.players.get(addr)
+        if player is None:
+            if len(self.players) == self.players_needed:
+                return
+            player = self.players[addr] = Player((LEFT, RIGHT)[len(self.players)])
+        # Sent again for every HELLO, in case the WELCOME was lost.
+        self.link.sendto(protocol.encode_welcome(player.side), addr)
+
+    @property
+    def ready(self):
+        return len(self.players) == self.players_needed
+
+    def apply_inputs(self, player):
+        for seq in sorted(player.inputs)[:MAX_INPUTS_PER_TICK]:
+            self.match.steer(player.side, player.inputs.pop(seq))
+            player.last_seq = seq
+
+    def step(self):
+        '''One server tick.'''
+        started = self.clock()
+        for player in self.players.values():
+            self.apply_inputs(player)
+        self.match.step()
+        self.tick += 1
+        state = self.match.state()
+        self.history[self.tick] = state
+        if len(self.history) > HISTORY:
+            self.history.popitem(last=False)
+        for addr, player in self.players.items():
+            base = self.history.get(player.acked_tick)
+            self.link.sendto(protocol.encode_snapshot(
+                self.tick, player.last_seq, state, player.acked_tick, base), addr)
+        self.tick_times.append(self.clock() - started)
+
+    async def run(self, ticks=None):
+        '''Tick every tick_length seconds once the players are in, ticks
+        times or until stop().'''
+        loop = asyncio.get_event_loop()
+        next_tick = loop.time()
+        while self.running and (ticks is None or self.tick < ticks):
+            if self.ready:
+                self.step()
+            next_tick += self.tick_length
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+    def stop(self):
+        self.running = False
+
+    def summary(self):
+        recent = list(self.tick_times)
+        return dict(self.link.summary(), ticks=self.tick,
+                    tick_mean_ms=mean(recent) * 1000,
+                    tick_p95_ms=percentile(recent, 95) * 1000)
+
+    def report(self):
+        return ("{ticks} ticks, tick {tick_mean_ms:.3f} ms mean / {tick_p95_ms:.3f} ms p95, "
+                "sent {sent_bytes_per_s:.0f} B/s, received {received_bytes_per_s:.0f} B/s"
+                .format(**self.summary()))
+
+
+async def start_server(host="127.0.0.1", port=0, **options):
+    '''A PongServer listening on host:port (port 0 picks a free one).'''
+    loop = asyncio.get_event_loop()
+    transport, server = await loop.create_datagram_endpoint(
+        lambda: PongServer(**options), local_addr=(host, port))
+    return server
+
+
+def address(server):
+    return server.link.transport.get_extra_info("sockname")[:2]
@@ -0,0 +1,66 @@
+"""A datagram transport that counts traffic and can be made unreliable.
+
+Link wraps the transport asyncio hands a DatagramProtocol. Everything
+sent through it is counted, and with latency, jitter or loss set it
+delays each packet by latency plus up to jitter seconds (so packets can
+arrive out of order) and drops a loss fraction of them, for trying the
+game on localhost as if over a real network.
+"""
+import asyncio
+import random
+import time
+
+
+class Link:
+    def __init__(self, transport, latency=0.0, jitter=0.0, loss=0.0, rng=None,
+                 clock=time.perf_counter):
+        self.transport = transport
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.rng = rng if rng is not None else random.Random()
+        self.clock = clock
+        self.started = clock()
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.packets_sent = 0
+        self.packets_received = 0
+        self.packets_dropped = 0
+
+    def sendto(self, data, addr=None):
+        self.bytes_sent += len(data)
+        self.packets_sent += 1
+        if self.loss and self.rng.random() < self.loss:
+            self.packets_dropped += 1
+            return
+        delay = self.latency + (self.rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            asyncio.get_event_loop().call_later(delay, self.send_now, data, addr)
+        else:
+            self.send_now(data, addr)
+
+    def send_now(self, data, addr):
+        if self.transport.is_closing():
+            return
+        if addr is None:
+            self.transport.sendto(data)
+        else:
+            self.transport.sendto(data, addr)
+
+    def received(self, data):
+        self.bytes_received += len(data)
+        self.packets_received += 1
+
+    def close(self):
+        self.transport.close()
+
+    def summary(self):
+        '''Traffic per second since the link was made.'''
+        elapsed = max(self.clock() - self.started, 1e-9)
+        return {
+            "sent_bytes_per_s": self.bytes_sent / elapsed,
+            "received_bytes_per_s": self.bytes_received / elapsed,
+            "packets_sent": self.packets_sent,
+            "packets_received": self.packets_received,
+            "packets_dropped": self.packets_dropped,
+        }
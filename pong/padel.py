@@ -1,6 +1,10 @@
-from turtle import Turtle
+from engine.entity import Entity
+from pong.physics import PADEL_HALF_HEIGHT, PADEL_HALF_WIDTH, PADEL_STEP, padel_bounds
+
+
+class Padel(Entity):
+    __slots__ = ()
 
-class Padel(Turtle):
     def __init__(self, position):
         super().__init__()
         self.shape("square")
@@ -10,9 +14,11 @@ class Padel(Turtle):
         self.goto(position)
 
     def go_up(self):
-        new_y = self.ycor()+20
-        self.sety(new_y)
+        self.sety(self.y + PADEL_STEP)
     
     def go_dn(self):
-        new_y = self.ycor()-20
-        self.sety(new_y)
\ No newline at end of file
+        self.sety(self.y - PADEL_STEP)
+
+    def bounds(self):
+        '''(left, bottom, right, top) of the paddle.'''
+        return padel_bounds((self.x, self.y))
@@ -0,0 +1,132 @@
+"""How the pong ball and padels move and collide, without any drawing.
+
+Nothing here imports turtle. BallMotion only needs x, y and goto(),
+which Ball gets from engine.entity.Entity.
+"""
+import math
+from engine.collision import sweep_point_rect, sweep_wall
+
+BALL_RADIUS = 10
+WALL_Y = 280
+MAX_BOUNCES = 4
+BASE_SPEED = 10.0
+# Each padel hit makes the ball as much faster as shortening the loop's
+# sleep by 10% used to.
+SPEED_UP = 1 / 0.9
+# Padel hits stop speeding the ball up past this many px per step.
+MAX_SPEED = 60.0
+PADEL_HALF_HEIGHT = 50
+PADEL_HALF_WIDTH = 10
+PADEL_STEP = 20
+# A serve with a rng starts this far above or below the middle at most.
+SERVE_HEIGHT = 200
+
+
+def padel_bounds(position):
+    '''(left, bottom, right, top) of a padel centred on position.'''
+    x, y = position
+    return (x - PADEL_HALF_WIDTH, y - PADEL_HALF_HEIGHT,
+            x + PADEL_HALF_WIDTH, y + PADEL_HALF_HEIGHT)
+
+
+class BallMotion:
+    # Users list x_move, y_move and course in their own __slots__.
+    __slots__ = ()
+
+    def __init__(self):
+        self.x_move = BASE_SPEED
+        self.y_move = BASE_SPEED
+        # Goes up by one whenever the ball changes direction, so anything
+        # worked out from its straight-line course stays right until then.
+        self.course = 0
+
+    def move(self, padels=()):
+        '''Move one step, bouncing off the walls and padels on the way.
+
+        Collisions are swept along the whole step, so the ball bounces at
+        the exact point it touches a wall or padel however far it moves in
+        one step, and then carries on for the rest of the step.
+        '''
+        x, y = self.push_out(padels)
+        remaining = 1.0
+        # After MAX_BOUNCES bounces in one step the rest of the step is
+        # dropped and the ball waits at its last bounce for the next one.
+        for bounce in range(MAX_BOUNCES):
+            dx = self.x_move * remaining
+            dy = self.y_move * remaining
+            hit_time = sweep_wall(y, dy, -WALL_Y, WALL_Y)
+            hit_axis = "y"
+            for padel in padels:
+                left, bottom, right, top = padel.bounds()
+                if max(x, x + dx) < left - BALL_RADIUS or min(x, x + dx) > right + BALL_RADIUS:
+                    continue
+                hit = sweep_point_rect(x, y, dx, dy,
+                                       left - BALL_RADIUS, bottom - BALL_RADIUS,
+                                       right + BALL_RADIUS, top + BALL_RADIUS)
+                if hit is not None and (hit_time is None or hit.time < hit_time):
+                    hit_time, hit_axis = hit.time, hit.axis
+            if hit_time is None:
+                x += dx
+                y += dy
+                break
+            x += dx * hit_time
+            y += dy * hit_time
+            remaining *= 1 - hit_time
+            if hit_axis == "x":
+                self.bounce_x()
+            else:
+                self.bounce_y()
+        self.goto(x, y)
+
+    def push_out(self, padels):
+        '''(x, y) of the ball, moved out of any padel that moved onto it.
+
+        The sweep only finds padels the ball runs into, not ones that
+        start the step around it, so such a ball is put back in front of
+        the padel's nearest face and bounced off it if it was heading in.
+        '''
+        x, y = self.x, self.y
+        for padel in padels:
+            left, bottom, right, top = padel.bounds()
+            left -= BALL_RADIUS
+            right += BALL_RADIUS
+            if not (left < x < right and bottom - BALL_RADIUS < y < top + BALL_RADIUS):
+                continue
+            if x < (left + right) / 2:
+                x, heading_in = left, self.x_move > 0
+            else:
+                x, heading_in = right, self.x_move < 0
+            if heading_in:
+                self.bounce_x()
+        return x, y
+
+    def bounce_y(self):
+        self.y_move *= -1
+        self.course += 1
+
+    def bounce_x(self):
+        '''Bounce off a padel, SPEED_UP times faster up to MAX_SPEED (a ball
+        already faster than that keeps its speed).'''
+        speed = self.speed_per_step()
+        factor = SPEED_UP
+        if speed * factor > MAX_SPEED:
+            factor = max(MAX_SPEED, speed) / speed
+        self.x_move *= -factor
+        self.y_move *= factor
+        self.course += 1
+
+    def speed_per_step(self):
+        return math.hypot(self.x_move, self.y_move)
+
+    def reset(self, rng=None):
+        '''Serve from the middle at base speed, towards the other side.
+
+        With a random.Random the serve starts at a random height and goes
+        up or down at random, so seeded matches differ from each other.
+        '''
+        y = rng.uniform(-SERVE_HEIGHT, SERVE_HEIGHT) if rng is not None else 0
+        self.goto(0, y)
+        self.x_move = -math.copysign(BASE_SPEED, self.x_move)
+        y_sign = rng.choice((-1, 1)) if rng is not None else self.y_move
+        self.y_move = math.copysign(BASE_SPEED, y_sign)
+        self.course += 1
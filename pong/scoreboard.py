@@ -1,6 +1,11 @@
-from turtle import Turtle
+from engine.entity import Entity
+from engine.text import Label
+
+FONT = ('courier',88,'normal')
+
+class Scoreboard(Entity):
+    __slots__ = ("score_l", "score_r", "label_l", "label_r")
 
-class Scoreboard(Turtle):
     def __init__(self):
         super().__init__()
         self.color('black')
@@ -8,17 +13,22 @@ class Scoreboard(Turtle):
         self.hideturtle()
         self.score_l = 0
         self.score_r = 0
+        self.label_l = Label(None, (-100,200), font=FONT)
+        self.label_r = Label(None, (100,200), font=FONT)
         self.update_scoreboard()
 
+    def view_attached(self, view):
+        self.label_l.attach(view)
+        self.label_r.attach(view)
+
     def update_scoreboard(self):
-        self.clear()
-        self.goto(-100,200)
-        self.write(self.score_l, align='center',font=('courier',88,'normal'))
-        self.goto(100,200)
-        self.write(self.score_r, align='center',font=('courier',88,'normal'))
+        self.label_l.set(self.score_l)
+        self.label_r.set(self.score_r)
 
     def point_l(self):
         self.score_l +=1
+        self.update_scoreboard()
 
     def point_r(self):
-        self.score_r +=1
\ No newline at end of file
+        self.score_r +=1
+        self.update_scoreboard()
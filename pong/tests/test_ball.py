@@ -0,0 +1,217 @@
+"""
+TESTS FOR ball.py
+
+Ball.move() sweeps the ball along its whole step and bounces at the
+exact point it touches a wall or padel. These tests use the headless
+backend (see conftest.py), so they build real Ball and Padel objects.
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+import math
+import pytest
+from pong.ball import Ball, WALL_Y, BASE_SPEED, SPEED_UP, MAX_BOUNCES, MAX_SPEED
+from pong.padel import Padel
+
+
+def make_ball(x, y, x_move, y_move):
+    ball = Ball()
+    ball.goto(x, y)
+    ball.x_move = x_move
+    ball.y_move = y_move
+    return ball
+
+
+# ============================================================================
+# WALLS
+# ============================================================================
+
+def test_moves_freely_in_open_space():
+    ball = make_ball(0, 0, 10, 10)
+
+    ball.move()
+
+    assert ball.position() == (10, 10)
+
+
+def test_bounces_off_top_wall_at_the_wall():
+    ball = make_ball(0, 275, 10, 10)
+
+    ball.move()
+
+    assert ball.position() == (10, 275)    # 5 up to the wall, 5 back down
+    assert ball.y_move == -10
+
+
+def test_bounces_off_bottom_wall():
+    ball = make_ball(0, -270, 0, -40)
+
+    ball.move()
+
+    assert ball.position() == (0, -250)
+    assert ball.y_move == 40
+
+
+# ============================================================================
+# PADELS
+# ============================================================================
+
+def test_bounces_off_padel_face_like_before():
+    """
+    The old check bounced a ball travelling at 10 px/step when it
+    reached x=330 in front of the padel at x=350. Swept collision
+    bounces it at exactly the same place.
+    """
+    padel = Padel((350, 0))
+    ball = make_ball(320, 0, 10, 0)
+
+    ball.move([padel])
+    assert ball.position() == (330, 0)
+    assert ball.x_move == pytest.approx(-10 * SPEED_UP)
+
+    ball.move([padel])
+    assert ball.xcor() == pytest.approx(330 - 10 * SPEED_UP)
+
+
+def test_fast_ball_cannot_tunnel_through_padel():
+    padel = Padel((350, 0))
+    ball = make_ball(200, 0, 400, 0)
+
+    ball.move([padel])
+
+    # 130 px to the padel, then the rest of the step back. The ball is
+    # already past MAX_SPEED, so the hit doesn't speed it up.
+    assert ball.xcor() == pytest.approx(330 - 270)
+    assert ball.x_move == pytest.approx(-400)
+
+
+def test_bounce_speeds_up_once_per_hit():
+    padel = Padel((350, 0))
+    ball = make_ball(300, 0, 40, 30)
+
+    ball.move([padel])
+
+    assert ball.speed_per_step() == pytest.approx(math.hypot(40, 30) * SPEED_UP)
+
+
+def test_ball_passing_beside_padel_is_not_hit():
+    padel = Padel((350, 0))
+    ball = make_ball(300, 100, 50, 0)
+
+    ball.move([padel])
+
+    assert ball.position() == (350, 100)
+    assert ball.x_move == 50
+
+
+def test_corner_then_wall_in_one_step():
+    """A very fast ball can bounce off a padel and a wall in the same step."""
+    padel = Padel((350, 230))
+    ball = make_ball(320, 260, 20, 40)
+
+    ball.move([padel])
+
+    assert ball.x_move == pytest.approx(-20 * SPEED_UP)
+    assert ball.y_move == pytest.approx(-40 * SPEED_UP)
+    assert ball.ycor() <= WALL_Y
+
+
+def test_padel_moving_onto_the_ball_pushes_it_out():
+    padel = Padel((350, 0))
+    ball = make_ball(335, 60, 10, 0)
+
+    padel.go_up()       # the padel now covers the ball
+    ball.move([padel])
+
+    assert ball.x_move == pytest.approx(-10 * SPEED_UP)
+    assert ball.xcor() == pytest.approx(330 - 10 * SPEED_UP)
+
+
+def test_ball_caught_heading_away_is_pushed_out_without_a_bounce():
+    padel = Padel((-350, 0))
+    ball = make_ball(-335, 0, 10, 0)
+
+    ball.move([padel])
+
+    assert ball.x_move == 10
+    assert ball.xcor() == -320
+
+
+def test_step_stops_after_max_bounces():
+    """More bounces than MAX_BOUNCES in one step: the rest of the step
+    is dropped and the ball waits at its last bounce."""
+    ball = make_ball(0, 0, 0, 4 * WALL_Y * MAX_BOUNCES)
+
+    ball.move()
+
+    assert abs(ball.ycor()) == WALL_Y
+    assert ball.course == MAX_BOUNCES
+
+
+def test_rally_never_leaves_through_a_padel():
+    """
+    Both padels follow the ball perfectly, so even at a huge speed the
+    ball must stay between them forever.
+    """
+    left = Padel((-350, 0))
+    right = Padel((350, 0))
+    ball = make_ball(0, 0, 37, 23)
+
+    for step in range(2000):
+        left.sety(ball.ycor())
+        right.sety(ball.ycor())
+        ball.move([left, right])
+        ball.x_move = math.copysign(37, ball.x_move)
+        ball.y_move = math.copysign(23, ball.y_move)
+        assert -330 <= ball.xcor() <= 330
+        assert -WALL_Y <= ball.ycor() <= WALL_Y
+
+
+# ============================================================================
+# VELOCITY
+# ============================================================================
+"""
+The ball's speed is its velocity per game step. The loop runs at a fixed
+step, so a faster ball no longer means more frames per second.
+"""
+
+def test_wall_bounce_keeps_speed():
+    ball = make_ball(0, 275, 10, 10)
+
+    ball.move()
+
+    assert ball.speed_per_step() == pytest.approx(math.hypot(10, 10))
+
+
+def test_padel_hits_stop_speeding_up_at_max_speed():
+    left = Padel((-350, 0))
+    right = Padel((350, 0))
+    ball = make_ball(0, 0, 10, 0)
+
+    for step in range(3000):
+        ball.move([left, right])
+
+    assert ball.speed_per_step() == pytest.approx(MAX_SPEED)
+
+
+def test_ball_faster_than_max_speed_keeps_its_speed():
+    ball = make_ball(0, 0, 400, 30)
+
+    ball.bounce_x()
+
+    assert (ball.x_move, ball.y_move) == (-400, 30)
+
+
+def test_reset_serves_the_other_way_at_base_speed():
+    padel = Padel((350, 0))
+    ball = make_ball(320, 0, 10, -10)
+    for step in range(3):
+        ball.move([padel])
+    assert ball.speed_per_step() > math.hypot(BASE_SPEED, BASE_SPEED)
+
+    ball.reset()
+
+    assert ball.position() == (0, 0)
+    assert (ball.x_move, ball.y_move) == (BASE_SPEED, -BASE_SPEED)
@@ -0,0 +1,106 @@
+"""
+TESTS FOR cpu.py
+
+The intercept works out, without stepping a ball, the y at which the
+ball reaches a padel however many walls it bounces off on the way, and
+the CPU only works it out again when the ball changes course.
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+import random
+import pytest
+from pong.ball import Ball
+from pong.cpu import CpuPlayer, fold, from_argv, intercept
+from pong.padel import Padel
+from pong.physics import WALL_Y
+from tournament.matches import play_pong
+
+
+def make_ball(x, y, x_move, y_move):
+    ball = Ball()
+    ball.goto(x, y)
+    ball.x_move = x_move
+    ball.y_move = y_move
+    return ball
+
+
+# ============================================================================
+# INTERCEPT
+# ============================================================================
+
+@pytest.mark.parametrize("y, folded", [
+    (0, 0), (100, 100), (WALL_Y, WALL_Y), (WALL_Y + 30, WALL_Y - 30),
+    (-WALL_Y - 30, -WALL_Y + 30), (4 * WALL_Y + 10, 10), (3 * WALL_Y, -WALL_Y),
+])
+def test_fold_mirrors_off_the_walls(y, folded):
+    assert fold(y) == pytest.approx(folded)
+
+
+def test_intercept_matches_the_simulated_ball():
+    rng = random.Random(0)
+    for trial in range(200):
+        # A whole number of steps to the target, so the ball lands on it.
+        steps = rng.randint(5, 80)
+        target_x = rng.choice((-330, 330))
+        y = rng.uniform(-WALL_Y, WALL_Y)
+        ball = make_ball(0, y, target_x / steps, rng.uniform(-60, 60))
+        predicted = intercept(0, y, ball.x_move, ball.y_move, target_x)
+        for step in range(steps):
+            ball.move()
+        assert ball.x == pytest.approx(target_x)
+        assert predicted == pytest.approx(ball.y, abs=1e-6)
+
+
+def test_intercept_is_none_for_a_ball_heading_away():
+    assert intercept(0, 0, -10, 10, 330) is None
+    assert intercept(0, 0, 0, 10, 330) is None
+
+
+# ============================================================================
+# CPU PLAYER
+# ============================================================================
+
+def test_cpu_waits_where_the_ball_will_arrive():
+    padel = Padel((350, 0))
+    player = CpuPlayer(padel)
+    ball = make_ball(0, 0, 10, 10)
+    for frame in range(40):
+        player.play(ball)
+        ball.move((padel,))
+    assert player.face_x == 330
+    assert abs(padel.y - intercept(0, 0, 10, 10, 330)) <= player.dead_zone
+
+
+def test_cpu_goes_back_to_the_middle_while_the_ball_is_away():
+    padel = Padel((-350, 200))
+    player = CpuPlayer(padel)
+    ball = make_ball(0, 0, 10, 5)
+    assert player.move(ball) == -1
+
+
+def test_prediction_only_changes_with_the_course():
+    player = CpuPlayer(Padel((350, 0)))
+    ball = make_ball(0, 0, 10, 10)
+    for step in range(20):
+        player.predict(ball)
+        ball.x += 1
+    assert player.predictions == 1
+    ball.bounce_y()
+    player.predict(ball)
+    ball.reset()
+    player.predict(ball)
+    assert player.predictions == 3
+
+
+def test_cpu_beats_the_tracker():
+    result = play_pong("cpu", "tracker", seed=0)
+    assert result["score_l"] > result["score_r"]
+
+
+def test_from_argv():
+    padel = Padel((-350, 0))
+    assert from_argv(["main.py"], padel) is None
+    assert from_argv(["main.py", "--cpu", "--seed", "3"], padel).padel is padel
@@ -0,0 +1,162 @@
+"""
+TESTS FOR pong/net
+
+The packets round-trip and snapshots only carry what changed, a client
+replays the inputs a snapshot hadn't seen yet, and two bot clients play
+a server on localhost through a lossy, delayed Link and end up agreeing
+with it about where their padels are.
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+import asyncio
+import random
+from pong.net import protocol
+from pong.net.client import PongClient, connect
+from pong.net.match import LEFT, RIGHT, Match
+from pong.net.server import address, start_server
+
+
+# ============================================================================
+# PROTOCOL
+# ============================================================================
+
+def test_input_round_trip():
+    packet = protocol.encode_input(7, [(3, 1), (4, -1), (5, 0)])
+    assert protocol.kind(packet) == protocol.INPUT
+    assert protocol.decode_input(packet) == (7, [(3, 1), (4, -1), (5, 0)])
+
+
+def test_input_resends_only_the_newest():
+    inputs = [(seq, 1) for seq in range(1, 41)]
+    ack_tick, decoded = protocol.decode_input(protocol.encode_input(0, inputs))
+    assert decoded == inputs[-protocol.MAX_INPUTS_PER_PACKET:]
+
+
+def test_welcome_round_trip():
+    assert protocol.decode_welcome(protocol.encode_welcome(RIGHT)) == RIGHT
+
+
+def test_full_snapshot_round_trip():
+    state = Match().state()
+    tick, base_tick, ack_seq, changes = protocol.decode_snapshot(
+        protocol.encode_snapshot(12, 9, state))
+    assert (tick, base_tick, ack_seq) == (12, 0, 9)
+    assert protocol.patch(None, changes) == state
+
+
+def test_delta_snapshot_sends_only_changes():
+    match = Match()
+    base = match.state()
+    match.step()
+    state = match.state()
+    full = protocol.encode_snapshot(2, 0, state)
+    delta = protocol.encode_snapshot(2, 0, state, 1, base)
+    # Only the ball moved: four float32s and both scores are left out.
+    assert len(full) - len(delta) == 4 * 4 + 2 * 2
+    tick, base_tick, ack_seq, changes = protocol.decode_snapshot(delta)
+    assert base_tick == 1
+    assert sorted(changes) == [0, 1]
+    assert protocol.patch(base, changes) == state
+
+
+# ============================================================================
+# RECONCILIATION
+# ============================================================================
+
+def test_reconcile_replays_unacknowledged_inputs():
+    client = PongClient()
+    client.side = LEFT
+    for move in (1, 1, 1):
+        client.seq += 1
+        client.pending.append((client.seq, move))
+        client.match.steer(LEFT, move)
+    predicted = client.match.padel_l.y
+
+    # The server has only applied the first input so far.
+    server = Match()
+    server.steer(LEFT, 1)
+    client.reconcile(server.state(), 1)
+
+    assert [seq for seq, move in client.pending] == [2, 3]
+    assert client.match.padel_l.y == predicted
+    assert client.corrections == 0
+
+
+def test_reconcile_corrects_a_wrong_prediction():
+    client = PongClient()
+    client.side = RIGHT
+    client.seq = 1
+    client.pending.append((1, 1))
+    client.match.steer(RIGHT, 1)
+
+    # The server says the padel never moved.
+    client.reconcile(Match().state(), 1)
+    assert client.match.padel_r.y == 0
+    assert not client.pending
+    assert client.corrections == 1
+
+
+def test_stale_snapshots_are_ignored():
+    client = PongClient()
+    client.side = LEFT
+    match = Match()
+    client.on_snapshot(5, 0, 0, dict(enumerate(match.state())))
+    match.steer(LEFT, 1)
+    client.on_snapshot(4, 0, 0, dict(enumerate(match.state())))
+    assert client.server_tick == 5
+    assert client.match.padel_l.y == 0
+
+
+# ============================================================================
+# LOCALHOST
+# ============================================================================
+
+def test_two_clients_over_a_lossy_link():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    link = {"latency": 0.005, "jitter": 0.005, "loss": 0.1}
+    tick = 0.01
+
+    def link_options(seed):
+        return dict(link, rng=random.Random(seed))
+
+    async def play():
+        server = await start_server(tick=tick, link_options=link_options(1))
+        host, port = address(server)
+        clients = [await connect(host, port, link_options=link_options(seed))
+                   for seed in (2, 3)]
+        sides = await asyncio.gather(*(client.join(tick) for client in clients))
+        running = loop.create_task(server.run())
+
+        def zigzag(client):
+            return (1, 1, 0, -1)[client.seq % 4]
+
+        await asyncio.gather(*(client.run(zigzag, 60, tick) for client in clients))
+        # Stand still until every input has been acknowledged.
+        still = lambda client: 0
+        for attempt in range(50):
+            await asyncio.gather(*(client.run(still, 5, tick) for client in clients))
+            if all(client.acked_seq == client.seq for client in clients):
+                break
+        await asyncio.sleep(0.05)
+        server.stop()
+        await running
+        for client in clients + [server]:
+            client.link.close()
+        return server, clients, sides
+
+    try:
+        server, clients, sides = loop.run_until_complete(play())
+    finally:
+        loop.close()
+        asyncio.set_event_loop(asyncio.new_event_loop())
+
+    assert sorted(sides) == [LEFT, RIGHT]
+    for client in clients:
+        assert client.acked_seq == client.seq
+        assert client.match.padel(client.side).y == server.match.padel(client.side).y
+        assert client.link.packets_dropped > 0
+    assert server.summary()["packets_sent"] > 0
@@ -1,19 +1,32 @@
-from turtle import Turtle
+from engine.entity import Entity
+from engine.grid import FreeCells, square_board
+from snake_game_template.rules import GRID_LIMIT, to_position
 import random
 
 
-class Food(Turtle):
+class Food(Entity):
+    __slots__ = ("free_cells", "rng", "cell")
 
-    def __init__(self):
+    def __init__(self, free_cells=None, rng=None):
         super().__init__()
         self.shape("circle")
         self.penup()
         self.shapesize(stretch_len=0.5, stretch_wid=0.5)
         self.color("blue")
         self.speed("fastest")
+        if free_cells is None:
+            free_cells = FreeCells(square_board(GRID_LIMIT))
+        self.free_cells = free_cells
+        self.rng = rng if rng is not None else random.Random()
+        self.cell = None
         self.refresh()
 
     def refresh(self):
-        random_x = random.randint(-280, 280)
-        random_y = random.randint(-280, 280)
-        self.goto(random_x, random_y)
+        '''Move to a random grid cell that the snake is not on.'''
+        cell = self.free_cells.sample(self.rng)
+        if cell is None:
+            self.hideturtle()
+            return
+        self.cell = cell
+        self.goto(to_position(cell))
+        self.showturtle()
@@ -1,8 +1,18 @@
-from turtle import Screen
-from snake import Snake
-from food import Food
-from scoreboard import Scoreboard
-import time
+import pathlib
+import sys
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+from engine.backend import Screen, clock
+from engine.input import InputQueue
+from engine.loop import GameLoop
+from engine.persistence import HighScoreStore
+import engine.entity as entity
+import engine.profiler as profiling
+import engine.render as render
+import engine.replay as replay
+import engine.text as text
+from snake_game_template.snake import Snake
+from snake_game_template.food import Food
+from snake_game_template.scoreboard import Scoreboard
 
 screen = Screen()
 screen.setup(width=600, height=600)
@@ -10,44 +20,65 @@ screen.bgcolor("black")
 screen.title("My Snake Game")
 screen.tracer(0)
 
+session = replay.from_argv(sys.argv)
 snake = Snake()
-food = Food()
-scoreboard = Scoreboard()
+food = Food(snake.free_cells, session.rng())
+food.attach_view()
+# A replay keeps its high scores in memory, away from data.txt.
+scoreboard = Scoreboard(store=HighScoreStore(None) if session.replaying else None)
+scoreboard.attach_view()
+
+profiler = profiling.from_argv(sys.argv)
+if profiler is not None:
+    profiler.instrument("snake", snake, "up", "down", "left", "right",
+                        "move", "extend", "hits_wall", "hits_self", "reset")
+    profiler.instrument("food", food, "refresh")
+    profiler.instrument("scoreboard", scoreboard, "increase_score", "reset")
+    profiler.instrument("text", text, "flush")
+    profiler.instrument("render", render, "flush")
 
 screen.listen()
-screen.onkey(snake.up, "Up")
-screen.onkey(snake.down, "Down")
-screen.onkey(snake.left, "Left")
-screen.onkey(snake.right, "Right")
-
-game_is_on = True
-while game_is_on:
-    screen.update()
-    time.sleep(0.1)
+inputs = InputQueue(session, screen, clock)
+inputs.turn(snake.up, "Up")
+inputs.turn(snake.down, "Down")
+inputs.turn(snake.left, "Left")
+inputs.turn(snake.right, "Right")
+
+def play_frame():
     snake.move()
 
     #Detect collision with food.
-    if snake.head.distance(food) < 15:
+    if snake.head_cell == food.cell:
         food.refresh()
         snake.extend()
         scoreboard.increase_score()
 
     #Detect collision with wall.
-    if snake.head.xcor() > 280 or snake.head.xcor() < -280 or snake.head.ycor() > 280 or snake.head.ycor() < -280:
+    if snake.hits_wall():
         scoreboard.reset()
         snake.reset()
+        food.refresh()
 
     #Detect collision with tail.
-    for segment in snake.segments:
-        if segment == snake.head:
-            pass
-        elif snake.head.distance(segment) < 10:
-            scoreboard.reset()
-            snake.reset()
+    if snake.hits_self():
+        scoreboard.reset()
+        snake.reset()
+        food.refresh()
 
 
-WORKING_DIR = Path.Path(__file__).parent
-print(WORKING_DIR)
+def draw_frame():
+    entity.flush()
+    text.flush()
+    render.flush(screen)
 
 
+game_loop = GameLoop(screen, session.wrap(inputs.wrap(play_frame)), draw_frame, step=0.1, clock=clock,
+                     profiler=profiler)
+session.attach(game_loop)
+game_loop.start()
 screen.exitonclick()
+session.finish()
+print(game_loop.report())
+print(inputs.report())
+if profiler is not None:
+    print(profiler.report())
@@ -0,0 +1,119 @@
+"""The rules of snake on its grid, without any drawing.
+
+Nothing here imports turtle, so bots, tests and worker processes can use
+the game logic without loading Tk. snake.py draws a SnakeBody with
+Turtles.
+"""
+from collections import Counter, deque
+from engine.grid import FreeCells, square_board
+
+STARTING_POSITIONS = [(0, 0), (-20, 0), (-40, 0)]
+MOVE_DISTANCE = 20
+UP = 90
+DOWN = 270
+LEFT = 180
+RIGHT = 0
+STEPS = {UP: (0, 1), DOWN: (0, -1), LEFT: (-1, 0), RIGHT: (1, 0)}
+WALL = 280
+GRID_LIMIT = WALL // MOVE_DISTANCE
+
+
+def to_cell(position):
+    return (round(position[0] / MOVE_DISTANCE), round(position[1] / MOVE_DISTANCE))
+
+
+def to_position(cell):
+    return (cell[0] * MOVE_DISTANCE, cell[1] * MOVE_DISTANCE)
+
+
+class SnakeBody:
+    '''The body is a deque of grid cells, head first.
+
+    Moving pushes a new head cell and pops the tail cell, so a move costs
+    the same however long the snake is.
+
+    occupied counts how many segments sit in each cell (extend() stacks a
+    new segment on the tail), so collision checks are dictionary lookups.
+    free_cells is kept in step with it for Food to pick an empty cell.
+    '''
+
+    def __init__(self):
+        self.body = deque()
+        self.occupied = Counter()
+        self.free_cells = FreeCells(square_board(GRID_LIMIT))
+        self.direction = RIGHT
+        self.create_snake()
+
+    @property
+    def head_cell(self):
+        return self.body[0]
+
+    def create_snake(self):
+        for position in STARTING_POSITIONS:
+            self.add_segment(position)
+
+    def add_segment(self, position):
+        cell = to_cell(position)
+        self.body.append(cell)
+        self.occupy(cell)
+
+    def reset(self):
+        self.body.clear()
+        self.occupied.clear()
+        self.free_cells.reset()
+        self.direction = RIGHT
+        self.create_snake()
+
+    def extend(self):
+        self.add_segment(to_position(self.body[-1]))
+
+    def move(self):
+        '''Step the head forward and drop the tail. Returns the new head cell.'''
+        step_x, step_y = STEPS[self.direction]
+        head_x, head_y = self.body[0]
+        new_head = (head_x + step_x, head_y + step_y)
+        self.vacate(self.body.pop())
+        self.body.appendleft(new_head)
+        self.occupy(new_head)
+        return new_head
+
+    def occupy(self, cell):
+        self.occupied[cell] += 1
+        self.free_cells.discard(cell)
+
+    def vacate(self, cell):
+        if self.occupied[cell] == 1:
+            del self.occupied[cell]
+            self.free_cells.add(cell)
+        else:
+            self.occupied[cell] -= 1
+
+    def occupies(self, cell):
+        return cell in self.occupied
+
+    def hits_self(self):
+        return self.occupied[self.body[0]] > 1
+
+    def hits_wall(self):
+        col, row = self.body[0]
+        return abs(col) > GRID_LIMIT or abs(row) > GRID_LIMIT
+
+    def turn(self, direction, opposite):
+        '''Head in direction unless that's back into the body. True if the
+        direction changed.'''
+        if self.direction in (direction, opposite):
+            return False
+        self.direction = direction
+        return True
+
+    def up(self):
+        return self.turn(UP, DOWN)
+
+    def down(self):
+        return self.turn(DOWN, UP)
+
+    def left(self):
+        return self.turn(LEFT, RIGHT)
+
+    def right(self):
+        return self.turn(RIGHT, LEFT)
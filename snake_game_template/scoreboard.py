@@ -1,39 +1,40 @@
-from turtle import Turtle
-import os
-import pathlib as Path
+from engine.entity import Entity
+from engine.persistence import DEFAULT_PLAYER, HighScoreStore
+from engine.text import Label
+import pathlib
 
-WORKING_DIR = Path.Path(__file__).parent
-print(WORKING_DIR)
+WORKING_DIR = pathlib.Path(__file__).parent
 ALIGNMENT = "center"
 FONT = ("Courier", 24, "normal")
 
 
-class Scoreboard(Turtle):
+class Scoreboard(Entity):
+    __slots__ = ("score", "player", "store", "high_score", "label")
 
-    def __init__(self):
+    def __init__(self, player=DEFAULT_PLAYER, store=None):
         super().__init__()
         self.score = 0
-        # with open(WORKING_DIR / "data.txt") as data:
-        with open(WORKING_DIR / "data.txt") as data:
-            self.high_score = int(data.read())
+        self.player = player
+        if store is None:
+            store = HighScoreStore(WORKING_DIR / "data.txt")
+        self.store = store
+        self.high_score = store.best()
         self.color("white")
         self.penup()
-        self.goto(0, 270)
         self.hideturtle()
+        self.label = Label(None, (0, 270), align=ALIGNMENT, font=FONT)
         self.update_scoreboard()
 
+    def view_attached(self, view):
+        self.label.attach(view)
+
     def update_scoreboard(self):
-        self.clear()
-        self.write(f"Score: {self.score} High Score: {self.high_score}",
-                     align=ALIGNMENT, 
-                     font=FONT
-    )
+        self.label.set(f"Score: {self.score} High Score: {self.high_score}")
 
     def reset(self):
-        if self.score > self.high_score:
-            self.high_score = self.score
-        with open(WORKING_DIR / "data.txt", mode="w") as data:
-            data.write(f"{self.high_score}")
+        if self.store.record(self.player, self.score):
+            self.high_score = self.store.best()
+            self.store.flush_async()
         self.score = 0
         self.update_scoreboard()
     # def game_over(self):
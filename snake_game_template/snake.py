@@ -1,60 +1,50 @@
-from turtle import Turtle
-STARTING_POSITIONS = [(0, 0), (-20, 0), (-40, 0)]
-MOVE_DISTANCE = 20
-UP = 90
-DOWN = 270
-LEFT = 180
-RIGHT = 0
+from collections import deque
+import engine.backend as backend
+from engine.render import SpritePool
+from snake_game_template.rules import (
+    SnakeBody, STARTING_POSITIONS, MOVE_DISTANCE, UP, DOWN, LEFT, RIGHT, STEPS,
+    WALL, GRID_LIMIT, to_cell, to_position,
+)
 
 
-class Snake:
+class Snake(SnakeBody):
+    '''A SnakeBody drawn with one Turtle per segment.
+
+    A move only repositions the tail Turtle, which becomes the new head.
+    Segments dropped by reset() are hidden and reused for the next snake.
+    '''
 
     def __init__(self):
-        self.segments = []
-        self.create_snake()
-        self.head = self.segments[0]
+        self.segments = deque()
+        self.spare_segments = SpritePool(new_segment)
+        super().__init__()
 
-    def create_snake(self):
-        for position in STARTING_POSITIONS:
-            self.add_segment(position)
+    @property
+    def head(self):
+        return self.segments[0]
 
     def add_segment(self, position):
-        new_segment = Turtle("square")
-        new_segment.color("white")
-        new_segment.penup()
-        new_segment.goto(position)
-        self.segments.append(new_segment)
+        segment = self.spare_segments.acquire()
+        segment.goto(position)
+        self.segments.append(segment)
+        super().add_segment(position)
 
     def reset(self):
         for seg in self.segments:
-            seg.goto(1000,1000)
+            self.spare_segments.release(seg)
         self.segments.clear()
-        # self.segments = []
-        self.create_snake()
-        self.head = self.segments[0]
-
-    def extend(self):
-        self.add_segment(self.segments[-1].position())
+        super().reset()
 
     def move(self):
-        for seg_num in range(len(self.segments) - 1, 0, -1):
-            new_x = self.segments[seg_num - 1].xcor()
-            new_y = self.segments[seg_num - 1].ycor()
-            self.segments[seg_num].goto(new_x, new_y)
-        self.head.forward(MOVE_DISTANCE)
-
-    def up(self):
-        if self.head.heading() != DOWN:
-            self.head.setheading(UP)
-
-    def down(self):
-        if self.head.heading() != UP:
-            self.head.setheading(DOWN)
-
-    def left(self):
-        if self.head.heading() != RIGHT:
-            self.head.setheading(LEFT)
-
-    def right(self):
-        if self.head.heading() != LEFT:
-            self.head.setheading(RIGHT)
+        new_head = super().move()
+        tail = self.segments.pop()
+        tail.goto(to_position(new_head))
+        self.segments.appendleft(tail)
+        return new_head
+
+
+def new_segment():
+    segment = backend.Turtle("square")
+    segment.color("white")
+    segment.penup()
+    return segment
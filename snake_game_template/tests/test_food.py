@@ -0,0 +1,103 @@
+"""
+TESTS FOR food.py
+
+Food picks its cell from the snake's free_cells, so it always lands on
+the 20px grid and never inside the snake, even on a nearly full board.
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+import random
+from snake_game_template.food import Food
+from snake_game_template.snake import Snake, MOVE_DISTANCE, GRID_LIMIT
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+def test_food_sits_on_the_grid():
+    food = Food(rng=random.Random(1))
+
+    for i in range(100):
+        food.refresh()
+        x, y = food.position()
+        assert x % MOVE_DISTANCE == 0 and y % MOVE_DISTANCE == 0
+        assert abs(x) <= 280 and abs(y) <= 280
+
+
+def test_food_never_lands_on_the_snake():
+    rng = random.Random(5)
+    snake = Snake()
+    food = Food(snake.free_cells, rng)
+    turns = [snake.up, snake.down, snake.left, snake.right]
+
+    for frame in range(3000):
+        rng.choice(turns)()
+        snake.move()
+        if snake.head_cell == food.cell:
+            food.refresh()
+            snake.extend()
+        if snake.hits_wall() or snake.hits_self():
+            snake.reset()
+            food.refresh()
+
+        assert not snake.occupies(food.cell)
+
+
+def test_free_cells_follow_the_snake():
+    rng = random.Random(8)
+    snake = Snake()
+    turns = [snake.up, snake.down, snake.left, snake.right]
+    board_size = (2 * GRID_LIMIT + 1) ** 2
+
+    for frame in range(3000):
+        rng.choice(turns)()
+        snake.move()
+        if rng.random() < 0.1:
+            snake.extend()
+        if snake.hits_wall() or snake.hits_self():
+            snake.reset()
+
+        on_board = [cell for cell in snake.occupied
+                    if abs(cell[0]) <= GRID_LIMIT and abs(cell[1]) <= GRID_LIMIT]
+        assert len(snake.free_cells) == board_size - len(on_board)
+        assert not any(cell in snake.free_cells for cell in on_board)
+
+
+def test_food_comes_back_after_a_reset():
+    snake = Snake()
+    for cell in list(snake.free_cells.cells):
+        snake.free_cells.discard(cell)
+    food = Food(snake.free_cells, random.Random(0))
+    assert not food.isvisible()
+
+    snake.reset()
+    food.refresh()
+
+    assert food.isvisible()
+    assert not snake.occupies(food.cell)
+
+
+def test_nearly_full_board_picks_the_last_free_cell():
+    snake = Snake()
+    for cell in list(snake.free_cells.cells):
+        if cell != (7, 7):
+            snake.free_cells.discard(cell)
+
+    food = Food(snake.free_cells, random.Random())
+
+    assert food.cell == (7, 7)
+    assert food.position() == (140, 140)
+
+
+def test_same_seed_same_food():
+    first = Food(rng=random.Random(123))
+    second = Food(rng=random.Random(123))
+
+    for i in range(50):
+        assert first.cell == second.cell
+        first.refresh()
+        second.refresh()
@@ -0,0 +1,51 @@
+"""
+TESTS FOR scoreboard.py
+
+The snake Scoreboard saves high scores through a HighScoreStore. Tests
+give it a store in pytest's tmp_path so the real data.txt is untouched.
+"""
+
+import json
+from engine.persistence import DEFAULT_PLAYER, HighScoreStore
+from snake_game_template.scoreboard import Scoreboard
+
+
+def test_scoreboard_only_saves_new_high_scores(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("3")
+    store = HighScoreStore(path)
+    scoreboard = Scoreboard(store=store)
+    assert scoreboard.high_score == 3
+
+    scoreboard.increase_score()
+    scoreboard.reset()
+    for point in range(5):
+        scoreboard.increase_score()
+    scoreboard.reset()
+    store.close()
+
+    assert scoreboard.high_score == 5
+    assert store.writes == 1
+    assert json.loads(path.read_text()) == {DEFAULT_PLAYER: 5}
+
+
+def test_scoreboard_starts_with_a_corrupt_file(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("not a number")
+
+    scoreboard = Scoreboard(store=HighScoreStore(path))
+
+    assert scoreboard.high_score == 0
+    assert path.read_text() == "not a number"
+
+
+def test_deaths_without_a_high_score_never_write(tmp_path):
+    store = HighScoreStore(tmp_path / "data.txt")
+    scoreboard = Scoreboard(store=store)
+
+    for death in range(100):
+        scoreboard.reset()
+    store.close()
+
+    assert store.writes == 0
+    assert not (tmp_path / "data.txt").exists()
@@ -0,0 +1,260 @@
+"""
+TESTS FOR snake.py
+
+The snake's body is a deque of grid cells. A move pushes a new head and
+moves only the tail Turtle, instead of shifting every segment along.
+These tests check it still moves exactly like the old loop did, and
+that the occupancy counts give the same collisions as the old distance
+checks in main.py.
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+import random
+from engine.backend import Screen
+from snake_game_template.snake import (
+    Snake, STARTING_POSITIONS, MOVE_DISTANCE, UP, DOWN, LEFT, RIGHT,
+)
+
+
+# ============================================================================
+# REFERENCE: the old Snake.move
+# ============================================================================
+"""
+This is the original algorithm written with plain (x, y) tuples:
+every segment takes the place of the one in front of it, then the
+head steps forward.
+"""
+
+class OldSnake:
+    def __init__(self):
+        self.positions = list(STARTING_POSITIONS)
+        self.heading = RIGHT
+
+    def move(self):
+        for seg_num in range(len(self.positions) - 1, 0, -1):
+            self.positions[seg_num] = self.positions[seg_num - 1]
+        x, y = self.positions[0]
+        step = {UP: (0, MOVE_DISTANCE), DOWN: (0, -MOVE_DISTANCE),
+                LEFT: (-MOVE_DISTANCE, 0), RIGHT: (MOVE_DISTANCE, 0)}[self.heading]
+        self.positions[0] = (x + step[0], y + step[1])
+
+    def extend(self):
+        self.positions.append(self.positions[-1])
+
+    def turn(self, heading):
+        opposite = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+        if self.heading != opposite[heading]:
+            self.heading = heading
+
+
+def drawn_positions(snake):
+    return [segment.position() for segment in snake.segments]
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+def test_starting_body():
+    snake = Snake()
+
+    assert list(snake.body) == [(0, 0), (-1, 0), (-2, 0)]
+    assert drawn_positions(snake) == STARTING_POSITIONS
+    assert snake.head_cell == (0, 0)
+
+
+def test_move_right():
+    snake = Snake()
+
+    snake.move()
+
+    assert list(snake.body) == [(1, 0), (0, 0), (-1, 0)]
+    assert drawn_positions(snake) == [(20, 0), (0, 0), (-20, 0)]
+
+
+def test_cannot_turn_back_on_itself():
+    snake = Snake()
+
+    snake.left()
+    snake.move()
+
+    assert snake.head_cell == (1, 0)
+
+
+def test_extend_then_move_grows_by_one():
+    snake = Snake()
+
+    snake.extend()
+    snake.move()
+
+    assert list(snake.body) == [(1, 0), (0, 0), (-1, 0), (-2, 0)]
+    assert len(snake.segments) == 4
+
+
+def test_matches_old_move_on_a_random_game():
+    """
+    Play 2000 random turns, moves and extensions on both snakes and
+    check every segment is drawn in the same place.
+    """
+    rng = random.Random(42)
+    snake = Snake()
+    old = OldSnake()
+    turns = {UP: snake.up, DOWN: snake.down, LEFT: snake.left, RIGHT: snake.right}
+
+    for frame in range(2000):
+        heading = rng.choice([UP, DOWN, LEFT, RIGHT])
+        turns[heading]()
+        old.turn(heading)
+        snake.move()
+        old.move()
+        if rng.random() < 0.1:
+            snake.extend()
+            old.extend()
+
+        assert drawn_positions(snake) == old.positions
+
+
+def test_move_only_moves_one_turtle():
+    """A long snake still repositions a single Turtle per move."""
+    snake = Snake()
+    for i in range(2000):
+        snake.extend()
+    moved = []
+    for segment in snake.segments:
+        segment.goto = lambda *args, segment=segment: moved.append(segment)
+
+    snake.move()
+
+    assert len(moved) == 1
+
+
+def test_reset_goes_back_to_start():
+    snake = Snake()
+    snake.up()
+    snake.move()
+    snake.extend()
+
+    snake.reset()
+
+    assert list(snake.body) == [(0, 0), (-1, 0), (-2, 0)]
+    assert snake.direction == RIGHT
+
+
+def test_reset_reuses_segments():
+    """Dying over and over doesn't leave turtles behind."""
+    snake = Snake()
+    for i in range(3):
+        snake.extend()
+        snake.move()
+    snake.reset()
+    live_turtles = len(Screen().turtles())
+
+    for i in range(10000):
+        snake.extend()
+        snake.move()
+        snake.reset()
+
+    assert len(Screen().turtles()) == live_turtles
+    assert snake.spare_segments.made == 6
+    assert all(segment.isvisible() for segment in snake.segments)
+    assert not any(segment.isvisible() for segment in snake.spare_segments.free)
+
+
+# ============================================================================
+# COLLISIONS
+# ============================================================================
+"""
+hits_self() and hits_wall() replace these checks from main.py:
+
+    if snake.head.xcor() > 280 or snake.head.xcor() < -280 or ...
+
+    for segment in snake.segments:
+        if segment == snake.head:
+            pass
+        elif snake.head.distance(segment) < 10:
+"""
+
+def old_hits_wall(snake):
+    x, y = snake.head.position()
+    return x > 280 or x < -280 or y > 280 or y < -280
+
+
+def old_hits_self(snake):
+    for segment in snake.segments:
+        if segment == snake.head:
+            pass
+        elif snake.head.distance(segment) < 10:
+            return True
+    return False
+
+
+def test_occupies_every_body_cell():
+    snake = Snake()
+
+    assert snake.occupies((0, 0))
+    assert snake.occupies((-2, 0))
+    assert not snake.occupies((1, 0))
+
+
+def test_occupancy_follows_the_tail():
+    snake = Snake()
+
+    snake.move()
+
+    assert snake.occupies((1, 0))
+    assert not snake.occupies((-2, 0))
+
+
+def test_stacked_tail_cell_stays_occupied():
+    snake = Snake()
+    snake.extend()
+
+    snake.move()
+
+    assert snake.occupies((-2, 0))
+    assert sum(snake.occupied.values()) == 4
+
+
+def test_hits_self_when_turning_into_the_body():
+    snake = Snake()
+    for i in range(3):
+        snake.extend()
+    for turn in (snake.up, snake.left, snake.down):
+        turn()
+        snake.move()
+
+    assert snake.hits_self() is True
+
+
+def test_hits_wall_just_past_the_edge():
+    snake = Snake()
+    for i in range(14):
+        snake.move()
+    assert snake.hits_wall() is False
+
+    snake.move()
+    assert snake.hits_wall() is True
+
+
+def test_collisions_match_old_checks_on_random_games():
+    rng = random.Random(3)
+    snake = Snake()
+    turns = [snake.up, snake.down, snake.left, snake.right]
+    resets = 0
+
+    for frame in range(5000):
+        rng.choice(turns)()
+        snake.move()
+        if rng.random() < 0.2:
+            snake.extend()
+
+        assert snake.hits_wall() == old_hits_wall(snake)
+        assert snake.hits_self() == old_hits_self(snake)
+        if snake.hits_wall() or snake.hits_self():
+            snake.reset()
+            resets += 1
+
+    assert resets > 10
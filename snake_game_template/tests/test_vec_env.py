@@ -0,0 +1,144 @@
+"""
+TESTS FOR vec_env.py
+
+SnakeVecEnv must play by exactly the rules of main.py. The reference
+below is main.py's play_frame with Snake and a food cell. The two only
+pick food cells from different random streams, so after each meal and
+each reset the reference food is moved to wherever the vectorised game put it, once
+we've checked that cell was free.
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+import numpy as np
+from snake_game_template.snake import Snake, UP, DOWN, LEFT, RIGHT
+from snake_game_template.vec_env import ACTIONS, KEEP_GOING, SnakeVecEnv, to_cells
+
+
+# ============================================================================
+# REFERENCE: main.py
+# ============================================================================
+
+class ReferenceGame:
+    def __init__(self, food_cell):
+        self.snake = Snake()
+        self.food_cell = food_cell
+        self.score = 0
+        self.turns = {UP: self.snake.up, DOWN: self.snake.down,
+                      LEFT: self.snake.left, RIGHT: self.snake.right}
+
+    def play_frame(self, action, env, game):
+        if action != KEEP_GOING:
+            self.turns[ACTIONS[action]]()
+        self.snake.move()
+        ate = self.snake.head_cell == self.food_cell
+        if ate:
+            new_food = env.food_cell(game)
+            if len(self.snake.free_cells):
+                assert new_food in self.snake.free_cells
+                self.food_cell = new_food
+            else:
+                assert new_food == self.food_cell
+            self.snake.extend()
+            self.score += 1
+        done = self.snake.hits_wall() or self.snake.hits_self()
+        if self.snake.hits_wall():
+            self.score = 0
+            self.snake.reset()
+        if self.snake.hits_self():
+            self.score = 0
+            self.snake.reset()
+        if done:
+            self.food_cell = env.food_cell(game)
+            assert self.food_cell in self.snake.free_cells
+        return ate, done
+
+
+def greedy_actions(env, rng):
+    """Mostly head for the food so the snakes grow long, sometimes turn at random."""
+    food_col, food_row = to_cells(env.food)
+    actions = np.where(env.head_col < food_col, 3, 2)
+    vertical = env.head_row < food_row
+    actions = np.where(rng.random(env.n) < 0.5, np.where(vertical, 0, 1), actions)
+    return np.where(rng.random(env.n) < 0.2, rng.integers(-1, 4, env.n), actions)
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+def test_starts_like_snake():
+    env = SnakeVecEnv(3, seed=0)
+
+    for game in range(3):
+        assert env.body(game) == list(Snake().body)
+        assert env.food_cell(game) not in env.body(game)
+
+
+def test_matches_main_py_rules():
+    env = SnakeVecEnv(6, seed=1)
+    games = [ReferenceGame(env.food_cell(game)) for game in range(6)]
+    rng = np.random.default_rng(2)
+    meals = deaths = 0
+
+    for frame in range(3000):
+        actions = greedy_actions(env, rng)
+        ate, done = env.step(actions)
+        for game, reference in enumerate(games):
+            expected = reference.play_frame(int(actions[game]), env, game)
+
+            assert (bool(ate[game]), bool(done[game])) == expected
+            assert env.body(game) == list(reference.snake.body)
+            assert env.food_cell(game) == reference.food_cell
+            assert env.scores[game] == reference.score
+        meals += ate.sum()
+        deaths += done.sum()
+
+    assert meals > 100
+    assert deaths > 20
+
+
+def test_reversing_is_ignored():
+    env = SnakeVecEnv(1, seed=0)
+
+    env.step([ACTIONS.index(LEFT)])
+
+    assert env.body(0)[0] == (1, 0)
+
+
+def test_following_the_tail_is_not_a_collision():
+    """A snake of four going round a square moves into its tail's old cell."""
+    env = SnakeVecEnv(1, seed=0)
+    env.food[:] = 0
+    env.length[:] = 4
+    env.ring[0, 3] = env.ring[0, 2]
+    env.counts[0, env.ring[0, 2]] += 1
+
+    for action in (UP, LEFT, DOWN, RIGHT, UP):
+        ate, done = env.step([ACTIONS.index(action)])
+        assert not done[0]
+
+
+def test_full_board_keeps_the_food():
+    env = SnakeVecEnv(2, seed=0)
+    env.counts[0] = 1
+    food = env.food.copy()
+
+    env.place_food(np.array([0, 1]))
+
+    assert env.food[0] == food[0]
+    assert env.counts[1, env.food[1]] == 0
+
+
+def test_high_score_kept_over_resets():
+    env = SnakeVecEnv(1, seed=0)
+    env.scores[:] = 5
+
+    for frame in range(15):
+        ate, done = env.step([KEEP_GOING])
+
+    assert done[0]
+    assert env.scores[0] == 0
+    assert env.high_scores[0] == 5
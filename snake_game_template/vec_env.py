@@ -0,0 +1,152 @@
+import numpy as np
+from snake_game_template.rules import GRID_LIMIT, STARTING_POSITIONS, STEPS, UP, DOWN, LEFT, RIGHT, to_cell
+
+# Actions are indexes into ACTIONS. KEEP_GOING leaves the direction alone,
+# like a frame with no key pressed.
+ACTIONS = (UP, DOWN, LEFT, RIGHT)
+KEEP_GOING = -1
+OPPOSITE = np.array([1, 0, 3, 2])
+STEP_COL = np.array([STEPS[heading][0] for heading in ACTIONS])
+STEP_ROW = np.array([STEPS[heading][1] for heading in ACTIONS])
+
+SIDE = 2 * GRID_LIMIT + 1
+CELLS = SIDE * SIDE
+# Room for a snake covering the whole board, rounded up to a power of two
+# so ring buffer positions wrap with a mask.
+RING = 1 << CELLS.bit_length()
+MASK = RING - 1
+START_CELLS = [to_cell(position) for position in STARTING_POSITIONS]
+FOOD_TRIES = 8
+
+
+def to_index(col, row):
+    return (col + GRID_LIMIT) * SIDE + (row + GRID_LIMIT)
+
+
+def to_cells(index):
+    return index // SIDE - GRID_LIMIT, index % SIDE - GRID_LIMIT
+
+
+class SnakeVecEnv:
+    '''n snake games stepped together with NumPy.
+
+    Every game follows the same rules as main.py playing Snake and Food:
+    turn, move, eat (the food moves to a random free cell, or stays put
+    when the board is full, and the snake grows at the tail), then reset
+    the snake on hitting a wall or itself and move the food to a random
+    free cell of the empty board.
+
+    Each snake's body is a ring buffer of cell indexes, head first from
+    head_at. counts holds how many segments are on each cell of each
+    board, as Snake.occupied does, so collisions are one lookup per game.
+    '''
+
+    def __init__(self, n, seed=None):
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+        self.games = np.arange(n)
+        self.ring = np.zeros((n, RING), dtype=np.int16)
+        self.head_at = np.zeros(n, dtype=np.int64)
+        self.length = np.zeros(n, dtype=np.int64)
+        self.counts = np.zeros((n, CELLS), dtype=np.int16)
+        self.direction = np.zeros(n, dtype=np.int64)
+        self.head_col = np.zeros(n, dtype=np.int64)
+        self.head_row = np.zeros(n, dtype=np.int64)
+        self.food = np.zeros(n, dtype=np.int64)
+        self.scores = np.zeros(n, dtype=np.int64)
+        self.high_scores = np.zeros(n, dtype=np.int64)
+        self.ate = np.zeros(n, dtype=bool)
+        self.done = np.zeros(n, dtype=bool)
+        self.steps = 0
+        self.reset_snakes(self.games)
+        self.place_food(self.games)
+
+    def reset_snakes(self, games):
+        '''Snake.reset() for each of games.'''
+        self.counts[games] = 0
+        for i, (col, row) in enumerate(START_CELLS):
+            index = to_index(col, row)
+            self.ring[games, i] = index
+            self.counts[games, index] = 1
+        self.head_at[games] = 0
+        self.length[games] = len(START_CELLS)
+        self.direction[games] = ACTIONS.index(RIGHT)
+        self.head_col[games], self.head_row[games] = START_CELLS[0]
+        self.high_scores[games] = np.maximum(self.high_scores[games], self.scores[games])
+        self.scores[games] = 0
+
+    def place_food(self, games):
+        '''Food.refresh() for each of games.
+
+        Random cells are tried a few times, which almost always finds a
+        free one. Games still without food, on nearly full boards, pick
+        from a list of their free cells.
+        '''
+        for attempt in range(FOOD_TRIES):
+            if not len(games):
+                return
+            cells = self.rng.integers(0, CELLS, size=len(games))
+            free = self.counts[games, cells] == 0
+            self.food[games[free]] = cells[free]
+            games = games[~free]
+        for game in games:
+            free_cells = np.flatnonzero(self.counts[game] == 0)
+            if len(free_cells):
+                self.food[game] = free_cells[self.rng.integers(len(free_cells))]
+
+    def step(self, actions):
+        '''Play one frame of every game. actions holds one action per game.
+
+        Returns (ate, done): which games ate this frame and which hit a
+        wall or themselves and were reset.
+        '''
+        actions = np.asarray(actions)
+        turning = (actions >= 0) & (actions != OPPOSITE[self.direction])
+        self.direction = np.where(turning, actions, self.direction)
+
+        # Snake.move(): the tail cell is vacated before the new head cell
+        # is occupied, so a snake may follow its own tail.
+        games = self.games
+        self.head_col += STEP_COL[self.direction]
+        self.head_row += STEP_ROW[self.direction]
+        tail = self.ring[games, (self.head_at + self.length - 1) & MASK]
+        self.counts[games, tail] -= 1
+        wall = (np.abs(self.head_col) > GRID_LIMIT) | (np.abs(self.head_row) > GRID_LIMIT)
+        head = np.where(wall, 0, to_index(self.head_col, self.head_row))
+        self.head_at = (self.head_at - 1) & MASK
+        self.ring[games, self.head_at] = head
+        self.counts[games, head] += ~wall
+
+        ate = ~wall & (head == self.food)
+        eating = np.flatnonzero(ate)
+        if len(eating):
+            self.scores[eating] += 1
+            # Snake.extend(): a new segment on the tail cell.
+            end = self.head_at[eating] + self.length[eating]
+            tail = self.ring[eating, (end - 1) & MASK]
+            self.ring[eating, end & MASK] = tail
+            self.counts[eating, tail] += 1
+            self.length[eating] += 1
+
+        done = wall | (self.counts[games, head] > 1)
+        dead = np.flatnonzero(done)
+        if len(dead):
+            self.reset_snakes(dead)
+        # Food.refresh() after a meal or a reset, in one go. Growing only
+        # adds a segment on a cell the tail is already on, so the free
+        # cells are the same as when the food was eaten.
+        self.place_food(np.flatnonzero(ate | done))
+        self.ate = ate
+        self.done = done
+        self.steps += self.n
+        return ate, done
+
+    def body(self, game):
+        '''Game's snake as (col, row) cells, head first, like Snake.body.'''
+        at = (self.head_at[game] + np.arange(self.length[game])) & MASK
+        cols, rows = to_cells(self.ring[game, at].astype(np.int64))
+        return list(zip(cols.tolist(), rows.tolist()))
+
+    def food_cell(self, game):
+        col, row = to_cells(int(self.food[game]))
+        return (col, row)
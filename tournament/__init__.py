@@ -0,0 +1,10 @@
+"""Headless tournaments between game-playing agents, across processes.
+
+    python -m tournament crossing cautious rush --games 10000
+    python -m tournament pong tracker lazy --games 1000
+"""
+import os
+
+# Matches are played headless. Setting this before any game module is
+# imported keeps Tk out of the parent and every worker process.
+os.environ["GAME_BACKEND"] = "headless"
@@ -0,0 +1,38 @@
+import argparse
+import sys
+import time
+from tournament.agents import CROSSING_AGENTS, PONG_AGENTS
+from tournament.runner import format_table, run_tournament, summarize
+
+AGENTS = {"crossing": CROSSING_AGENTS, "pong": PONG_AGENTS}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tournament")
+    parser.add_argument("game", choices=sorted(AGENTS))
+    parser.add_argument("agents", nargs="*",
+                        help="agents to play (default: all of the game's agents)")
+    parser.add_argument("--games", type=int, default=1000, help="seeds per agent or pairing")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: one per core)")
+    parser.add_argument("--max-frames", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    known = AGENTS[args.game]
+    agents = args.agents or sorted(known)
+    unknown = set(agents) - set(known)
+    if unknown:
+        parser.error(f"unknown {args.game} agents: " + ", ".join(sorted(unknown))
+                     + " (choose from " + ", ".join(sorted(known)) + ")")
+    seeds = range(args.first_seed, args.first_seed + args.games)
+    started = time.perf_counter()
+    results = run_tournament(args.game, agents, seeds, args.workers, args.max_frames)
+    elapsed = time.perf_counter() - started
+    print(format_table(summarize(args.game, results)))
+    print(f"{len(results)} matches in {elapsed:.1f} s ({len(results) / elapsed:.0f} matches/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Built-in agents.
+
+An agent factory is given the match's random.Random and returns the
+agent, which is then called once before every frame with the objects it
+controls and the ones it can see. Agents play through the same methods
+as the keyboard: Player.go_up/go_dn in turtle crossing, Padel.go_up/go_dn
+in pong.
+"""
+import numpy as np
+from pong.cpu import CpuPlayer
+from turtle_crossing.game_objects.rules import COLLISION_DISTANCE, MOVE_DISTANCE
+
+# How many frames ahead the cautious crossing agent looks for cars.
+LOOKAHEAD_FRAMES = 3
+PONG_DEAD_ZONE = 10
+
+
+def rush(rng):
+    '''Straight up, every frame.'''
+    def play(player, car_manager):
+        player.go_up()
+    return play
+
+
+def cautious(rng):
+    '''Step up when no car will reach the next lane soon, back off when
+    one is about to reach this lane.'''
+    def cars_near(player, car_manager, y):
+        used = car_manager.slots_used
+        ahead = car_manager.car_x[:used] - player.xcor()
+        reach = COLLISION_DISTANCE + LOOKAHEAD_FRAMES * car_manager.car_speed
+        return np.any(car_manager.active[:used]
+                      & (np.abs(car_manager.car_y[:used] - y) < COLLISION_DISTANCE)
+                      & (ahead > -COLLISION_DISTANCE) & (ahead < reach))
+
+    def play(player, car_manager):
+        y = player.ycor()
+        if not cars_near(player, car_manager, y + MOVE_DISTANCE):
+            player.go_up()
+        elif cars_near(player, car_manager, y):
+            player.go_dn()
+    return play
+
+
+def wander(rng):
+    '''Up, down or stay put at random, leaning upwards.'''
+    def play(player, car_manager):
+        roll = rng.random()
+        if roll < 0.5:
+            player.go_up()
+        elif roll < 0.7:
+            player.go_dn()
+    return play
+
+
+def tracker(rng):
+    '''Keep the padel level with the ball.'''
+    def play(padel, ball):
+        if ball.ycor() > padel.ycor() + PONG_DEAD_ZONE:
+            padel.go_up()
+        elif ball.ycor() < padel.ycor() - PONG_DEAD_ZONE:
+            padel.go_dn()
+    return play
+
+
+def lazy(rng):
+    '''A tracker that misses a fifth of its moves.'''
+    follow = tracker(rng)
+
+    def play(padel, ball):
+        if rng.random() >= 0.2:
+            follow(padel, ball)
+    return play
+
+
+def cpu(rng):
+    '''Wait where the ball will reach the padel, see pong.cpu.'''
+    players = {}
+
+    def play(padel, ball):
+        player = players.get(padel)
+        if player is None:
+            player = players[padel] = CpuPlayer(padel)
+        player.play(ball)
+    return play
+
+
+def still(rng):
+    '''Never moves.'''
+    def play(padel, ball):
+        pass
+    return play
+
+
+CROSSING_AGENTS = {"rush": rush, "cautious": cautious, "wander": wander}
+PONG_AGENTS = {"tracker": tracker, "lazy": lazy, "cpu": cpu, "still": still}
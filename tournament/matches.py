@@ -0,0 +1,81 @@
+"""Single headless matches, played with the rules of each game's main.py.
+
+Everything random in a match comes from its seed, so playing the same
+agents on the same seed always gives the same result.
+"""
+import random
+import engine.render as render
+from engine.backend import Screen
+from pong.ball import Ball
+from pong.padel import Padel
+from turtle_crossing.game_objects.car_manager import CarManager
+from turtle_crossing.game_objects.player import Player
+from tournament.agents import CROSSING_AGENTS, PONG_AGENTS
+
+CROSSING_MAX_FRAMES = 3000
+PONG_MAX_FRAMES = 20000
+PONG_POINTS_TO_WIN = 5
+PADEL_POS_R = (350, 0)
+PADEL_POS_L = (-350, 0)
+
+
+def agent_rng(seed):
+    return random.Random(2 * seed + 1)
+
+
+def game_rng(seed):
+    return random.Random(2 * seed)
+
+
+def play_crossing(agent, seed, max_frames=CROSSING_MAX_FRAMES):
+    '''One game of turtle crossing, until the player is hit or max_frames.'''
+    # Drop the previous match's turtles, which the screen and the render
+    # layer keep hold of.
+    Screen().clear()
+    render.reset()
+    play = CROSSING_AGENTS[agent](agent_rng(seed))
+    player = Player()
+    car_manager = CarManager(rng=game_rng(seed))
+    level = 1
+    hit = False
+    frames = 0
+    while frames < max_frames and not hit:
+        play(player, car_manager)
+        car_manager.create_car()
+        car_manager.move_cars()
+        frames += 1
+        hit = car_manager.collides_with(player)
+        if not hit and player.is_at_finishline():
+            player.goto_start()
+            car_manager.level_up()
+            level += 1
+    return {"seed": seed, "agent": agent, "level": level, "frames": frames, "hit": hit}
+
+
+def play_pong(left, right, seed, max_frames=PONG_MAX_FRAMES, points_to_win=PONG_POINTS_TO_WIN):
+    '''One game of pong, first to points_to_win or max_frames.'''
+    Screen().clear()
+    render.reset()
+    rng = agent_rng(seed)
+    play_l = PONG_AGENTS[left](rng)
+    play_r = PONG_AGENTS[right](rng)
+    padel_r = Padel(PADEL_POS_R)
+    padel_l = Padel(PADEL_POS_L)
+    serves = game_rng(seed)
+    ball = Ball()
+    ball.reset(serves)
+    score_l = score_r = 0
+    frames = 0
+    while frames < max_frames and max(score_l, score_r) < points_to_win:
+        play_l(padel_l, ball)
+        play_r(padel_r, ball)
+        ball.move((padel_l, padel_r))
+        frames += 1
+        if ball.xcor() > 400:
+            ball.reset(serves)
+            score_l += 1
+        if ball.xcor() < -400:
+            ball.reset(serves)
+            score_r += 1
+    return {"seed": seed, "left": left, "right": right,
+            "score_l": score_l, "score_r": score_r, "frames": frames}
@@ -0,0 +1,106 @@
+"""Fan matches out over worker processes and sum up the results.
+
+Seeds are handed to the workers in chunks, so each task plays many
+matches and the cost of sending work between processes stays small
+next to the matches themselves.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from engine.stats import mean, percentile
+from tournament.matches import CROSSING_MAX_FRAMES, PONG_MAX_FRAMES, play_crossing, play_pong
+
+GAMES = ("crossing", "pong")
+CHUNKS_PER_WORKER = 4
+
+
+def pairings(agents):
+    '''Every ordered pair of different agents, or an agent against itself.'''
+    if len(agents) == 1:
+        return [(agents[0], agents[0])]
+    return [(left, right) for left in agents for right in agents if left != right]
+
+
+def play_chunk(game, entry, seeds, max_frames):
+    if game == "crossing":
+        return [play_crossing(entry, seed, max_frames) for seed in seeds]
+    left, right = entry
+    return [play_pong(left, right, seed, max_frames) for seed in seeds]
+
+
+def chunked(seeds, size):
+    return [seeds[start:start + size] for start in range(0, len(seeds), size)]
+
+
+def run_tournament(game, agents, seeds, workers=None, max_frames=None):
+    '''Play every agent (pong: every pairing) once on each seed.
+
+    workers=1 plays everything in this process. Results are returned in
+    the same order whatever the number of workers.
+    '''
+    if game not in GAMES:
+        raise ValueError(f"game must be one of {GAMES}, not {game!r}")
+    if max_frames is None:
+        max_frames = CROSSING_MAX_FRAMES if game == "crossing" else PONG_MAX_FRAMES
+    entries = agents if game == "crossing" else pairings(agents)
+    workers = workers or os.cpu_count() or 1
+    size = max(1, math.ceil(len(seeds) / (workers * CHUNKS_PER_WORKER)))
+    tasks = [(entry, chunk) for entry in entries for chunk in chunked(list(seeds), size)]
+    if workers == 1:
+        chunks = [play_chunk(game, entry, chunk, max_frames) for entry, chunk in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(play_chunk, game, entry, chunk, max_frames)
+                       for entry, chunk in tasks]
+            chunks = [future.result() for future in futures]
+    return [result for chunk in chunks for result in chunk]
+
+
+def summarize(game, results):
+    '''One row per agent (pong: per pairing), as a dict of column -> value.'''
+    rows = {}
+    for result in results:
+        key = result["agent"] if game == "crossing" else (result["left"], result["right"])
+        rows.setdefault(key, []).append(result)
+    table = []
+    for key, matches in rows.items():
+        if game == "crossing":
+            levels = [match["level"] for match in matches]
+            table.append({
+                "agent": key,
+                "games": len(matches),
+                "mean level": mean(levels),
+                "p50 level": percentile(levels, 50),
+                "max level": max(levels),
+                "mean frames": mean([match["frames"] for match in matches]),
+            })
+        else:
+            table.append({
+                "left": key[0],
+                "right": key[1],
+                "games": len(matches),
+                "left wins": sum(match["score_l"] > match["score_r"] for match in matches),
+                "right wins": sum(match["score_r"] > match["score_l"] for match in matches),
+                "mean points": mean([match["score_l"] + match["score_r"] for match in matches]),
+                "mean frames": mean([match["frames"] for match in matches]),
+            })
+    return table
+
+
+def format_table(rows):
+    if not rows:
+        return ""
+    columns = list(rows[0])
+    cells = [[format_cell(row[column]) for column in columns] for row in rows]
+    widths = [max(len(column), *(len(line[i]) for line in cells)) for i, column in enumerate(columns)]
+    lines = ["  ".join(column.rjust(width) for column, width in zip(columns, widths)),
+             "-" * (sum(widths) + 2 * (len(widths) - 1))]
+    for line in cells:
+        lines.append("  ".join(cell.rjust(width) for cell, width in zip(line, widths)))
+    return "\n".join(lines)
+
+
+def format_cell(value):
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
@@ -0,0 +1,90 @@
+"""
+TESTS FOR tournament/
+
+Matches must be reproducible from their seed, and running them across
+worker processes must give exactly the results of running them in one.
+"""
+
+import subprocess
+import sys
+import pathlib
+from tournament.matches import play_crossing, play_pong
+from tournament.runner import format_table, pairings, run_tournament, summarize
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+
+
+def test_crossing_match_is_reproducible():
+    first = play_crossing("cautious", seed=4, max_frames=500)
+    second = play_crossing("cautious", seed=4, max_frames=500)
+
+    assert first == second
+    assert first["frames"] <= 500
+
+
+def test_crossing_agents_score_levels():
+    rush = play_crossing("rush", seed=1)
+
+    assert rush["level"] >= 1
+    assert rush["hit"] or rush["frames"] == 3000
+
+
+def test_pong_match_plays_to_five():
+    result = play_pong("tracker", "still", seed=0)
+
+    assert (result["score_l"], result["score_r"]) == (5, 0)
+
+
+def test_pong_seeds_give_different_matches():
+    """The serves come from the seed, so even agents that never roll
+    dice play a different match on every seed."""
+    results = [play_pong("tracker", "tracker", seed=seed) for seed in range(5)]
+
+    assert play_pong("tracker", "tracker", seed=3) == results[3]
+    assert len({(result["score_l"], result["score_r"], result["frames"])
+                for result in results}) > 1
+
+
+def test_matches_do_not_make_turtles():
+    """Game objects only get a Turtle when a view is attached."""
+    from engine.backend import Screen
+    play_pong("still", "still", seed=0, max_frames=10)
+    play_crossing("rush", seed=1, max_frames=10)
+
+    assert len(Screen().turtles()) == 0
+
+
+def test_pairings():
+    assert pairings(["a"]) == [("a", "a")]
+    assert pairings(["a", "b"]) == [("a", "b"), ("b", "a")]
+
+
+def test_workers_give_the_same_results():
+    seeds = range(6)
+
+    alone = run_tournament("crossing", ["rush", "wander"], seeds, workers=1, max_frames=300)
+    shared = run_tournament("crossing", ["rush", "wander"], seeds, workers=2, max_frames=300)
+
+    assert alone == shared
+    assert [result["seed"] for result in alone] == list(seeds) * 2
+
+
+def test_summary_table():
+    results = run_tournament("pong", ["tracker", "still"], range(2), workers=1)
+
+    rows = summarize("pong", results)
+    table = format_table(rows)
+
+    assert [(row["left"], row["right"], row["left wins"]) for row in rows] == [
+        ("tracker", "still", 2), ("still", "tracker", 0)]
+    assert "left wins" in table.splitlines()[0]
+
+
+def test_workers_never_import_tk():
+    code = ("import sys, tournament.runner; "
+            "print('tkinter' in sys.modules or 'turtle' in sys.modules)")
+
+    output = subprocess.run([sys.executable, "-c", code], cwd=str(ROOT),
+                            stdout=subprocess.PIPE, check=True).stdout
+
+    assert output.strip() == b"False"
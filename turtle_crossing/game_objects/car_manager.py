@@ -1,41 +1,43 @@
-from turtle import Turtle
-import random
+import engine.backend as backend
+from engine.render import track
+import numpy as np
+from turtle_crossing.game_objects.rules import (
+    Traffic, COLORS, STARTING_MOVE_DISTANCE, MOVE_INCREMENT, SPAWN_X, OFFSCREEN_X,
+    CAR_POOL_CAPACITY, COLLISION_DISTANCE, SPAWN_RATES,
+)
 
-COLORS = ["red", "orange", "yellow", "green", "blue", "purple"]
-STARTING_MOVE_DISTANCE = 5
-MOVE_INCREMENT = 10
 
+class CarManager(Traffic):
+    '''Traffic drawn with one Turtle per car slot, synced in draw().'''
 
-class CarManager(Turtle):
-    def __init__(self):
-        self.all_cars = []
-        self.car_speed = STARTING_MOVE_DISTANCE
-        
-    def create_car(self):
-        random_chance = random.randint(1,5)
-        if random_chance == 3:
-            new_car = Turtle("square")
-            new_car.shapesize(stretch_wid=1, stretch_len=2)
-            new_car.color(random.choice(COLORS))
-            new_car.penup()
-            new_car.goto(300, random.randint(-250,250))
-            self.all_cars.append(new_car)
+    def __init__(self, capacity=CAR_POOL_CAPACITY, rng=None, spawn_rates=SPAWN_RATES):
+        super().__init__(capacity, rng, spawn_rates)
+        self.sprites = []
 
-    def move_cars(self):
-        for car in self.all_cars:
-            car.backward(self.car_speed)
-    
-    def level_up(self):
-        self.car_speed += MOVE_INCREMENT
-        
-    
-        
-        # super().__init__()
-        # self.color(random.choice(COLORS))
-        # self.shape("square")
-        # self.shapesize(stretch_wid=1, stretch_len=2)
-        # self.penup()
-        # self.x_move = MOVE_INCREMENT
+    def draw(self):
+        '''Copy the arrays onto the car Turtles.'''
+        used = self.slots_used
+        while len(self.sprites) < used:
+            self.sprites.append(None)
+        for slot in np.flatnonzero(self.active[:used] | self.shown[:used]):
+            car = self.sprites[slot]
+            if car is None:
+                car = self.sprites[slot] = new_car_sprite()
+            if not self.active[slot]:
+                car.hideturtle()
+                self.shown[slot] = False
+                continue
+            if self.repaint[slot]:
+                car.color(COLORS[self.car_color[slot]])
+                car.showturtle()
+                self.repaint[slot] = False
+                self.shown[slot] = True
+            car.goto(float(self.car_x[slot]), float(self.car_y[slot]))
 
-    
 
+def new_car_sprite():
+    new_car = backend.Turtle("square")
+    new_car.shapesize(stretch_wid=1, stretch_len=2)
+    new_car.penup()
+    track(new_car)
+    return new_car
@@ -1,11 +1,10 @@
-from turtle import Turtle
+from engine.entity import Entity
+from turtle_crossing.game_objects.rules import STARTING_POSITION, MOVE_DISTANCE, FINISH_LINE_Y
 
-STARTING_POSITION = (0, -280)
-MOVE_DISTANCE = 10
-FINISH_LINE_Y = 280
 
-
-class Player(Turtle):
+class Player(Entity):
+    # No __slots__: tests stand mocks in for its methods. Its fields all
+    # live in Entity's slots, so the __dict__ is never made otherwise.
     def __init__(self):
         super().__init__()
         self.shape("turtle")
@@ -0,0 +1,201 @@
+"""The rules of turtle crossing, without any drawing.
+
+Nothing here imports turtle, so bots, tests and worker processes can use
+the game logic without loading Tk.
+"""
+import heapq
+import math
+import random
+import numpy as np
+
+# Player
+STARTING_POSITION = (0, -280)
+MOVE_DISTANCE = 10
+FINISH_LINE_Y = 280
+
+# Cars
+COLORS = ["red", "orange", "yellow", "green", "blue", "purple"]
+STARTING_MOVE_DISTANCE = 5
+MOVE_INCREMENT = 10
+SPAWN_X = 300
+OFFSCREEN_X = -320
+CAR_POOL_CAPACITY = 40
+COLLISION_DISTANCE = 20
+
+# Spawning
+LANES = tuple(range(-250, 251, 25))
+# Cars per frame over all the lanes, one entry per level; levels past the
+# end use the last one.
+SPAWN_RATES = (0.2,)
+# Distance between the centres of two cars spawned in a lane one after
+# the other. Cars are 40 long, so that leaves at least 20 of road between
+# the back of one and the front of the next.
+MIN_CAR_GAP = 60
+TIMETABLE_CHUNK = 100
+
+
+class Timetable:
+    '''When and in which lane cars appear during one level.
+
+    Each lane gets cars at random intervals averaging len(lanes) / rate
+    frames, but never less than min_gap frames apart, so cars in a lane,
+    which all drive at the same speed, never overlap. The first car of a
+    lane also waits until the lane's last car from the level before,
+    which drove part of the way at the old speed, is MIN_CAR_GAP ahead;
+    travelled holds how far each of those cars had driven at start_frame.
+    The timetable is planned TIMETABLE_CHUNK frames at a time from its own
+    seeded Random and kept in a heap of (frame, lane, color index).
+    '''
+
+    def __init__(self, seed, level, start_frame, car_speed, rate, lanes=LANES,
+                 travelled=None):
+        self.rng = random.Random(f"{seed}:{level}")
+        self.seed = seed
+        self.level = level
+        self.lanes = lanes
+        self.start_frame = start_frame
+        self.car_speed = car_speed
+        self.min_gap = math.ceil(MIN_CAR_GAP / car_speed)
+        self.mean_gap = max(len(lanes) / rate, self.min_gap)
+        self.heap = []
+        self.travelled = list(travelled) if travelled else [MIN_CAR_GAP] * len(lanes)
+        # Frame of the last car spawned in each lane during this level.
+        self.last_spawns = [None] * len(lanes)
+        self.lane_next = [start_frame + max(self.extra_gap(self.mean_gap), self.catch_up(distance))
+                          for distance in self.travelled]
+        self.planned_until = start_frame
+
+    def catch_up(self, travelled):
+        '''Frames until a car that has driven travelled is MIN_CAR_GAP ahead.'''
+        return max(0, math.ceil((MIN_CAR_GAP - travelled) / self.car_speed))
+
+    def extra_gap(self, mean):
+        return int(self.rng.expovariate(1 / mean)) if mean > 0 else 0
+
+    def plan(self):
+        '''Add the next TIMETABLE_CHUNK frames to the heap.'''
+        end = self.planned_until + TIMETABLE_CHUNK
+        extra = self.mean_gap - self.min_gap
+        for lane, frame in enumerate(self.lane_next):
+            while frame < end:
+                heapq.heappush(self.heap, (frame, lane, self.rng.randrange(len(COLORS))))
+                frame += self.min_gap + self.extra_gap(extra)
+            self.lane_next[lane] = frame
+        self.planned_until = end
+
+    def pop_due(self, frame):
+        '''[(y, color index), ...] of the cars due by frame.'''
+        while frame >= self.planned_until:
+            self.plan()
+        heap = self.heap
+        if not heap or heap[0][0] > frame:
+            return ()
+        due = []
+        while heap and heap[0][0] <= frame:
+            spawn_frame, lane, color_index = heapq.heappop(heap)
+            self.last_spawns[lane] = spawn_frame
+            due.append((self.lanes[lane], color_index))
+        return due
+
+    def next_level(self, start_frame, car_speed, rate):
+        '''The timetable of the level after this one, keeping the gap to
+        the last car spawned in each lane.'''
+        return Timetable(self.seed, self.level + 1, start_frame, car_speed, rate,
+                         self.lanes, self.travelled_by(start_frame))
+
+    def travelled_by(self, frame):
+        '''How far the last car spawned in each lane has driven by frame.'''
+        return [carried + (frame - self.start_frame) * self.car_speed if last is None
+                else (frame - last) * self.car_speed
+                for last, carried in zip(self.last_spawns, self.travelled)]
+
+
+def spawn_rate(level, rates=SPAWN_RATES):
+    return rates[min(level, len(rates)) - 1]
+
+
+class Traffic:
+    '''Car state lives in NumPy arrays, one slot per car.
+
+    car_x, car_y, car_color and active are parallel arrays. Slots freed by
+    cars leaving the screen are handed out again by spawn_car, so the
+    arrays only grow when more cars are on screen at once than ever before.
+    repaint and shown are kept for whatever draws the cars. Cars come in
+    LANES as the level's Timetable says; spawn_rates sets how many per
+    frame at each level.
+    '''
+
+    def __init__(self, capacity=CAR_POOL_CAPACITY, rng=None, spawn_rates=SPAWN_RATES):
+        self.rng = rng if rng is not None else random.Random()
+        self.car_x = np.zeros(capacity)
+        self.car_y = np.zeros(capacity)
+        self.car_color = np.zeros(capacity, dtype=np.int8)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.repaint = np.zeros(capacity, dtype=bool)
+        self.shown = np.zeros(capacity, dtype=bool)
+        self.free_slots = []
+        self.slots_used = 0
+        self.live_cars = 0
+        self.pool_hits = 0
+        self.pool_misses = 0
+        self.car_speed = STARTING_MOVE_DISTANCE
+        self.spawn_rates = spawn_rates
+        self.level = 1
+        self.frame = 0
+        self.timetable = Timetable(self.rng.getrandbits(32), self.level, self.frame,
+                                   self.car_speed, spawn_rate(self.level, spawn_rates))
+
+    def create_car(self):
+        '''Spawn the cars the timetable has for this frame. Called once a frame.'''
+        for y, color_index in self.timetable.pop_due(self.frame):
+            self.spawn_car(color_index, y)
+        self.frame += 1
+
+    def spawn_car(self, color_index, y):
+        slot = self.acquire_slot()
+        self.car_x[slot] = SPAWN_X
+        self.car_y[slot] = y
+        self.car_color[slot] = color_index
+        self.active[slot] = True
+        self.repaint[slot] = True
+        self.live_cars += 1
+        return slot
+
+    def acquire_slot(self):
+        '''Reuse the slot of a car that left the screen, or open a new one.'''
+        if self.free_slots:
+            self.pool_hits += 1
+            return self.free_slots.pop()
+        self.pool_misses += 1
+        if self.slots_used == len(self.car_x):
+            self.grow()
+        self.slots_used += 1
+        return self.slots_used - 1
+
+    def grow(self):
+        for name in ("car_x", "car_y", "car_color", "active", "repaint", "shown"):
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate([array, np.zeros_like(array)]))
+
+    def move_cars(self):
+        used = self.slots_used
+        self.car_x[:used] -= self.car_speed
+        gone = np.flatnonzero(self.active[:used] & (self.car_x[:used] < OFFSCREEN_X))
+        if len(gone):
+            self.active[gone] = False
+            self.free_slots.extend(gone.tolist())
+            self.live_cars -= len(gone)
+
+    def collides_with(self, player):
+        '''Same rule as car.distance(player) < 20, for every car at once.'''
+        used = self.slots_used
+        dx = self.car_x[:used] - player.xcor()
+        dy = self.car_y[:used] - player.ycor()
+        close = np.sqrt(dx * dx + dy * dy) < COLLISION_DISTANCE
+        return bool((close & self.active[:used]).any())
+
+    def level_up(self):
+        self.car_speed += MOVE_INCREMENT
+        self.level += 1
+        self.timetable = self.timetable.next_level(
+            self.frame, self.car_speed, spawn_rate(self.level, self.spawn_rates))
@@ -1,26 +1,32 @@
-from turtle import Turtle
+from engine.entity import Entity
+from engine.text import Label
 
 FONT = ("Courier", 24, "normal")
 
 
-class Scoreboard(Turtle):
+class Scoreboard(Entity):
+    __slots__ = ("level", "label", "game_over_label")
+
     def __init__(self):
         super().__init__()
         self.color("black")
         self.penup()
         self.hideturtle()
         self.level = 1
+        self.label = Label(None, (-280, 260), align="left", font=FONT)
+        self.game_over_label = Label(None, (0, 0), font=FONT)
         self.update_scoreboard()
 
+    def view_attached(self, view):
+        self.label.attach(view)
+        self.game_over_label.attach(view)
+
     def update_scoreboard(self):
-        self.clear()
-        self.goto(-280, 260)
-        self.write(f"Level: {self.level}", align="left", font=FONT)
+        self.label.set(f"Level: {self.level}")
 
     def increase_level(self):
         self.level += 1
         self.update_scoreboard()
 
     def game_over(self):
-        self.goto(0, 0)
-        self.write("GAME OVER", align="center", font=FONT)
\ No newline at end of file
+        self.game_over_label.set("GAME OVER")
@@ -1,35 +1,51 @@
-import time
-from turtle import Screen
-import game_objects.player as player
-import game_objects.car_manager as car_manager 
-import game_objects.scoreboard as scoreboard 
+import pathlib
+import sys
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+from engine.backend import Screen, clock
+from engine.loop import GameLoop
+import engine.entity as entity
+import engine.profiler as profiling
+import engine.render as render
+import engine.replay as replay
+import engine.text as text
+import turtle_crossing.game_objects.player as player
+import turtle_crossing.game_objects.car_manager as car_manager
+import turtle_crossing.game_objects.scoreboard as scoreboard
 
 screen = Screen()
 screen.setup(width=600, height=600)
 screen.tracer(0)
 
+session = replay.from_argv(sys.argv)
 turtle_player = player.Player()
-car_manager = car_manager.CarManager()
+turtle_player.attach_view()
+car_manager = car_manager.CarManager(rng=session.rng())
 score_board = scoreboard.Scoreboard()
+score_board.attach_view()
 
 
-screen.listen()
-screen.onkey(turtle_player.go_up, "Up")
-screen.onkey(turtle_player.go_dn, "Down")
+profiler = profiling.from_argv(sys.argv)
+if profiler is not None:
+    profiler.instrument("turtle_player", turtle_player, "go_up", "go_dn",
+                        "is_at_finishline", "goto_start")
+    profiler.instrument("car_manager", car_manager, "create_car", "move_cars",
+                        "collides_with", "level_up", "draw")
+    profiler.instrument("score_board", score_board, "increase_level", "game_over")
+    profiler.instrument("text", text, "flush")
+    profiler.instrument("render", render, "flush")
 
-game_is_on = True
-while game_is_on:
-    time.sleep(0.1)
+screen.listen()
+session.onkey(screen, turtle_player.go_up, "Up")
+session.onkey(screen, turtle_player.go_dn, "Down")
 
-    screen.update()
+def play_frame():
     car_manager.create_car()
     car_manager.move_cars()
 
     '''Detect collisions'''
-    for car in car_manager.all_cars:
-        if car.distance(turtle_player) < 20:
-            game_is_on = False
-            score_board.game_over()
+    if car_manager.collides_with(turtle_player):
+        game_loop.stop()
+        score_board.game_over()
 
     '''Detect successful crossing'''
     if turtle_player.is_at_finishline():
@@ -38,4 +54,19 @@ while game_is_on:
         score_board.increase_level()
 
 
-screen.exitonclick()
\ No newline at end of file
+def draw_frame():
+    car_manager.draw()
+    entity.flush()
+    text.flush()
+    render.flush(screen)
+
+
+game_loop = GameLoop(screen, session.wrap(play_frame), draw_frame, step=0.1, clock=clock,
+                     profiler=profiler)
+session.attach(game_loop)
+game_loop.start()
+screen.exitonclick()
+session.finish()
+print(game_loop.report())
+if profiler is not None:
+    print(profiler.report())
@@ -0,0 +1,396 @@
+"""
+TESTS FOR car_manager.py
+
+CarManager keeps every car's x, y, color and active flag in NumPy arrays.
+Slots of cars that leave the screen are reused, cars move with a single
+array subtraction and collisions are one vectorized distance test.
+Turtles are only created in draw(), so most tests never need one.
+"""
+
+# ============================================================================
+# IMPORTS
+# ============================================================================
+
+import random
+from unittest.mock import patch
+from turtle_crossing.game_objects.car_manager import (
+    CarManager, COLORS, OFFSCREEN_X, SPAWN_X, STARTING_MOVE_DISTANCE,
+    COLLISION_DISTANCE,
+)
+from turtle_crossing.game_objects.rules import (
+    LANES, MIN_CAR_GAP, SPAWN_RATES, TIMETABLE_CHUNK,
+)
+
+
+# ============================================================================
+# FAKES
+# ============================================================================
+"""
+FakeTurtle stands in for turtle.Turtle: it remembers its position,
+color and visibility, which is all CarManager.draw() touches.
+"""
+
+class FakeTurtle:
+    created = 0
+
+    def __init__(self, shape=None):
+        FakeTurtle.created += 1
+        self.x = 0
+        self.y = 0
+        self.visible = True
+        self.car_color = None
+
+    def shapesize(self, stretch_wid, stretch_len):
+        pass
+
+    def penup(self):
+        pass
+
+    def color(self, color):
+        self.car_color = color
+
+    def goto(self, x, y):
+        self.x, self.y = x, y
+
+    def xcor(self):
+        return self.x
+
+    def ycor(self):
+        return self.y
+
+    def distance(self, other):
+        return ((self.x - other.x) ** 2 + (self.y - other.y) ** 2) ** 0.5
+
+    def hideturtle(self):
+        self.visible = False
+
+    def showturtle(self):
+        self.visible = True
+
+
+class FakeCar(FakeTurtle):
+    """A car read back out of the arrays, for the brute-force check."""
+    def __init__(self, x, y):
+        super().__init__()
+        self.x, self.y = x, y
+
+
+def make_manager(**kwargs):
+    FakeTurtle.created = 0
+    return CarManager(**kwargs)
+
+
+def cars_on_screen(manager):
+    return [FakeCar(manager.car_x[slot], manager.car_y[slot])
+            for slot in range(manager.slots_used) if manager.active[slot]]
+
+
+# ============================================================================
+# SPAWNING AND MOVING
+# ============================================================================
+
+def test_spawn_car_starts_on_the_right():
+    manager = make_manager()
+
+    slot = manager.spawn_car(2, 100)
+
+    assert (manager.car_x[slot], manager.car_y[slot]) == (SPAWN_X, 100)
+    assert manager.car_color[slot] == 2
+    assert manager.active[slot]
+    assert manager.live_cars == 1
+    assert manager.pool_misses == 1
+
+
+def test_move_cars_moves_every_car_left():
+    manager = make_manager()
+    first = manager.spawn_car(0, 0)
+    second = manager.spawn_car(1, 50)
+
+    manager.move_cars()
+    manager.level_up()
+    manager.move_cars()
+
+    expected_x = SPAWN_X - STARTING_MOVE_DISTANCE - manager.car_speed
+    assert manager.car_x[first] == expected_x
+    assert manager.car_x[second] == expected_x
+
+
+def test_cars_past_the_edge_free_their_slot():
+    manager = make_manager()
+    slot = manager.spawn_car(0, 0)
+    manager.car_x[slot] = OFFSCREEN_X + STARTING_MOVE_DISTANCE - 1
+
+    manager.move_cars()
+
+    assert not manager.active[slot]
+    assert manager.free_slots == [slot]
+    assert manager.live_cars == 0
+
+
+def test_spawn_reuses_free_slot():
+    manager = make_manager()
+    slot = manager.spawn_car(0, 0)
+    manager.car_x[slot] = OFFSCREEN_X - 1
+    manager.move_cars()
+
+    reused = manager.spawn_car(4, 50)
+
+    assert reused == slot
+    assert manager.car_x[reused] == SPAWN_X
+    assert manager.pool_hits == 1
+    assert manager.slots_used == 1
+
+
+def test_slot_count_stays_flat_in_a_long_session():
+    """
+    Spawn a car every frame for 5000 frames. Slots are reused, so only
+    as many are ever opened as there are cars on screen at once.
+    """
+    manager = make_manager()
+
+    for frame in range(5000):
+        manager.spawn_car(0, 0)
+        manager.move_cars()
+
+    on_screen = (SPAWN_X - OFFSCREEN_X) // STARTING_MOVE_DISTANCE + 1
+    assert manager.live_cars <= on_screen
+    assert manager.slots_used <= on_screen + 1
+    assert manager.pool_hits + manager.pool_misses == 5000
+
+
+def test_arrays_grow_when_full():
+    manager = make_manager(capacity=2)
+
+    slots = [manager.spawn_car(0, y) for y in range(5)]
+
+    assert slots == [0, 1, 2, 3, 4]
+    assert len(manager.car_x) >= 5
+    assert list(manager.car_y[:5]) == [0, 1, 2, 3, 4]
+
+
+def test_thousands_of_cars_headless():
+    """No Turtle is created unless draw() is called."""
+    manager = make_manager(capacity=4096)
+
+    with patch('engine.backend.Turtle', FakeTurtle):
+        for frame in range(200):
+            for y in range(-250, 250, 25):
+                manager.spawn_car(0, y)
+            manager.move_cars()
+
+    assert manager.live_cars > 2000
+    assert FakeTurtle.created == 0
+
+
+# ============================================================================
+# TIMETABLE
+# ============================================================================
+"""
+create_car() spawns whatever the level's Timetable has due, in LANES,
+with at least MIN_CAR_GAP between the centres of cars in a lane.
+"""
+
+def spawns(manager, frames, level_every=None):
+    '''[(frame, y, car_speed), ...] of the cars create_car spawns.'''
+    spawned = []
+    for frame in range(frames):
+        if level_every and frame and frame % level_every == 0:
+            manager.level_up()
+        manager.create_car()
+        # Only this frame's cars haven't moved yet.
+        for slot in range(manager.slots_used):
+            if manager.active[slot] and manager.car_x[slot] == SPAWN_X:
+                spawned.append((frame, manager.car_y[slot], manager.car_speed))
+        manager.move_cars()
+    return spawned
+
+
+def lane_gaps(manager, frames, level_frames=()):
+    '''[(frame, y, gap), ...] where gap is how far ahead the last car in
+    lane y was when the next one spawned, measured from car_x.'''
+    gaps = []
+    last_slot = {}
+    for frame in range(frames):
+        if frame in level_frames:
+            manager.level_up()
+        manager.create_car()
+        for slot in range(manager.slots_used):
+            if manager.active[slot] and manager.car_x[slot] == SPAWN_X:
+                y = manager.car_y[slot]
+                ahead = last_slot.get(y)
+                if ahead is not None and ahead != slot and manager.active[ahead] \
+                        and manager.car_y[ahead] == y:
+                    gaps.append((frame, y, SPAWN_X - manager.car_x[ahead]))
+                last_slot[y] = slot
+        manager.move_cars()
+    return gaps
+
+
+def test_cars_spawn_in_lanes_with_a_gap():
+    manager = make_manager(rng=random.Random(5))
+
+    gaps = lane_gaps(manager, 3000, level_frames=range(500, 3000, 500))
+
+    assert gaps
+    for frame, y, gap in gaps:
+        assert y in LANES
+        assert gap >= MIN_CAR_GAP
+
+
+def test_level_up_right_after_a_spawn_keeps_the_gap():
+    # Lane -75 gets a car at frame 33, four frames before the level
+    # changes and the cars get three times faster.
+    manager = make_manager(rng=random.Random(91))
+    gaps = lane_gaps(manager, 60, level_frames=(37,))
+    assert all(gap >= MIN_CAR_GAP for frame, y, gap in gaps)
+
+    for seed in range(50):
+        manager = make_manager(rng=random.Random(seed))
+        gaps = lane_gaps(manager, 200, level_frames=(30, 31, 60, 100))
+        assert all(gap >= MIN_CAR_GAP for frame, y, gap in gaps)
+
+
+def test_spawn_rate_matches_the_level():
+    slow = make_manager(rng=random.Random(0), spawn_rates=(0.1,))
+    busy = make_manager(rng=random.Random(0), spawn_rates=(0.1, 0.4))
+    busy.level_up()
+    slow.level_up()
+
+    slow_cars = len(spawns(slow, 5000))
+    busy_cars = len(spawns(busy, 5000))
+
+    assert 400 < slow_cars < 600
+    assert 1800 < busy_cars < 2200
+
+
+def test_default_spawn_rate():
+    manager = make_manager(rng=random.Random(0))
+    manager.level_up()
+
+    cars = len(spawns(manager, 5000))
+
+    assert 0.8 * 5000 * SPAWN_RATES[0] < cars < 1.2 * 5000 * SPAWN_RATES[0]
+
+
+def test_timetable_is_seeded():
+    first = spawns(make_manager(rng=random.Random(8)), 1000, level_every=300)
+    second = spawns(make_manager(rng=random.Random(8)), 1000, level_every=300)
+    other = spawns(make_manager(rng=random.Random(9)), 1000, level_every=300)
+
+    assert first == second
+    assert first != other
+
+
+def test_timetable_is_planned_a_chunk_at_a_time():
+    manager = make_manager(rng=random.Random(2))
+    # create_car never draws from the game's random numbers.
+    manager.rng = None
+
+    for frame in range(450):
+        manager.create_car()
+
+    timetable = manager.timetable
+    assert timetable.planned_until == 5 * TIMETABLE_CHUNK
+    assert all(entry[0] >= 450 for entry in timetable.heap)
+    assert all(entry[0] < 5 * TIMETABLE_CHUNK for entry in timetable.heap)
+
+
+# ============================================================================
+# COLLISIONS
+# ============================================================================
+"""
+collides_with() tests every car at once with NumPy.
+It must give exactly the same answer as the old loop in main.py:
+
+    for car in car_manager.all_cars:
+        if car.distance(turtle_player) < 20:
+"""
+
+def brute_force_collision(manager, player):
+    return any(car.distance(player) < COLLISION_DISTANCE
+               for car in cars_on_screen(manager))
+
+
+def test_collides_with_car_in_same_lane():
+    manager = make_manager()
+    manager.spawn_car(0, 0)
+    player = FakeCar(SPAWN_X - 10, 5)
+
+    assert manager.collides_with(player) is True
+
+
+def test_no_collision_exactly_at_the_limit():
+    manager = make_manager()
+    manager.spawn_car(0, 0)
+    player = FakeCar(SPAWN_X, COLLISION_DISTANCE)   # distance == 20, not < 20
+
+    assert manager.collides_with(player) is False
+
+
+def test_cars_that_left_do_not_collide():
+    manager = make_manager()
+    slot = manager.spawn_car(0, 0)
+    manager.car_x[slot] = OFFSCREEN_X - 1
+    manager.move_cars()
+    player = FakeCar(manager.car_x[slot], 0)
+
+    assert manager.collides_with(player) is False
+
+
+def test_collides_with_matches_distance_rule():
+    """
+    Play 2000 random frames and compare against the brute-force loop
+    for a player standing at many different places.
+    """
+    rng = random.Random(1234)
+    manager = make_manager()
+    player = FakeCar(0, 0)
+
+    for frame in range(2000):
+        if rng.randint(1, 5) == 3:
+            manager.spawn_car(0, rng.randint(-250, 250))
+        manager.move_cars()
+        player.goto(rng.uniform(-300, 300), rng.uniform(-300, 300))
+
+        assert manager.collides_with(player) == brute_force_collision(manager, player)
+
+        for car in cars_on_screen(manager)[:3]:
+            player.goto(car.x + rng.uniform(-25, 25), car.y + rng.uniform(-25, 25))
+            assert manager.collides_with(player) == brute_force_collision(manager, player)
+
+
+# ============================================================================
+# DRAWING
+# ============================================================================
+
+@patch('engine.backend.Turtle', FakeTurtle)
+def test_draw_syncs_turtles_from_arrays():
+    manager = make_manager()
+    slot = manager.spawn_car(3, 40)
+    manager.move_cars()
+
+    manager.draw()
+
+    car = manager.sprites[slot]
+    assert (car.x, car.y) == (SPAWN_X - STARTING_MOVE_DISTANCE, 40)
+    assert car.car_color == COLORS[3]
+    assert car.visible is True
+
+
+@patch('engine.backend.Turtle', FakeTurtle)
+def test_draw_hides_cars_that_left_and_reuses_their_turtle():
+    manager = make_manager()
+    slot = manager.spawn_car(0, 0)
+    manager.draw()
+    car = manager.sprites[slot]
+
+    manager.car_x[slot] = OFFSCREEN_X - 1
+    manager.move_cars()
+    manager.draw()
+    assert car.visible is False
+
+    manager.spawn_car(5, 10)
+    manager.draw()
+    assert car.visible is True
+    assert car.car_color == COLORS[5]
+    assert FakeTurtle.created == 1